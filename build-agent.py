@@ -13,65 +13,208 @@ Usage:
     ./build-agent.py --all                     # Build all agents
     ./build-agent.py --output-dir <path>       # Specify output directory
     ./build-agent.py --validate                # Validate all agents
+    ./build-agent.py --all --incremental       # Rebuild only changed agents
+    ./build-agent.py --all --jobs 8            # Build with 8 worker processes
+    ./build-agent.py --watch                   # Rebuild affected agents on change
+    ./build-agent.py --all --dedup             # Store shared base blocks once by hash
+    ./build-agent.py --all --token-report      # Print heaviest agents/sections by tokens
+    ./build-agent.py --all --compress          # Compress outputs, report byte/token savings
+    ./build-agent.py --all --dedupe-bases      # Drop base rules repeated by a child base
+    ./build-agent.py --all --skill-summaries   # Add skill entry points, full skills on demand
 
 Examples:
     ./build-agent.py agents/engineer/frontend/react-engineer.md
     ./build-agent.py --all --output-dir dist/agents
+    ./build-agent.py --all --incremental
     ./build-agent.py --validate
 """
 
 import argparse
+import hashlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Set
-import re
+from typing import Any, List, Optional, Set
 import json
 
-
-CURRENT_SCHEMA_VERSION = "1.3.0"
+from claude_mpm_agents.agent_index import INDEX_FILENAME, build_index_entry, write_index
+from claude_mpm_agents.blocks import (
+    BlockStore,
+    block_ref,
+    block_relative_path,
+    find_block_refs,
+    reassemble,
+)
+from claude_mpm_agents.build_manifest import (
+    MANIFEST_FILENAME,
+    build_manifest_entry,
+    write_manifest,
+)
+from claude_mpm_agents.compress import (
+    CompressionStats,
+    Removal,
+    compress_markdown,
+    compression_stats,
+    dedupe_hierarchy,
+)
+from claude_mpm_agents.frontmatter import scan_frontmatter, split_frontmatter
+from claude_mpm_agents.inheritance import BASE_AGENT_FILENAME, BaseAgent, BaseAgentResolver
+from claude_mpm_agents.output import OutputWriter, write_if_changed
+from claude_mpm_agents.schema import CURRENT_SCHEMA_VERSION, ValidationIssue, validate_frontmatter
+from claude_mpm_agents.skill_bundle import SkillBundle, bundle_skills
+from claude_mpm_agents.skills import SkillIndex, SkillLoader, default_skills_dir
+from claude_mpm_agents.skills_manifest import (
+    SkillManifestIndex,
+    default_manifest_path,
+    load_skill_manifest,
+)
+from claude_mpm_agents.tokens import (
+    DEFAULT_BUDGET_RATIO,
+    TOKEN_REPORT_FILENAME,
+    TOKENIZERS,
+    AgentTokenUsage,
+    agent_budget,
+    build_token_report,
+    format_token_report,
+    get_token_counter,
+    measure_sections,
+)
+from claude_mpm_agents.watch import create_watcher
+from claude_mpm_agents.yaml_loader import parse_frontmatter
+
+
+# Bump when the build output format changes so cached entries are invalidated
+BUILD_CACHE_VERSION = 4
+BUILD_CACHE_FILENAME = ".build-cache.json"
+
+
+@dataclass(frozen=True)
+class BuildOptions:
+    """Options that change the content a build writes (part of the build cache key)."""
+
+    dedup: bool = False  # Store inherited BASE-AGENT bodies once under _blocks/
+    tokenizer: str = "heuristic"  # Token counter for the budget report
+    compress: bool = False  # Apply claude_mpm_agents.compress passes to outputs
+    dedupe_bases: bool = False  # Drop base sections/rules a more specific base repeats
+    skill_summaries: bool = False  # Append entry-point summaries of the agent's skills
+
+    @property
+    def transforms_bases(self) -> bool:
+        """Whether inherited base bodies are rewritten (--compress implies --dedupe-bases)."""
+        return self.compress or self.dedupe_bases
 
 
 class AgentBuilder:
     """Builds flattened agent definitions from modular sources with BASE-AGENT.md inheritance."""
 
-    def __init__(self, root_dir: Path, output_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        root_dir: Path,
+        output_dir: Optional[Path] = None,
+        options: Optional[BuildOptions] = None,
+    ):
         self.root_dir = root_dir
         self.output_dir = output_dir or root_dir / "dist" / "agents"
-        self._valid_skills: Optional[Set[str]] = None
+        self.options = options or BuildOptions()
+        self.skills_manifest_path = default_manifest_path(root_dir)
+        self.skills_dir = default_skills_dir(root_dir)
+        self._local_skills: Optional[SkillIndex] = None
+        self._skill_index: Optional[SkillManifestIndex] = None
         self.agents_dir = root_dir / "agents"
+        self.base_resolver = BaseAgentResolver(self.agents_dir, self.extract_frontmatter)
+        self.cache_path = self.output_dir / BUILD_CACHE_FILENAME
+        self._build_cache: Optional[dict[str, dict[str, Any]]] = None
+        self.output_writer = OutputWriter()
+        self.block_store = BlockStore(self.output_dir, self.output_writer)
+        self.count_tokens = get_token_counter(self.options.tokenizer)
+        self.budget_ratio = DEFAULT_BUDGET_RATIO  # Budget per max_tokens without context_limit
+        self._transformed_bases: dict[tuple, tuple[list[str], list[Removal]]] = {}
 
     def find_base_agents(self, agent_path: Path) -> List[Path]:
         """
         Find all BASE-AGENT.md files from agent's directory up to root.
 
+        Resolution is memoized per directory for the lifetime of the builder.
+
         Returns list ordered from root to agent directory (append order).
         """
-        base_files: List[Path] = []
-        current = agent_path.parent
-
-        # Walk up from agent directory to root
-        while current >= self.agents_dir:
-            base_file = current / "BASE-AGENT.md"
-            if base_file.exists():
-                base_files.insert(0, base_file)  # Insert at beginning for correct order
-            current = current.parent
-
-        return base_files
+        return self.base_resolver.find_base_agents(agent_path)
 
     def extract_frontmatter(self, content: str) -> tuple[str, str]:
         """
         Extract YAML frontmatter from content.
 
+        Handles CRLF line endings, a UTF-8 BOM and frontmatter-only files.
+
         Returns: (frontmatter, body)
         """
-        pattern = r"^---\n(.*?)\n---\n(.*)$"
-        match = re.match(pattern, content, re.DOTALL)
+        return split_frontmatter(content)
+
+    def base_bodies(self, agent_path: Path, verbatim: bool = False) -> list[tuple[BaseAgent, str]]:
+        """
+        Get the inherited BASE-AGENT.md bodies of an agent, root to local.
+
+        With --compress or --dedupe-bases (unless verbatim), bodies are
+        transformed by transform_bases. The result depends only on the base
+        chain, so it is identical for every agent sharing the chain (and for
+        --dedup blocks).
+
+        Returns: List of (base, stripped body)
+        """
+        bases = self.base_resolver.resolve(agent_path)
+        if verbatim or not self.options.transforms_bases:
+            return [(base, base.body.strip()) for base in bases]
+
+        bodies, _ = self.transform_bases(bases)
+        return [(base, body.strip()) for base, body in zip(bases, bodies)]
+
+    def transform_bases(self, bases: list[BaseAgent]) -> tuple[list[str], list[Removal]]:
+        """
+        Compress (with --compress) and deduplicate a base chain.
 
-        if match:
-            return match.group(1), match.group(2)
-        return "", content
+        Sections and bullet rules a more specific base repeats are dropped from
+        its ancestors, and sections whose heading it shares are merged into it
+        (see claude_mpm_agents.compress.dedupe_hierarchy).
+        Memoized by the chain's paths and digests.
 
-    def build_agent(self, agent_path: Path) -> str:
+        Returns: (bodies root to local, removed duplicates)
+        """
+        key = tuple((base.relative, base.digest) for base in bases)
+        if key not in self._transformed_bases:
+            bodies = [base.body for base in bases]
+            if self.options.compress:
+                bodies = [compress_markdown(body) for body in bodies]
+            self._transformed_bases[key] = dedupe_hierarchy(bodies)
+        return self._transformed_bases[key]
+
+    def base_removals(self, agent_path: Path) -> list[tuple[str, str, str, str]]:
+        """
+        List the duplicates dropped from an agent's bases by --dedupe-bases.
+
+        Returns: List of (kind, removed line, base it was removed from, base keeping it)
+        """
+        if not self.options.transforms_bases:
+            return []
+        bases = self.base_resolver.resolve(agent_path)
+        _, removals = self.transform_bases(bases)
+        return [
+            (
+                removal.kind,
+                removal.text,
+                str(bases[removal.removed_from].relative),
+                str(bases[removal.kept_in].relative),
+            )
+            for removal in removals
+        ]
+
+    def build_agent(
+        self,
+        agent_path: Path,
+        block_store: Optional[BlockStore] = None,
+        verbatim: bool = False,
+    ) -> str:
         """
         Build complete agent definition by combining:
         1. Agent-specific content (with frontmatter)
@@ -79,17 +222,25 @@ class AgentBuilder:
         3. Parent BASE-AGENT.md files (bottom-up)
         4. Root BASE-AGENT.md
 
+        With a block_store, each base body is stored there by content hash and
+        replaced by a reference line (see claude_mpm_agents.blocks). With
+        --compress, bodies are compressed and the "Inherited from" markers are
+        left out; verbatim ignores --compress and --dedupe-bases.
+
         Returns: Complete agent content
         """
         if not agent_path.exists():
             raise FileNotFoundError(f"Agent file not found: {agent_path}")
+        compress = self.options.compress and not verbatim
 
         # Read agent-specific content
         agent_content = agent_path.read_text(encoding="utf-8")
         frontmatter, body = self.extract_frontmatter(agent_content)
+        if compress:
+            body = compress_markdown(body)
 
-        # Find all BASE-AGENT.md files in hierarchy
-        base_files = self.find_base_agents(agent_path)
+        # Find all BASE-AGENT.md files in hierarchy (read and parsed once per build)
+        bases = self.base_bodies(agent_path, verbatim)
 
         # Build combined content
         parts = []
@@ -101,20 +252,50 @@ class AgentBuilder:
         # 2. Agent-specific body
         parts.append(body.strip())
 
+        # 2b. Entry-point summaries of the agent's skills (--skill-summaries)
+        if self.options.skill_summaries:
+            skills_text = self.skill_bundle(frontmatter).text
+            if skills_text:
+                parts.append(compress_markdown(skills_text) if compress else skills_text)
+
         # 3. Append BASE-AGENT.md files (root to local)
-        for base_file in base_files:
-            base_content = base_file.read_text(encoding="utf-8")
-            # Remove frontmatter from base files
-            _, base_body = self.extract_frontmatter(base_content)
-            if base_body.strip():
-                parts.append(
-                    f"\n<!-- Inherited from {base_file.relative_to(self.agents_dir)} -->\n"
-                )
-                parts.append(base_body.strip())
+        for base, base_body in bases:
+            # Base bodies already have their frontmatter removed
+            if base_body:
+                if not compress:
+                    parts.append(f"\n<!-- Inherited from {base.relative} -->\n")
+                if block_store is not None:
+                    parts.append(block_ref(block_store.put(base_body)))
+                else:
+                    parts.append(base_body)
 
         return "\n\n".join(parts)
 
-    def build_all_agents(self) -> dict[Path, str]:
+    def skill_bundle(self, frontmatter: str) -> SkillBundle:
+        """
+        Summarize the local skills listed in an agent's frontmatter.
+
+        Returns: SkillBundle (see claude_mpm_agents.skill_bundle.bundle_skills)
+        """
+        data = parse_frontmatter(frontmatter) if frontmatter else {}
+        skills = data.get("skills") if isinstance(data, dict) else None
+        if not isinstance(skills, list):
+            return SkillBundle()
+        return bundle_skills([str(s) for s in skills], self.load_local_skills(), self.count_tokens)
+
+    def discover_agents(self) -> List[Path]:
+        """
+        Find all agent definitions (every .md file except BASE-AGENT.md).
+
+        Returns: Sorted list of agent paths, giving builds a deterministic order
+        """
+        return sorted(
+            agent_file
+            for agent_file in self.agents_dir.rglob("*.md")
+            if agent_file.name != "BASE-AGENT.md"
+        )
+
+    def build_all_agents(self, jobs: int = 1) -> dict[Path, str]:
         """
         Build all agent definitions in the repository.
 
@@ -122,91 +303,505 @@ class AgentBuilder:
         """
         results = {}
 
-        # Find all .md files that are NOT BASE-AGENT.md
-        for agent_file in self.agents_dir.rglob("*.md"):
-            if agent_file.name == "BASE-AGENT.md":
+        for result in self.process_all_agents(jobs=jobs):
+            if result.error:
+                print(f"Error building {result.agent_path}: {result.error}", file=sys.stderr)
+            elif result.content is not None:
+                results[result.agent_path] = result.content
+
+        return results
+
+    def process_agent(
+        self, agent_path: Path, incremental: bool = False, write: bool = False
+    ) -> "AgentBuildResult":
+        """
+        Run the full per-agent pipeline: hash, build and optionally write.
+
+        Errors are captured on the result instead of raised so that a batch of
+        agents can be processed (serially or in worker processes) to completion.
+
+        Returns: AgentBuildResult for the agent
+        """
+        result = AgentBuildResult(agent_path=agent_path)
+        try:
+            result.source_hash = self.compute_source_hash(agent_path)
+            if incremental and self.is_up_to_date(agent_path, result.source_hash):
+                result.skipped = True
+                return result
+
+            content = self.build_agent(agent_path, self.output_block_store() if write else None)
+            if write:
+                result.output_path = self.output_path_for(agent_path)
+                result.written = self.output_writer.write(result.output_path, content)
+                result.index_entry = build_index_entry(
+                    content,
+                    output_path=str(result.output_path.relative_to(self.output_dir)),
+                    source_path=str(agent_path.relative_to(self.agents_dir)),
+                    inheritance=[
+                        str(p.relative_to(self.agents_dir))
+                        for p in self.find_base_agents(agent_path)
+                    ],
+                )
+                result.manifest_entry = build_manifest_entry(
+                    content,
+                    agent_id=result.index_entry["agent_id"],
+                    version=result.index_entry["version"],
+                    bases=[
+                        (str(base.relative), base.digest)
+                        for base in self.base_resolver.resolve(agent_path)
+                    ],
+                    blocks=find_block_refs(content) if self.options.dedup else None,
+                )
+                result.token_usage = self.measure_tokens(agent_path, content)
+                if self.options.compress:
+                    result.compression = self.measure_compression(agent_path, content)
+            else:
+                result.content = content
+        except Exception as e:
+            result.error = str(e)
+
+        return result
+
+    def process_all_agents(
+        self, incremental: bool = False, write: bool = False, jobs: int = 1
+    ) -> List["AgentBuildResult"]:
+        """
+        Run process_agent over every agent, optionally across worker processes.
+
+        Returns: List of AgentBuildResult in discover_agents() order
+        """
+        agent_files = self.discover_agents()
+        if write:
+            # Create every output directory once, before any worker writes
+            self.output_writer.ensure_dirs(self.output_path_for(p) for p in agent_files)
+        return self.map_agents("process_agent", agent_files, jobs, incremental, write)
+
+    def map_agents(self, method: str, agent_files: List[Path], jobs: int, *args) -> list:
+        """
+        Call a per-agent builder method for each agent file.
+
+        With jobs > 1 the calls are fanned out over a process pool; each worker
+        holds its own AgentBuilder. Results are always returned in input order.
+
+        Returns: List of method results, one per agent file
+        """
+        if jobs <= 1 or len(agent_files) <= 1:
+            return [getattr(self, method)(agent_file, *args) for agent_file in agent_files]
+
+        chunksize = max(1, len(agent_files) // (jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(self.root_dir, self.output_dir, self.options),
+        ) as executor:
+            return list(
+                executor.map(
+                    _run_worker_method,
+                    [(method, agent_file, args) for agent_file in agent_files],
+                    chunksize=chunksize,
+                )
+            )
+
+    def compute_source_hash(self, agent_path: Path) -> str:
+        """
+        Hash an agent file together with its BASE-AGENT.md inheritance chain.
+
+        Any change to the agent or to one of its ancestors changes the hash;
+        with --skill-summaries, so does a change to one of its SKILL.md files.
+
+        Returns: Hex sha256 digest
+        """
+        digest = hashlib.sha256(f"build-cache-v{BUILD_CACHE_VERSION}\n{self.options}\n".encode())
+        agent_digest = hashlib.sha256(agent_path.read_bytes()).hexdigest()
+        sources = [(agent_path.relative_to(self.agents_dir), agent_digest)]
+        bases = self.base_resolver.resolve(agent_path)
+        sources.extend((base.relative, base.digest) for base in bases)
+        if self.options.skill_summaries:
+            frontmatter, _ = self.extract_frontmatter(agent_path.read_text(encoding="utf-8"))
+            for skill_file in self.skill_bundle(frontmatter).paths:
+                skill_digest = hashlib.sha256(skill_file.read_bytes()).hexdigest()
+                sources.append((skill_file.relative_to(self.root_dir), skill_digest))
+        for relative, source_digest in sources:
+            digest.update(f"{relative}\0{source_digest}\n".encode())
+        return digest.hexdigest()
+
+    def load_build_cache(self) -> dict[str, dict[str, Any]]:
+        """
+        Load the persistent build cache from the output directory.
+
+        Returns: Dict mapping agent path (relative to agents/) to cache entry
+        """
+        if self._build_cache is not None:
+            return self._build_cache
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != BUILD_CACHE_VERSION:
+                raise ValueError("Build cache version mismatch")
+            self._build_cache = dict(data.get("agents", {}))
+        except (OSError, ValueError, AttributeError):
+            # Missing or unreadable cache - start from scratch
+            self._build_cache = {}
+
+        return self._build_cache
+
+    def save_build_cache(self) -> None:
+        """Persist the build cache, dropping entries for deleted agents."""
+        cache = self.load_build_cache()
+        for rel_path in [p for p in cache if not (self.agents_dir / p).exists()]:
+            del cache[rel_path]
+
+        self.output_writer.ensure_dirs([self.cache_path])
+        payload = {"version": BUILD_CACHE_VERSION, "agents": dict(sorted(cache.items()))}
+        write_if_changed(self.cache_path, json.dumps(payload, indent=2) + "\n")
+
+    def is_up_to_date(self, agent_path: Path, source_hash: str) -> bool:
+        """
+        Check whether an agent's built output matches its cached source hash.
+
+        Returns: True if the output exists and was built from identical sources
+        """
+        entry = self.load_build_cache().get(str(agent_path.relative_to(self.agents_dir)))
+        if not entry or entry.get("hash") != source_hash:
+            return False
+        blocks = (entry.get("manifest") or {}).get("blocks", [])
+        if not all(self.block_store.path_for(digest).is_file() for digest in blocks):
+            return False
+        return (self.output_dir / entry.get("output", "")).is_file()
+
+    def record_build(
+        self,
+        agent_path: Path,
+        output_path: Path,
+        source_hash: str,
+        index_entry: Optional[dict[str, Any]] = None,
+        manifest_entry: Optional[dict[str, Any]] = None,
+        token_usage: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Record a successful build of an agent in the build cache."""
+        self.load_build_cache()[str(agent_path.relative_to(self.agents_dir))] = {
+            "hash": source_hash,
+            "output": str(output_path.relative_to(self.output_dir)),
+            "index": index_entry,
+            "manifest": manifest_entry,
+            "tokens": token_usage,
+        }
+
+    def record_result(self, result: "AgentBuildResult") -> None:
+        """Record a successful AgentBuildResult in the build cache."""
+        self.record_build(
+            result.agent_path,
+            result.output_path,
+            result.source_hash,
+            result.index_entry,
+            result.manifest_entry,
+            result.token_usage,
+        )
+
+    def measure_tokens(self, agent_path: Path, content: str) -> dict[str, Any]:
+        """
+        Count the tokens of a built agent and of each section it was built from.
+
+        Sections are the agent's frontmatter and body, its skill summaries
+        (with --skill-summaries) and every inherited BASE-AGENT.md body,
+        labelled by their path relative to agents/.
+
+        Returns: {"total": int, "sections": [{"label", "tokens"}]}
+        """
+        relative = agent_path.relative_to(self.agents_dir)
+        frontmatter, body = self.extract_frontmatter(agent_path.read_text(encoding="utf-8"))
+        if self.options.compress:
+            body = compress_markdown(body)
+        sections = [(f"{relative} (frontmatter)", frontmatter), (str(relative), body.strip())]
+        if self.options.skill_summaries:
+            sections.append((f"{relative} (skills)", self.skill_bundle(frontmatter).text))
+        sections.extend((str(base.relative), body) for base, body in self.base_bodies(agent_path))
+        if self.options.dedup:
+            content = reassemble(content, self.block_store)
+        return measure_sections(sections, content, self.count_tokens)
+
+    def measure_compression(self, agent_path: Path, content: str) -> CompressionStats:
+        """
+        Compare a compressed agent with its uncompressed build.
+
+        Returns: CompressionStats (bytes and tokens before and after)
+        """
+        if self.options.dedup:
+            content = reassemble(content, self.block_store)
+        _, removals = self.transform_bases(self.base_resolver.resolve(agent_path))
+        return compression_stats(
+            self.build_agent(agent_path, verbatim=True),
+            content,
+            self.count_tokens,
+            duplicates_removed=len(removals),
+        )
+
+    def token_report(self) -> dict[str, Any]:
+        """
+        Build the token budget report for every agent recorded in the build cache.
+
+        Returns: Report (see claude_mpm_agents.tokens.build_token_report)
+        """
+        usages = []
+        for entry in self.load_build_cache().values():
+            tokens, index = entry.get("tokens"), entry.get("index")
+            if not tokens or not index:
                 continue
+            budget, budget_source = agent_budget(index.get("frontmatter") or {}, self.budget_ratio)
+            usages.append(
+                AgentTokenUsage(
+                    path=entry["output"],
+                    agent_id=index["agent_id"],
+                    total=tokens["total"],
+                    budget=budget,
+                    budget_source=budget_source,
+                    sections=tokens["sections"],
+                )
+            )
+        return build_token_report(usages, self.options.tokenizer)
 
-            try:
-                built_content = self.build_agent(agent_file)
-                results[agent_file] = built_content
-            except Exception as e:
-                print(f"Error building {agent_file}: {e}", file=sys.stderr)
+    def write_token_report(self) -> tuple[Path, dict[str, Any]]:
+        """
+        Write token-report.json to the output directory.
 
-        return results
+        Returns: (report path, report)
+        """
+        report = self.token_report()
+        report_path = self.output_dir / TOKEN_REPORT_FILENAME
+        self.output_writer.ensure_dirs([report_path])
+        write_if_changed(report_path, json.dumps(report, indent=2) + "\n")
+        return report_path, report
 
-    def write_agent(self, agent_path: Path, content: str) -> Path:
+    def write_index(self) -> Path:
         """
-        Write built agent to output directory, preserving structure.
+        Write agents.index.json for every agent recorded in the build cache.
 
-        Returns: Path to output file
+        Index entries of agents skipped by an incremental build come from the
+        cache, so the index always covers the full catalog.
+
+        Returns: Path to the index file
         """
-        # Preserve directory structure relative to agents/
-        relative_path = agent_path.relative_to(self.agents_dir)
-        output_path = self.output_dir / relative_path
+        entries = [
+            entry["index"] for entry in self.load_build_cache().values() if entry.get("index")
+        ]
+        return write_index(self.output_dir / INDEX_FILENAME, entries, CURRENT_SCHEMA_VERSION)
 
-        # Create output directory
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    def write_manifest(self) -> Path:
+        """
+        Write MANIFEST.json for every agent recorded in the build cache.
 
-        # Write content
-        output_path.write_text(content, encoding="utf-8")
+        Like the index, entries of agents skipped by an incremental build come
+        from the cache, so the manifest always covers the full catalog.
 
-        return output_path
+        Returns: Path to the manifest file
+        """
+        entries = {
+            entry["output"]: entry["manifest"]
+            for entry in self.load_build_cache().values()
+            if entry.get("manifest")
+        }
+        # Shared blocks are listed once, so consumers fetch each only once
+        for digest in sorted(self.referenced_blocks()):
+            entries[block_relative_path(digest)] = {
+                "sha256": digest,
+                "size": self.block_store.path_for(digest).stat().st_size,
+            }
+        return write_manifest(self.output_dir / MANIFEST_FILENAME, entries, CURRENT_SCHEMA_VERSION)
+
+    def output_block_store(self) -> Optional[BlockStore]:
+        """
+        Get the block store built outputs reference, if building with --dedup.
 
-    def load_valid_skills(self) -> Set[str]:
+        Returns: BlockStore, or None for the regular (self-contained) format
         """
-        Load valid skill names from claude-mpm-skills manifest.
+        return self.block_store if self.options.dedup else None
 
-        Returns: Set of valid skill names, or empty set if manifest not found
+    def referenced_blocks(self) -> set[str]:
+        """
+        Collect the block digests referenced by agents in the build cache.
+
+        Returns: Set of block digests
+        """
+        referenced: set[str] = set()
+        for entry in self.load_build_cache().values():
+            referenced.update((entry.get("manifest") or {}).get("blocks", []))
+        return referenced
+
+    def prune_blocks(self) -> List[Path]:
+        """
+        Delete stored blocks no cached agent references any more.
+
+        Returns: Paths of removed block files
+        """
+        return self.block_store.prune(self.referenced_blocks())
+
+    def build_changed_agents(
+        self, jobs: int = 1
+    ) -> tuple[dict[Path, str], dict[Path, str], List[Path]]:
+        """
+        Build only agents whose sources changed since the last cached build.
+
+        Returns: (built content by agent path, source hash by agent path, skipped agent paths)
         """
-        if self._valid_skills is not None:
-            return self._valid_skills
+        results = {}
+        hashes = {}
+        skipped = []
+
+        for result in self.process_all_agents(incremental=True, jobs=jobs):
+            if result.error:
+                print(f"Error building {result.agent_path}: {result.error}", file=sys.stderr)
+            elif result.skipped:
+                skipped.append(result.agent_path)
+            else:
+                results[result.agent_path] = result.content
+                hashes[result.agent_path] = result.source_hash
+
+        return results, hashes, skipped
 
-        manifest_path = self.root_dir.parent / "claude-mpm-skills" / "manifest.json"
+    def dependency_map(self) -> dict[Path, set[Path]]:
+        """
+        Build the reverse dependency map from find_base_agents.
+
+        Returns: Dict mapping each BASE-AGENT.md to the agents that inherit it
+        """
+        dependents: dict[Path, set[Path]] = {}
+        for agent_file in self.discover_agents():
+            for base_file in self.find_base_agents(agent_file):
+                dependents.setdefault(base_file, set()).add(agent_file)
+        return dependents
+
+    def agents_affected_by(self, changed_paths: set[Path]) -> List[Path]:
+        """
+        Work out which agents must be rebuilt after source files changed.
+
+        A changed BASE-AGENT.md affects every agent that inherits it (before or
+        after the change, so created and deleted bases are covered); a changed
+        agent file affects only itself.
+
+        Returns: Sorted list of affected agent paths (may include deleted agents)
+        """
+        base_changes = {p for p in changed_paths if p.name == BASE_AGENT_FILENAME}
+        affected = {p for p in changed_paths - base_changes if self.agents_dir in p.parents}
+
+        if base_changes:
+            before = self.dependency_map()
+            for base_file in base_changes:
+                self.base_resolver.invalidate(base_file)
+            after = self.dependency_map()
+            for base_file in base_changes:
+                affected |= before.get(base_file, set()) | after.get(base_file, set())
+
+        return sorted(affected)
+
+    def rebuild_changed(
+        self, changed_paths: set[Path], jobs: int = 1
+    ) -> tuple[List["AgentBuildResult"], List[Path]]:
+        """
+        Rebuild only the outputs affected by changed source files.
+
+        Outputs of deleted agents are removed. The build cache is updated.
+
+        Returns: (build results for rebuilt agents, removed output paths)
+        """
+        affected = self.agents_affected_by(changed_paths)
+        existing = [p for p in affected if p.exists()]
+        removed = []
+
+        for agent_path in affected:
+            if agent_path in existing:
+                continue
+            output_path = self.output_path_for(agent_path)
+            if output_path.exists():
+                output_path.unlink()
+                removed.append(output_path)
+
+        self.output_writer.ensure_dirs(self.output_path_for(p) for p in existing)
+        results = self.map_agents("process_agent", existing, jobs, False, True)
+        for result in results:
+            if not result.error:
+                self.record_result(result)
+        self.save_build_cache()
+        self.prune_blocks()
+        self.write_index()
+        self.write_manifest()
+        self.write_token_report()
+
+        return results, removed
+
+    def output_path_for(self, agent_path: Path) -> Path:
+        """
+        Map an agent source file to its output file.
+
+        Returns: Output path, preserving the directory structure relative to agents/
+        """
+        return self.output_dir / agent_path.relative_to(self.agents_dir)
+
+    def write_agent(self, agent_path: Path, content: str) -> Path:
+        """
+        Write built agent to output directory, preserving structure.
 
-        if not manifest_path.exists():
-            # Manifest not found - return empty set (validation will be skipped)
-            self._valid_skills = set()
-            return self._valid_skills
+        The file is replaced atomically, and only if its content changed, so
+        unchanged outputs keep their mtimes.
+
+        Returns: Path to output file
+        """
+        output_path = self.output_path_for(agent_path)
+        self.output_writer.write(output_path, content)
+        return output_path
+
+    def load_skill_index(self) -> SkillManifestIndex:
+        """
+        Load the claude-mpm-skills manifest index.
+
+        Returns: SkillManifestIndex (empty if the manifest is missing or unreadable)
+        """
+        if self._skill_index is not None:
+            return self._skill_index
 
         try:
-            with open(manifest_path) as f:
-                manifest = json.load(f)
+            self._skill_index = load_skill_manifest(self.skills_manifest_path)
+        except (OSError, ValueError):
+            # Manifest not found or not valid JSON - validation will be skipped
+            self._skill_index = SkillManifestIndex(skills={})
 
-            skills = set()
+        return self._skill_index
 
-            # Handle universal skills (list of dicts)
-            if "universal" in manifest.get("skills", {}):
-                for skill in manifest["skills"]["universal"]:
-                    if isinstance(skill, dict) and "name" in skill:
-                        skills.add(skill["name"])
+    def load_local_skills(self) -> SkillIndex:
+        """
+        Load this repository's skills/*/SKILL.md files (frontmatter only).
 
-            # Handle toolchains (nested dict of lists of dicts)
-            if "toolchains" in manifest.get("skills", {}):
-                for _, toolchain_skills in manifest["skills"]["toolchains"].items():
-                    if isinstance(toolchain_skills, list):
-                        for skill in toolchain_skills:
-                            if isinstance(skill, dict) and "name" in skill:
-                                skills.add(skill["name"])
+        Returns: SkillIndex (empty if there is no skills/ directory)
+        """
+        if self._local_skills is None:
+            self._local_skills = SkillLoader(self.skills_dir).index()
+        return self._local_skills
 
-            # Handle examples (if present)
-            if "examples" in manifest.get("skills", {}):
-                for skill in manifest["skills"]["examples"]:
-                    if isinstance(skill, dict) and "name" in skill:
-                        skills.add(skill["name"])
+    def load_valid_skills(self) -> Set[str]:
+        """
+        Load valid skill names from claude-mpm-skills manifest and skills/.
 
-            self._valid_skills = skills
-            return skills
+        Skills defined in this repository are valid even if the manifest does
+        not list them.
 
-        except Exception:
-            # Error loading manifest - return empty set
-            self._valid_skills = set()
-            return self._valid_skills
+        Returns: Set of valid skill names, or empty set if manifest not found
+        """
+        manifest_skills = self.load_skill_index().names()
+        if not manifest_skills:
+            return set()
+        return manifest_skills | self.load_local_skills().names()
 
-    def validate_agent(self, agent_path: Path) -> List[str]:
+    def validate_agent(self, agent_path: Path, local_skills: bool = False) -> List[str]:
         """
         Validate agent definition.
 
+        The frontmatter is parsed once and checked against the agent schema
+        (types, enums, nested capabilities/interactions) in a single pass;
+        every problem is reported with its line number.
+
+        Skill references are checked against the claude-mpm-skills manifest
+        plus this repository's skills/ (skipped if the manifest is missing),
+        or, with local_skills, against skills/ alone.
+
         Returns: List of validation errors (empty if valid)
         """
         errors = []
@@ -214,53 +809,37 @@ class AgentBuilder:
 
         try:
             content = agent_path.read_text(encoding="utf-8")
-            frontmatter, body = self.extract_frontmatter(content)
+            span = scan_frontmatter(content)
+            body = span.body(content) if span else content
 
             # Check for required frontmatter fields
-            if not frontmatter:
+            if span is None or not span.frontmatter(content).strip():
                 errors.append("Missing YAML frontmatter")
             else:
-                required_fields = [
-                    "name",
-                    "description",
-                    "agent_id",
-                    "agent_type",
-                    "schema_version",
-                ]
-                for field in required_fields:
-                    if f"{field}:" not in frontmatter:
-                        errors.append(f"Missing required field: {field}")
-
-                # Validate schema_version value
-                schema_match = re.search(r"^schema_version:\s*(.+)$", frontmatter, re.MULTILINE)
-                if schema_match:
-                    agent_schema_version = schema_match.group(1).strip()
-                    if agent_schema_version != CURRENT_SCHEMA_VERSION:
-                        warnings.append(
-                            f"schema_version is {agent_schema_version}, "
-                            f"current is {CURRENT_SCHEMA_VERSION}"
+                first_line = content.count("\n", 0, span.frontmatter_start) + 1
+                result = validate_frontmatter(span.frontmatter(content), first_line)
+                errors.extend(str(issue) for issue in result.errors)
+                warnings.extend(str(issue) for issue in result.warnings)
+
+                # Validate skill references from the parsed frontmatter
+                if local_skills:
+                    skill_index, source = self.load_local_skills(), "skills/"
+                    valid_skills = skill_index.names()
+                else:
+                    skill_index, source = self.load_skill_index(), "claude-mpm-skills"
+                    valid_skills = self.load_valid_skills()
+                agent_skills = (result.data or {}).get("skills")
+                if valid_skills and isinstance(agent_skills, list):
+                    invalid_skills = [
+                        s for s in agent_skills if isinstance(s, str) and s not in valid_skills
+                    ]
+                    if invalid_skills:
+                        issue = ValidationIssue(
+                            f"Invalid skill references (not in {source}): "
+                            + ", ".join(skill_index.describe_invalid(s) for s in invalid_skills),
+                            result.lines.get(("skills",)),
                         )
-
-                # Validate skill references
-                valid_skills = self.load_valid_skills()
-                if valid_skills:  # Only validate if manifest was loaded
-                    # Extract skills from frontmatter
-                    skills_match = re.search(r"skills:\s*\n((?:- .+\n)+)", content)
-                    if skills_match:
-                        skills_text = skills_match.group(1)
-                        agent_skills = []
-                        for line in skills_text.split("\n"):
-                            line = line.strip()
-                            if line.startswith("- "):
-                                skill = line[2:].strip()
-                                agent_skills.append(skill)
-
-                        # Check for invalid skills
-                        invalid_skills = [s for s in agent_skills if s not in valid_skills]
-                        if invalid_skills:
-                            errors.append(
-                                f"Invalid skill references (not in claude-mpm-skills): {', '.join(invalid_skills)}"
-                            )
+                        errors.append(str(issue))
 
             # Check for content
             if not body.strip():
@@ -274,23 +853,215 @@ class AgentBuilder:
 
         return errors
 
-    def validate_all_agents(self) -> dict[Path, List[str]]:
+    def validate_all_agents(
+        self, jobs: int = 1, local_skills: bool = False
+    ) -> dict[Path, List[str]]:
         """
         Validate all agent definitions.
 
+        With local_skills, skill references are checked against skills/ only.
+
         Returns: Dict mapping agent paths to validation errors
         """
-        results = {}
+        agent_files = self.discover_agents()
+        all_errors = self.map_agents("validate_agent", agent_files, jobs, local_skills)
+
+        return {agent_file: errors for agent_file, errors in zip(agent_files, all_errors) if errors}
+
+
+@dataclass
+class AgentBuildResult:
+    """Outcome of building a single agent."""
+
+    agent_path: Path
+    source_hash: str = ""
+    content: Optional[str] = None
+    output_path: Optional[Path] = None
+    index_entry: Optional[dict[str, Any]] = None
+    manifest_entry: Optional[dict[str, Any]] = None
+    token_usage: Optional[dict[str, Any]] = None
+    compression: Optional[CompressionStats] = None
+    skipped: bool = False
+    written: bool = False  # False when the existing output already had this content
+    error: Optional[str] = None
+
+
+# Per-process builder used by --jobs worker processes
+_worker_builder: Optional[AgentBuilder] = None
+
+
+def _init_worker(root_dir: Path, output_dir: Path, options: BuildOptions) -> None:
+    """Create the AgentBuilder used by this worker process."""
+    global _worker_builder
+    _worker_builder = AgentBuilder(root_dir, output_dir, options)
+
+
+def _run_worker_method(task: tuple[str, Path, tuple]):
+    """Run one per-agent builder method inside a worker process."""
+    method, agent_path, args = task
+    return getattr(_worker_builder, method)(agent_path, *args)
+
+
+def display_path(path: Path, root: Path) -> Path:
+    """
+    Shorten a path for printing.
+
+    Returns: path relative to root, or path unchanged if it is outside root
+    (e.g. an --output-dir elsewhere)
+    """
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return path
+
+
+def build_all(
+    builder: AgentBuilder,
+    incremental: bool = False,
+    jobs: int = 1,
+    budget_policy: str = "warn",
+    show_token_report: bool = False,
+) -> int:
+    """
+    Build and write all agents, printing progress.
+
+    budget_policy is "warn" (report agents over their token budget), "fail"
+    (also exit non-zero) or "off".
+
+    Returns: Exit code
+    """
+    print("Building all agents...")
+    results = builder.process_all_agents(incremental=incremental, write=True, jobs=jobs)
+
+    built = 0
+    unchanged = 0
+    skipped = 0
+    for result in results:
+        if result.error:
+            print(f"Error building {result.agent_path}: {result.error}", file=sys.stderr)
+            continue
+        if result.skipped:
+            skipped += 1
+            continue
+
+        builder.record_result(result)
+        built += 1
+        rel_input = result.agent_path.relative_to(builder.agents_dir)
+        rel_output = display_path(result.output_path, builder.root_dir)
+        if result.written:
+            print(f"✅ {rel_input} -> {rel_output}")
+        else:
+            unchanged += 1
+            print(f"✅ {rel_input} -> {rel_output} (unchanged)")
+
+    builder.save_build_cache()
+    builder.prune_blocks()
+    index_path = builder.write_index()
+    manifest_path = builder.write_manifest()
+    report_path, report = builder.write_token_report()
+
+    if skipped:
+        print(f"\n⏭️  Skipped {skipped} unchanged agents")
+    if unchanged:
+        print(f"\n📎 {unchanged} outputs already up to date (not rewritten)")
+    print(f"\n✅ Built {built} agents to {builder.output_dir}")
+    print(f"📇 Agent index: {display_path(index_path, builder.root_dir)}")
+    print(f"🧾 Build manifest: {display_path(manifest_path, builder.root_dir)}")
+    print(f"🔢 Token report: {display_path(report_path, builder.root_dir)}")
+
+    built_agents = [r.agent_path for r in results if not r.error and not r.skipped]
+    if builder.options.transforms_bases and built_agents:
+        print_base_removals(builder, built_agents)
+
+    compressed = [result for result in results if result.compression is not None]
+    if compressed:
+        print_compression_report(builder, compressed)
+
+    if show_token_report:
+        print(f"\n{format_token_report(report)}")
+
+    over_budget = [agent for agent in report["agents"] if agent["over_budget"]]
+    if budget_policy != "off" and over_budget:
+        marker = "❌" if budget_policy == "fail" else "⚠️ "
+        print(f"\n{marker} {len(over_budget)} agents over their token budget:", file=sys.stderr)
+        for agent in over_budget:
+            print(
+                f"  - {agent['path']}: {agent['total']:,} tokens > {agent['budget']:,}"
+                f" (from {agent['budget_source']})",
+                file=sys.stderr,
+            )
+        if budget_policy == "fail":
+            return 1
+    return 0
 
-        for agent_file in self.agents_dir.rglob("*.md"):
-            if agent_file.name == "BASE-AGENT.md":
-                continue
 
-            errors = self.validate_agent(agent_file)
-            if errors:
-                results[agent_file] = errors
+def print_base_removals(builder: AgentBuilder, agent_paths: List[Path]) -> None:
+    """Print the base sections and rules --dedupe-bases dropped, once per base."""
+    removals = sorted({removal for path in agent_paths for removal in builder.base_removals(path)})
+    if not removals:
+        return
+    print(
+        f"\n✂️  Dropped or merged {len(removals)} duplicate base sections/rules "
+        "(most specific copy kept):"
+    )
+    for kind, text, removed_from, kept_in in sorted(removals, key=lambda r: (r[2], r[0], r[1])):
+        print(f"  - {removed_from}: {kind} {text!r} (kept in {kept_in})")
+
+
+def print_compression_report(builder: AgentBuilder, results: List[AgentBuildResult]) -> None:
+    """Print per-agent and total byte/token savings of a --compress build."""
+    print("\n🗜️  Compression savings:")
+    for result in results:
+        stats = result.compression
+        print(
+            f"  {result.agent_path.relative_to(builder.agents_dir)}: "
+            f"{stats.bytes_before:,} -> {stats.bytes_after:,} bytes "
+            f"(-{stats.bytes_saved_pct:.1f}%), "
+            f"{stats.tokens_before:,} -> {stats.tokens_after:,} tokens "
+            f"(-{stats.tokens_saved_pct:.1f}%), {stats.duplicates_removed} base duplicates dropped"
+        )
+    total = CompressionStats(
+        bytes_before=sum(r.compression.bytes_before for r in results),
+        bytes_after=sum(r.compression.bytes_after for r in results),
+        tokens_before=sum(r.compression.tokens_before for r in results),
+        tokens_after=sum(r.compression.tokens_after for r in results),
+    )
+    print(
+        f"  Total: {total.bytes_before:,} -> {total.bytes_after:,} bytes "
+        f"(-{total.bytes_saved_pct:.1f}%), "
+        f"{total.tokens_before:,} -> {total.tokens_after:,} tokens (-{total.tokens_saved_pct:.1f}%)"
+    )
 
-        return results
+
+def watch_agents(builder: AgentBuilder, use_polling: bool = False, jobs: int = 1) -> int:
+    """Watch agents/ and rebuild affected outputs until interrupted. Returns exit code."""
+    watcher = create_watcher(builder.agents_dir, use_polling=use_polling)
+    print(f"\n👀 Watching {builder.agents_dir} ({type(watcher).__name__}), Ctrl+C to stop")
+
+    try:
+        while True:
+            changed = watcher.wait()
+            # Debounce: editors often emit several events per save
+            while more := watcher.wait(timeout=0.1):
+                changed |= more
+
+            results, removed = builder.rebuild_changed(changed, jobs=jobs)
+            for result in results:
+                rel_input = result.agent_path.relative_to(builder.agents_dir)
+                if result.error:
+                    print(f"Error building {result.agent_path}: {result.error}", file=sys.stderr)
+                elif result.written:
+                    print(f"🔄 {rel_input} -> {display_path(result.output_path, builder.root_dir)}")
+                else:
+                    print(f"🔄 {rel_input} (output unchanged)")
+            for output_path in removed:
+                print(f"🗑️  Removed {display_path(output_path, builder.root_dir)}")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+
+    return 0
 
 
 def main():
@@ -310,6 +1081,94 @@ def main():
 
     parser.add_argument("--validate", action="store_true", help="Validate all agent definitions")
 
+    parser.add_argument(
+        "--local-skills",
+        action="store_true",
+        help="With --validate, check skill references against this repository's skills/ "
+        "instead of the claude-mpm-skills manifest",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="With --all, skip agents whose sources are unchanged since the last build",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Build changed agents, then keep watching agents/ and rebuild affected outputs",
+    )
+
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll for changes instead of using inotify",
+    )
+
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Store inherited BASE-AGENT.md bodies once under _blocks/ and reference them",
+    )
+
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Compress outputs (whitespace, comments, decorative emoji, repeated base rules) "
+        "and report the savings",
+    )
+
+    parser.add_argument(
+        "--dedupe-bases",
+        action="store_true",
+        help="Drop BASE-AGENT.md sections and rules a more specific base repeats, and merge "
+        "sections with matching headings (implied by --compress)",
+    )
+
+    parser.add_argument(
+        "--skill-summaries",
+        action="store_true",
+        help="Append the entry-point summary of each local skill in the agent's skills: list, "
+        "within its context_limit",
+    )
+
+    parser.add_argument(
+        "--token-budget",
+        choices=["warn", "fail", "off"],
+        default="warn",
+        help="With --all, warn about or fail on agents over their token budget (default: warn)",
+    )
+
+    parser.add_argument(
+        "--budget-ratio",
+        type=float,
+        default=DEFAULT_BUDGET_RATIO,
+        help="Token budget as a multiple of max_tokens for agents without context_limit "
+        f"(default: {DEFAULT_BUDGET_RATIO:g})",
+    )
+
+    parser.add_argument(
+        "--token-report",
+        action="store_true",
+        help="With --all, print the heaviest agents and sections by token count",
+    )
+
+    parser.add_argument(
+        "--tokenizer",
+        choices=TOKENIZERS,
+        default="heuristic",
+        help="Token counter: offline heuristic or tiktoken cl100k_base (default: heuristic)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for --all/--validate (0 = one per CPU, default: 1)",
+    )
+
     parser.add_argument(
         "--root",
         type=Path,
@@ -324,12 +1183,25 @@ def main():
     args = parser.parse_args()
 
     # Initialize builder
-    builder = AgentBuilder(args.root, args.output_dir)
+    try:
+        options = BuildOptions(
+            dedup=args.dedup,
+            tokenizer=args.tokenizer,
+            compress=args.compress,
+            dedupe_bases=args.dedupe_bases,
+            skill_summaries=args.skill_summaries,
+        )
+        builder = AgentBuilder(args.root, args.output_dir, options)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    builder.budget_ratio = args.budget_ratio
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     # Validate mode
     if args.validate:
         print("Validating all agents...")
-        validation_results = builder.validate_all_agents()
+        validation_results = builder.validate_all_agents(jobs=jobs, local_skills=args.local_skills)
 
         if not validation_results:
             print("✅ All agents valid!")
@@ -344,19 +1216,20 @@ def main():
                 print()
             return 1
 
+    # Watch mode
+    if args.watch:
+        build_all(builder, incremental=True, jobs=jobs)
+        return watch_agents(builder, use_polling=args.poll, jobs=jobs)
+
     # Build all mode
     if args.all:
-        print("Building all agents...")
-        results = builder.build_all_agents()
-
-        for agent_path, content in results.items():
-            output_path = builder.write_agent(agent_path, content)
-            rel_input = agent_path.relative_to(builder.agents_dir)
-            rel_output = output_path.relative_to(builder.root_dir)
-            print(f"✅ {rel_input} -> {rel_output}")
-
-        print(f"\n✅ Built {len(results)} agents to {builder.output_dir}")
-        return 0
+        return build_all(
+            builder,
+            incremental=args.incremental,
+            jobs=jobs,
+            budget_policy=args.token_budget,
+            show_token_report=args.token_report,
+        )
 
     # Single agent mode
     if args.agent_path:
@@ -367,7 +1240,7 @@ def main():
         print(f"Building {agent_path.name}...")
 
         try:
-            content = builder.build_agent(agent_path)
+            content = builder.build_agent(agent_path, builder.output_block_store())
             output_path = builder.write_agent(agent_path, content)
 
             print(f"✅ Built: {output_path}")
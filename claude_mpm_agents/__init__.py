@@ -0,0 +1,5 @@
+"""Shared build and loading utilities for Claude MPM agent definitions.
+
+Used by build-agent.py, the test fixtures in tests/fixtures and the helper
+scripts in scripts/.
+"""
@@ -0,0 +1,154 @@
+"""Precomputed catalog of built agents (``agents.index.json``).
+
+``build-agent.py --all`` writes the index next to the built agents. It holds
+every agent's parsed frontmatter, the fields deployment cares about, the
+BASE-AGENT.md inheritance chain, and byte offsets into each built output, so
+consumers can load the whole catalog with one read and no YAML parsing, then
+read individual agent bodies by seeking straight to them.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from claude_mpm_agents.blocks import BlockStore, find_block_refs, reassemble
+from claude_mpm_agents.frontmatter import scan_frontmatter
+from claude_mpm_agents.output import write_if_changed
+from claude_mpm_agents.yaml_loader import parse_frontmatter
+
+INDEX_FILENAME = "agents.index.json"
+INDEX_VERSION = 1
+
+# Frontmatter fields promoted to the top level of each index entry
+INDEX_FIELDS = ("agent_id", "agent_type", "name", "version", "resource_tier", "tags", "skills")
+
+
+def build_index_entry(
+    content: str, output_path: str, source_path: str, inheritance: list[str]
+) -> dict[str, Any]:
+    """Build the index entry for one built agent.
+
+    Args:
+        content: Built agent content as written to disk
+        output_path: Output path relative to the output directory
+        source_path: Source agent path relative to agents/
+        inheritance: BASE-AGENT.md paths (relative to agents/) in inheritance order
+
+    Returns:
+        JSON-serializable index entry
+    """
+    data = content.encode("utf-8")
+    span = scan_frontmatter(data)
+
+    frontmatter: dict[str, Any] = {}
+    if span is not None:
+        parsed = parse_frontmatter(span.frontmatter(data).decode("utf-8"))
+        if isinstance(parsed, dict):
+            frontmatter = parsed
+
+    entry: dict[str, Any] = {key: frontmatter.get(key) for key in INDEX_FIELDS}
+    entry["agent_id"] = entry["agent_id"] or Path(source_path).stem
+    entry.update(
+        {
+            "path": output_path,
+            "source": source_path,
+            "inheritance": inheritance,
+            "size": len(data),
+            "frontmatter_offset": [span.frontmatter_start, span.frontmatter_end] if span else None,
+            "body_offset": span.body_start if span else 0,
+            "frontmatter": frontmatter,
+        }
+    )
+    # Round-trip through JSON so dates and other YAML types match what is written
+    return json.loads(json.dumps(entry, default=str))
+
+
+def write_index(index_path: Path, entries: list[dict[str, Any]], schema_version: str) -> Path:
+    """Write the agent index, leaving the file untouched if nothing changed.
+
+    Args:
+        index_path: Path of the index file
+        entries: Index entries, one per built agent
+        schema_version: Agent schema version the index was built against
+
+    Returns:
+        Path to the written index
+    """
+    payload = {
+        "version": INDEX_VERSION,
+        "schema_version": schema_version,
+        "agents": sorted(entries, key=lambda entry: entry["path"]),
+    }
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(index_path, json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n")
+    return index_path
+
+
+@dataclass
+class AgentIndex:
+    """In-memory view of an agents.index.json file."""
+
+    path: Path
+    agents: list[dict[str, Any]]
+    schema_version: str = ""
+    _by_id: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self._by_id = {entry["agent_id"]: entry for entry in self.agents}
+
+    @property
+    def output_dir(self) -> Path:
+        """Directory containing the built agents."""
+        return self.path.parent
+
+    def get(self, agent_id: str) -> Optional[dict[str, Any]]:
+        """Look up an agent entry by agent_id."""
+        return self._by_id.get(agent_id)
+
+    def by_type(self, agent_type: str) -> list[dict[str, Any]]:
+        """Get all entries of an agent type."""
+        return [entry for entry in self.agents if entry["agent_type"] == agent_type]
+
+    def read_body(self, agent_id: str) -> str:
+        """Read an agent's built body by seeking to its recorded offset.
+
+        Args:
+            agent_id: Agent identifier
+
+        Returns:
+            Body text of the built agent, with shared blocks reassembled
+
+        Raises:
+            KeyError: If the agent is not in the index
+        """
+        entry = self._by_id[agent_id]
+        with open(self.output_dir / entry["path"], "rb") as f:
+            f.seek(entry["body_offset"])
+            body = f.read().decode("utf-8")
+        # Deduplicated builds reference shared base blocks instead of embedding them
+        if find_block_refs(body):
+            body = reassemble(body, BlockStore(self.output_dir))
+        return body
+
+
+def load_index(index_path: Path) -> AgentIndex:
+    """Load an agent index with a single read.
+
+    Args:
+        index_path: Path to agents.index.json
+
+    Returns:
+        AgentIndex
+
+    Raises:
+        ValueError: If the index version is not supported
+    """
+    data = json.loads(Path(index_path).read_text(encoding="utf-8"))
+    if data.get("version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported agent index version in {index_path}: {data.get('version')}")
+    return AgentIndex(
+        path=Path(index_path),
+        agents=data.get("agents", []),
+        schema_version=data.get("schema_version", ""),
+    )
@@ -0,0 +1,123 @@
+"""Content-addressed storage of shared BASE-AGENT blocks.
+
+In the deduplicated output format (``build-agent.py --all --dedup``) each
+inherited BASE-AGENT.md body is written once to ``_blocks/<sha256>.md`` in the
+output directory, and built agents carry a one-line reference in its place::
+
+    <!-- @block 3f2a...e9 -->
+
+``reassemble`` and ``BlockLoader`` substitute the references back, producing
+exactly the content the regular build writes.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Optional, Union
+
+from claude_mpm_agents.output import OutputWriter
+
+BLOCKS_DIRNAME = "_blocks"
+BLOCK_SUFFIX = ".md"
+
+BLOCK_REF_PATTERN = re.compile(r"^<!-- @block ([0-9a-f]{64}) -->$", re.MULTILINE)
+
+
+def block_digest(text: str) -> str:
+    """Content address of a block (hex sha256 of its UTF-8 bytes)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def block_ref(digest: str) -> str:
+    """Reference line that stands in for a stored block."""
+    return f"<!-- @block {digest} -->"
+
+
+def block_relative_path(digest: str) -> str:
+    """Path of a block relative to the output directory."""
+    return f"{BLOCKS_DIRNAME}/{digest}{BLOCK_SUFFIX}"
+
+
+def find_block_refs(content: str) -> list[str]:
+    """Get the digests referenced by built content, in order of appearance."""
+    return BLOCK_REF_PATTERN.findall(content)
+
+
+class BlockStore:
+    """Blocks stored by content hash under ``<output_dir>/_blocks``."""
+
+    def __init__(self, output_dir: Path, writer: Optional[OutputWriter] = None):
+        self.root = Path(output_dir) / BLOCKS_DIRNAME
+        self.writer = writer or OutputWriter()
+        self._stored: set[str] = set()
+        self._cache: dict[str, str] = {}
+
+    def path_for(self, digest: str) -> Path:
+        """Get the file path of a block."""
+        return self.root / f"{digest}{BLOCK_SUFFIX}"
+
+    def put(self, text: str) -> str:
+        """Store a block (once per store instance) and return its digest."""
+        digest = block_digest(text)
+        if digest not in self._stored:
+            self.writer.write(self.path_for(digest), text)
+            self._stored.add(digest)
+            self._cache[digest] = text
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Read a block by digest.
+
+        Raises:
+            KeyError: If the block is missing or does not match its digest
+        """
+        text = self._cache.get(digest)
+        if text is None:
+            try:
+                text = self.path_for(digest).read_text(encoding="utf-8")
+            except OSError:
+                raise KeyError(f"Missing block {digest} in {self.root}") from None
+            if block_digest(text) != digest:
+                raise KeyError(f"Corrupt block {digest} in {self.root}")
+            self._cache[digest] = text
+        return text
+
+    def prune(self, referenced: set[str]) -> list[Path]:
+        """Delete stored blocks that no agent references any more.
+
+        Returns:
+            Paths of removed block files
+        """
+        removed = []
+        if self.root.is_dir():
+            for path in self.root.glob(f"*{BLOCK_SUFFIX}"):
+                if path.stem not in referenced:
+                    path.unlink()
+                    removed.append(path)
+        self._stored -= {path.stem for path in removed}
+        return removed
+
+
+def reassemble(content: str, store: BlockStore) -> str:
+    """Replace block references in built content with the stored blocks."""
+    return BLOCK_REF_PATTERN.sub(lambda match: store.get(match.group(1)), content)
+
+
+class BlockLoader:
+    """Loads agents from a deduplicated output directory on demand."""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.store = BlockStore(self.output_dir)
+
+    def load(self, relative_path: Union[str, Path]) -> str:
+        """Load a built agent with its blocks reassembled.
+
+        Args:
+            relative_path: Agent output path relative to the output directory
+
+        Returns:
+            Full agent content, identical to the non-deduplicated build
+        """
+        content = (self.output_dir / relative_path).read_text(encoding="utf-8")
+        return reassemble(content, self.store)
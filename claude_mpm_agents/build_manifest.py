@@ -0,0 +1,132 @@
+"""Build manifest (``MANIFEST.json``) with per-output digests.
+
+``build-agent.py --all`` writes the manifest next to the built agents. Every
+built agent is listed with the sha256 and size of its output, its agent_id and
+version, and the sha256 of each BASE-AGENT.md that was inherited into it.
+
+A consumer that keeps the manifest from its last sync can find every added,
+changed and removed agent with one manifest download and ``diff_manifests``,
+instead of one conditional request per file.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from claude_mpm_agents.output import write_if_changed
+
+MANIFEST_FILENAME = "MANIFEST.json"
+MANIFEST_VERSION = 1
+
+
+def build_manifest_entry(
+    content: Union[str, bytes],
+    agent_id: str,
+    version: Optional[str],
+    bases: list[tuple[str, str]],
+    blocks: Optional[list[str]] = None,
+) -> dict[str, Any]:
+    """Build the manifest entry for one built agent.
+
+    Args:
+        content: Built agent content as written to disk
+        agent_id: Agent identifier
+        version: Agent version from frontmatter (None if unset)
+        bases: (path relative to agents/, sha256) of each inherited
+            BASE-AGENT.md, in inheritance order
+        blocks: Digests of the shared blocks the output references, for
+            deduplicated builds
+
+    Returns:
+        JSON-serializable manifest entry
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    entry = {
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "size": len(data),
+        "agent_id": agent_id,
+        "version": version,
+        "bases": [{"path": path, "sha256": digest} for path, digest in bases],
+    }
+    if blocks is not None:
+        entry["blocks"] = blocks
+    return entry
+
+
+def write_manifest(
+    manifest_path: Path, entries: dict[str, dict[str, Any]], schema_version: str
+) -> Path:
+    """Write the build manifest, leaving the file untouched if nothing changed.
+
+    Args:
+        manifest_path: Path of the manifest file
+        entries: Manifest entries keyed by output path relative to the output directory
+        schema_version: Agent schema version the outputs were built against
+
+    Returns:
+        Path to the written manifest
+    """
+    payload = {
+        "version": MANIFEST_VERSION,
+        "schema_version": schema_version,
+        "agents": dict(sorted(entries.items())),
+    }
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(manifest_path, json.dumps(payload, indent=2) + "\n")
+    return manifest_path
+
+
+def load_manifest(manifest_path: Path) -> dict[str, dict[str, Any]]:
+    """Load the agent entries of a build manifest.
+
+    Args:
+        manifest_path: Path to MANIFEST.json
+
+    Returns:
+        Manifest entries keyed by output path
+
+    Raises:
+        ValueError: If the manifest version is not supported
+    """
+    data = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+    if data.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version in {manifest_path}: {data.get('version')}")
+    return data.get("agents", {})
+
+
+@dataclass
+class ManifestDiff:
+    """Differences between two build manifests, as output paths."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def to_fetch(self) -> list[str]:
+        """Outputs a consumer has to download."""
+        return sorted(self.added + self.changed)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def diff_manifests(old: dict[str, dict[str, Any]], new: dict[str, dict[str, Any]]) -> ManifestDiff:
+    """Compare two sets of manifest entries by output digest.
+
+    Args:
+        old: Entries the consumer already has (e.g. from its last sync)
+        new: Entries of the current build
+
+    Returns:
+        ManifestDiff with sorted output paths
+    """
+    return ManifestDiff(
+        added=sorted(new.keys() - old.keys()),
+        changed=sorted(
+            path for path in new.keys() & old.keys() if new[path]["sha256"] != old[path]["sha256"]
+        ),
+        removed=sorted(old.keys() - new.keys()),
+    )
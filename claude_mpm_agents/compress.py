@@ -0,0 +1,514 @@
+"""Deterministic prompt compression for built agents (``--compress``).
+
+Applies the mechanical subset of the caveman-prompt-compression skill
+(skills/caveman-prompt-compression/SKILL.md) to compiled agents:
+
+- collapse whitespace: trailing spaces, runs of inner spaces, and runs of
+  blank lines
+- drop HTML comments, including the ``<!-- Inherited from ... -->`` markers
+- strip decorative emoji (pictographs in headings and prose); status marks
+  that carry meaning (✅ ❌ ⚠️ ✓ ...) are kept
+- drop sections and bullet rules repeated (exactly or in slightly different
+  words) across BASE-AGENT.md levels, keeping the most specific copy, and
+  merge sections whose headings match into the more specific one
+  (``dedupe_hierarchy``, also available on its own as ``--dedupe-bases``)
+
+Fenced code blocks are never modified. Every pass is a pure function of the
+source, so the verbatim build can always be regenerated from it. Wording is
+never rewritten, so on an already tidy catalog the savings are small and
+come mostly from whitespace and comments.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional
+
+FENCE = re.compile(r"^\s*(```|~~~)")
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+BULLET = re.compile(r"^(\s*)(?:[-*+]|\d+[.)])\s+(.*\S)\s*$")
+HEADING = re.compile(r"^(#{1,6})\s+\S")
+
+# Status marks that change meaning when removed
+SEMANTIC_EMOJI = frozenset("✅❌⚠✓✔✗✘⛔🚫")
+_EMOJI = re.compile(r"[\U0001F000-\U0001FAFF☀-➿⭐⭕][️‍]?")
+_INNER_SPACES = re.compile(r"(?<=\S) {2,}")
+_BLANK_RUNS = re.compile(r"\n{3,}")
+
+# Bullet rules at least this similar (difflib ratio of their words) are duplicates
+NEAR_DUPLICATE_RATIO = 0.88
+# Shorter rules are only duplicates when their words are identical
+MIN_SIMILAR_WORDS = 3
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "and",
+        "or",
+        "of",
+        "to",
+        "in",
+        "on",
+        "for",
+        "with",
+        "by",
+        "at",
+        "as",
+        "is",
+        "are",
+        "be",
+        "it",
+        "its",
+        "this",
+        "that",
+        "these",
+        "those",
+        "from",
+        "via",
+        "into",
+    }
+)
+# Words that invert a rule; similar rules must use the same ones
+_NEGATIONS = frozenset(
+    {
+        "no",
+        "not",
+        "never",
+        "none",
+        "nor",
+        "without",
+        "avoid",
+        "skip",
+        "ignore",
+        "don",
+        "doesn",
+        "didn",
+        "isn",
+        "aren",
+        "won",
+        "shouldn",
+        "mustn",
+        "cannot",
+    }
+)
+
+
+def split_code_blocks(text: str) -> list[tuple[bool, str]]:
+    """Split markdown into prose and fenced code segments.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List of (is_code, segment) in document order; joining the segments
+        gives back the original text
+    """
+    segments: list[tuple[bool, str]] = []
+    current: list[str] = []
+    in_code = False
+    for line in text.splitlines(keepends=True):
+        if FENCE.match(line):
+            if in_code:
+                current.append(line)
+                segments.append((True, "".join(current)))
+                current = []
+                in_code = False
+                continue
+            if current:
+                segments.append((False, "".join(current)))
+            current = [line]
+            in_code = True
+            continue
+        current.append(line)
+    if current:
+        segments.append((in_code, "".join(current)))
+    return segments
+
+
+def _map_prose(text: str, transform: Callable[[str], str]) -> str:
+    return "".join(
+        segment if is_code else transform(segment) for is_code, segment in split_code_blocks(text)
+    )
+
+
+def strip_html_comments(text: str) -> str:
+    """Remove HTML comments outside code blocks."""
+    return _map_prose(text, lambda prose: HTML_COMMENT.sub("", prose))
+
+
+def _strip_emoji(prose: str) -> str:
+    def replace(match: re.Match) -> str:
+        return match.group() if match.group()[0] in SEMANTIC_EMOJI else ""
+
+    lines = []
+    for line in prose.split("\n"):
+        stripped = _EMOJI.sub(replace, line)
+        if stripped != line:
+            # Tidy the gap an emoji leaves after a heading or bullet marker
+            stripped = re.sub(r"^(\s*(?:#+|[-*+]|\d+[.)])) +", r"\1 ", stripped)
+            stripped = re.sub(r"(?<=\S) {2,}", " ", stripped).rstrip()
+            if not stripped.strip() and line.strip():
+                continue
+        lines.append(stripped)
+    return "\n".join(lines)
+
+
+def strip_decorative_emoji(text: str) -> str:
+    """Remove pictographic emoji outside code blocks, keeping status marks."""
+    return _map_prose(text, _strip_emoji)
+
+
+def _collapse(prose: str) -> str:
+    lines = [_INNER_SPACES.sub(" ", line.rstrip()) for line in prose.split("\n")]
+    return _BLANK_RUNS.sub("\n\n", "\n".join(lines))
+
+
+def collapse_whitespace(text: str) -> str:
+    """Collapse trailing and repeated spaces and runs of blank lines in prose."""
+    return _map_prose(text, _collapse).strip()
+
+
+def compress_markdown(text: str) -> str:
+    """Apply the per-document compression passes to markdown text."""
+    text = strip_html_comments(text)
+    text = strip_decorative_emoji(text)
+    return collapse_whitespace(text)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize markdown text for exact duplicate detection.
+
+    Ignores case, spacing, punctuation (including emphasis and code markers),
+    emoji, and list and heading markers. Rules that differ by more than that
+    are compared with similar_rules.
+    """
+    lines = []
+    for line in text.split("\n"):
+        line = _EMOJI.sub("", line)
+        line = re.sub(r"^\s*(?:#{1,6}|[-*+]|\d+[.)])\s+", "", line)
+        line = re.sub(r"[^\w\s]+|_", " ", line)
+        line = re.sub(r"\s+", " ", line).strip().lower()
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha1(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class RuleWords(NamedTuple):
+    """The words of a bullet rule that similar_rules compares."""
+
+    words: tuple[str, ...]  # Normalized words in order, stopwords left out
+    negations: frozenset[str]
+    numbers: frozenset[str]
+
+
+def rule_words(text: str) -> RuleWords:
+    """Get the comparable words of a bullet rule."""
+    words = tuple(word for word in normalize_text(text).split() if word not in _STOPWORDS)
+    return RuleWords(
+        words,
+        frozenset(word for word in words if word in _NEGATIONS),
+        frozenset(word for word in words if any(c.isdigit() for c in word)),
+    )
+
+
+def similar_rules(a: RuleWords, b: RuleWords) -> bool:
+    """Check whether two bullet rules say the same thing in slightly different words.
+
+    The words must match in order with a difflib ratio of at least
+    NEAR_DUPLICATE_RATIO ("Engineer → Security (for auth/crypto changes)" vs
+    "Engineer → Security: After auth/crypto changes"). Rules with different
+    negations or numbers never match, since similar-looking rules often say
+    opposite things ("skip error handling" vs "improve error handling").
+    """
+    if a.words == b.words:
+        return bool(a.words)
+    if a.negations != b.negations or a.numbers != b.numbers:
+        return False
+    shorter, longer = sorted((len(a.words), len(b.words)))
+    if shorter < MIN_SIMILAR_WORDS or 2 * shorter / (shorter + longer) < NEAR_DUPLICATE_RATIO:
+        return False
+    matcher = SequenceMatcher(None, a.words, b.words, autojunk=False)
+    return matcher.ratio() >= NEAR_DUPLICATE_RATIO
+
+
+@lru_cache(maxsize=4096)
+def _heading_words(line: str) -> tuple[str, ...]:
+    return tuple(normalize_text(line).split())
+
+
+def headings_match(ancestor: str, descendant: str) -> bool:
+    """Check whether a more specific heading covers a less specific one.
+
+    True for equal headings ("## Handoff Protocol"), and for a heading of two
+    or more words that the more specific heading contains ("Quality
+    Standards" in "Test Quality Standards").
+    """
+    words, other = _heading_words(ancestor), _heading_words(descendant)
+    if words == other:
+        return bool(words)
+    return len(words) >= 2 and any(
+        other[i : i + len(words)] == words for i in range(len(other) - len(words) + 1)
+    )
+
+
+class Removal(NamedTuple):
+    """A duplicate section or rule dropped from a less specific document."""
+
+    kind: str  # "section", "rule", or "merged" (section moved under a matching heading)
+    text: str  # Heading or bullet line that was removed
+    removed_from: int  # Index of the document it was removed from
+    kept_in: int  # Index of the more specific document that keeps it
+
+
+def _code_mask(lines: list[str]) -> list[bool]:
+    mask = []
+    in_code = False
+    for line in lines:
+        fence = bool(FENCE.match(line))
+        mask.append(in_code or fence)
+        if fence:
+            in_code = not in_code
+    return mask
+
+
+def _sections(lines: list[str], code: list[bool]) -> list[tuple[int, int]]:
+    """Get (start, end) line ranges of every heading's section, nested ones included."""
+    headings = [
+        (i, len(match.group(1)))
+        for i, line in enumerate(lines)
+        if not code[i] and (match := HEADING.match(line))
+    ]
+    sections = []
+    for n, (start, level) in enumerate(headings):
+        end = next((i for i, lvl in headings[n + 1 :] if lvl <= level), len(lines))
+        sections.append((start, end))
+    return sections
+
+
+def _is_leaf(lines: list[str], index: int, indent: int) -> bool:
+    following = next((line for line in lines[index + 1 :] if line.strip()), "")
+    return len(following) - len(following.lstrip()) <= indent
+
+
+class _RuleIndex:
+    """Bullet rules of more specific documents, looked up exactly or by similar words."""
+
+    def __init__(self) -> None:
+        self._exact: dict[str, int] = {}
+        self._rules: list[tuple[RuleWords, int]] = []
+        self._by_word: dict[str, list[int]] = {}
+
+    def find(self, key: str, words: RuleWords) -> Optional[int]:
+        """Get the index of the document holding a copy of a rule, if any."""
+        if key in self._exact:
+            return self._exact[key]
+        # A similar rule shares most of its words, so only rules sharing one are compared
+        candidates = sorted({n for word in set(words.words) for n in self._by_word.get(word, ())})
+        for n in candidates:
+            other, kept_in = self._rules[n]
+            if similar_rules(words, other):
+                return kept_in
+        return None
+
+    def add(self, key: str, words: RuleWords, kept_in: int) -> None:
+        """Record a rule kept in a document."""
+        self._exact.setdefault(key, kept_in)
+        for word in set(words.words):
+            self._by_word.setdefault(word, []).append(len(self._rules))
+        self._rules.append((words, kept_in))
+
+
+def _shift_heading(line: str, shift: int) -> str:
+    match = HEADING.match(line)
+    if not match or not shift:
+        return line
+    level = min(6, max(2, len(match.group(1)) + shift))
+    return "#" * level + line[len(match.group(1)) :]
+
+
+def _subheadings(document: str) -> list[str]:
+    """Get the level 2+ heading lines of a document, outside code blocks."""
+    lines = document.split("\n")
+    code = _code_mask(lines)
+    return [
+        line
+        for i, line in enumerate(lines)
+        if not code[i] and HEADING.match(line) and line.startswith("##")
+    ]
+
+
+def _merge_into(document: str, heading: str, content: list[str]) -> Optional[str]:
+    """Append a section's content to the section of a document its heading matches.
+
+    Args:
+        document: More specific document
+        heading: Heading line of the section being merged (level 2 or deeper)
+        content: Lines of the section below its heading
+
+    Returns:
+        The merged document, or None if no level 2+ heading of it matches
+        (see headings_match; an equal heading is preferred)
+    """
+    lines = document.split("\n")
+    code = _code_mask(lines)
+    matches = [
+        (start, end)
+        for start, end in _sections(lines, code)
+        if lines[start].startswith("##") and headings_match(heading, lines[start])
+    ]
+    if not matches:
+        return None
+    equal = [m for m in matches if _heading_words(lines[m[0]]) == _heading_words(heading)]
+    start, end = (equal or matches)[0]
+
+    # Subsections keep their depth relative to the heading they move under
+    shift = len(HEADING.match(lines[start]).group(1)) - len(HEADING.match(heading).group(1))
+    content_code = _code_mask(content)
+    moved = "\n".join(
+        line if content_code[i] else _shift_heading(line, shift) for i, line in enumerate(content)
+    ).strip("\n")
+    while end > start + 1 and not lines[end - 1].strip():
+        end -= 1
+    merged = "\n".join(lines[:end]) + "\n\n" + moved + "\n" + "\n".join(lines[end:])
+    return _BLANK_RUNS.sub("\n\n", merged)
+
+
+def dedupe_hierarchy(documents: list[str]) -> tuple[list[str], list[Removal]]:
+    """Drop sections and bullet rules a more specific document repeats.
+
+    Documents are ordered from least to most specific (root BASE-AGENT.md
+    first). A section (heading through its last line, subsections included)
+    whose normalized text also appears in a later document, or a leaf bullet
+    that a later document repeats exactly or in similar words (see
+    similar_rules), is removed from the earlier one, so the most specific copy
+    is kept. Headings left without content by removed bullets are dropped too.
+    What remains of a section whose heading matches a heading of a later
+    document (see headings_match; top-level titles excepted) is moved to the
+    end of that section, so the heading appears once. Fenced code blocks are
+    only ever removed or moved as part of a whole section.
+
+    Args:
+        documents: Markdown documents, least specific first
+
+    Returns:
+        (deduplicated documents, removals in document order)
+    """
+    seen_sections: dict[str, int] = {}
+    seen_rules = _RuleIndex()
+    headings: dict[int, list[str]] = {}  # Subheadings of result[i], recomputed after merges
+    removals: list[Removal] = []
+    result = list(documents)
+
+    for index in reversed(range(len(documents))):
+        lines = documents[index].split("\n")
+        code = _code_mask(lines)
+        sections = _sections(lines, code)
+        drop = [False] * len(lines)
+        kept_in = [index] * len(lines)  # Document each remaining line ends up in
+        found: list[Removal] = []
+        section_keys = []
+
+        for start, end in sections:
+            body = "\n".join(lines[start + 1 : end])
+            if drop[start] or not body.strip():
+                continue
+            key = _fingerprint("\n".join(lines[start:end]))
+            if key in seen_sections:
+                drop[start:end] = [True] * (end - start)
+                found.append(Removal("section", lines[start].strip(), index, seen_sections[key]))
+            else:
+                section_keys.append((key, start))
+
+        rule_keys = []
+        for i, line in enumerate(lines):
+            match = BULLET.match(line)
+            if drop[i] or code[i] or not match or not _is_leaf(lines, i, len(match.group(1))):
+                continue
+            key = _fingerprint(match.group(2))
+            words = rule_words(match.group(2))
+            copy = seen_rules.find(key, words)
+            if copy is not None:
+                drop[i] = True
+                found.append(Removal("rule", line.strip(), index, copy))
+            else:
+                rule_keys.append((key, words, i))
+
+        # Headings whose content was removed piecemeal
+        for start, end in sections:
+            if any(drop[start:end]) and all(
+                drop[i] or not lines[i].strip() or (not code[i] and HEADING.match(lines[i]))
+                for i in range(start, end)
+            ):
+                drop[start:end] = [True] * (end - start)
+
+        # Sections that share a heading with a more specific document
+        for start, end in sections:
+            if drop[start] or not lines[start].startswith("##"):
+                continue
+            for later in reversed(range(index + 1, len(documents))):
+                if later not in headings:
+                    headings[later] = _subheadings(result[later])
+                if not any(headings_match(lines[start], h) for h in headings[later]):
+                    continue
+                content = [lines[i] for i in range(start + 1, end) if not drop[i]]
+                merged = _merge_into(result[later], lines[start], content)
+                if merged is not None:
+                    result[later] = merged
+                    del headings[later]
+                    drop[start:end] = [True] * (end - start)
+                    kept_in[start:end] = [later] * (end - start)
+                    found.append(Removal("merged", lines[start].strip(), index, later))
+                    break
+
+        for key, start in section_keys:
+            seen_sections.setdefault(key, kept_in[start])
+        for key, words, i in rule_keys:
+            seen_rules.add(key, words, kept_in[i])
+        result[index] = _BLANK_RUNS.sub(
+            "\n\n", "\n".join(line for line, dropped in zip(lines, drop) if not dropped)
+        )
+        removals[:0] = found
+
+    return result, removals
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    """Size of one agent before and after compression."""
+
+    bytes_before: int
+    bytes_after: int
+    tokens_before: int
+    tokens_after: int
+    duplicates_removed: int = 0
+
+    @property
+    def bytes_saved_pct(self) -> float:
+        return 100.0 * (1 - self.bytes_after / self.bytes_before) if self.bytes_before else 0.0
+
+    @property
+    def tokens_saved_pct(self) -> float:
+        return 100.0 * (1 - self.tokens_after / self.tokens_before) if self.tokens_before else 0.0
+
+
+def compression_stats(
+    original: str,
+    compressed: str,
+    count_tokens: Callable[[str], int],
+    duplicates_removed: int = 0,
+) -> CompressionStats:
+    """Measure byte and token savings of a compressed agent."""
+    return CompressionStats(
+        bytes_before=len(original.encode("utf-8")),
+        bytes_after=len(compressed.encode("utf-8")),
+        tokens_before=count_tokens(original),
+        tokens_after=count_tokens(compressed),
+        duplicates_removed=duplicates_removed,
+    )
@@ -0,0 +1,230 @@
+"""SQLite-backed etag cache for per-URL agent downloads.
+
+``.etag-cache.json`` keys every entry by its full raw.githubusercontent.com
+URL and is rewritten whole on each sync. ``EtagCache`` stores each URL prefix
+(everything up to the last ``/``) once in a ``prefixes`` table, keeps entries
+in a ``WITHOUT ROWID`` table keyed by (prefix id, file name), and updates
+single entries in place.
+
+``migrate_json_cache`` imports an existing JSON cache in one transaction and
+renames it to ``.etag-cache.json.migrated``. It refuses to run when that file
+already exists unless asked to overwrite it, so the etags of an earlier
+migration are neither lost by accident nor merged back in.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple, Optional, TypeVar, Union
+
+JSON_CACHE_FILENAME = ".etag-cache.json"
+SQLITE_CACHE_FILENAME = ".etag-cache.sqlite"
+MIGRATED_SUFFIX = ".migrated"
+PAGE_SIZE = 1024
+
+# Self type for EtagCache (typing.Self needs Python 3.11)
+_EtagCacheT = TypeVar("_EtagCacheT", bound="EtagCache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prefixes (
+    id INTEGER PRIMARY KEY,
+    prefix TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS entries (
+    prefix_id INTEGER NOT NULL REFERENCES prefixes(id),
+    name TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    file_size INTEGER,
+    PRIMARY KEY (prefix_id, name)
+) WITHOUT ROWID;
+"""
+
+
+class EtagEntry(NamedTuple):
+    """Cached validators for one URL."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    file_size: Optional[int]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the entry layout used by .etag-cache.json."""
+        return self._asdict()
+
+
+def split_url(url: str) -> tuple[str, str]:
+    """Split a URL into the shared prefix (through the last ``/``) and file name."""
+    prefix, _, name = url.rpartition("/")
+    return prefix + "/", name
+
+
+class EtagCache:
+    """Etag cache stored in a SQLite database.
+
+    Can be used as a context manager; every ``set``/``delete`` commits on its
+    own, so no explicit save step is needed.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path)
+        # Small pages keep a cache of a few hundred entries compact; only
+        # takes effect when the database is created
+        self._conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._prefix_ids: dict[str, int] = dict(
+            self._conn.execute("SELECT prefix, id FROM prefixes")
+        )
+
+    def __enter__(self: _EtagCacheT) -> _EtagCacheT:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def compact(self) -> None:
+        """Rebuild the database file without free pages (e.g. after bulk imports)."""
+        self._conn.execute("VACUUM")
+
+    def _prefix_id(self, prefix: str, create: bool) -> Optional[int]:
+        prefix_id = self._prefix_ids.get(prefix)
+        if prefix_id is None and create:
+            cursor = self._conn.execute("INSERT INTO prefixes (prefix) VALUES (?)", (prefix,))
+            prefix_id = self._prefix_ids[prefix] = cursor.lastrowid
+        return prefix_id
+
+    def get(self, url: str) -> Optional[EtagEntry]:
+        """Look up the cached validators for a URL."""
+        prefix, name = split_url(url)
+        prefix_id = self._prefix_id(prefix, create=False)
+        if prefix_id is None:
+            return None
+        row = self._conn.execute(
+            "SELECT etag, last_modified, file_size FROM entries WHERE prefix_id = ? AND name = ?",
+            (prefix_id, name),
+        ).fetchone()
+        return EtagEntry(*row) if row else None
+
+    def set(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str] = None,
+        file_size: Optional[int] = None,
+    ) -> None:
+        """Insert or update the entry for one URL."""
+        self.set_many({url: EtagEntry(etag, last_modified, file_size)})
+
+    def set_many(self, entries: dict[str, EtagEntry]) -> None:
+        """Insert or update several entries in one transaction."""
+        try:
+            with self._conn:
+                rows = []
+                for url, entry in entries.items():
+                    prefix, name = split_url(url)
+                    rows.append((self._prefix_id(prefix, create=True), name, *entry))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries"
+                    " (prefix_id, name, etag, last_modified, file_size) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error:
+            # Prefixes inserted by the rolled-back transaction are gone again
+            self._prefix_ids = dict(self._conn.execute("SELECT prefix, id FROM prefixes"))
+            raise
+
+    def delete(self, url: str) -> bool:
+        """Remove the entry for a URL.
+
+        Returns:
+            True if an entry was removed
+        """
+        prefix, name = split_url(url)
+        prefix_id = self._prefix_id(prefix, create=False)
+        if prefix_id is None:
+            return False
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE prefix_id = ? AND name = ?", (prefix_id, name)
+            )
+        return cursor.rowcount > 0
+
+    def items(self) -> Iterator[tuple[str, EtagEntry]]:
+        """Iterate over (url, entry) pairs."""
+        rows = self._conn.execute(
+            "SELECT p.prefix || e.name, e.etag, e.last_modified, e.file_size"
+            " FROM entries e JOIN prefixes p ON p.id = e.prefix_id ORDER BY 1"
+        )
+        for url, *entry in rows:
+            yield url, EtagEntry(*entry)
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and self.get(url) is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Export in the .etag-cache.json layout."""
+        return {url: entry.to_dict() for url, entry in self.items()}
+
+
+def read_json_cache(json_path: Union[str, Path]) -> dict[str, EtagEntry]:
+    """Read the entries of a .etag-cache.json file.
+
+    Raises:
+        ValueError: If the JSON cache is not an object of URL -> entry
+    """
+    json_path = Path(json_path)
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"Unexpected etag cache format in {json_path}")
+    return {
+        url: EtagEntry(entry.get("etag"), entry.get("last_modified"), entry.get("file_size"))
+        for url, entry in data.items()
+        if isinstance(entry, dict)
+    }
+
+
+def migrate_json_cache(
+    json_path: Union[str, Path],
+    db_path: Optional[Union[str, Path]] = None,
+    rename: bool = True,
+    overwrite: bool = False,
+) -> int:
+    """Import a .etag-cache.json file into a SQLite etag cache.
+
+    Args:
+        json_path: Existing JSON cache
+        db_path: SQLite cache to create or update (default: .etag-cache.sqlite
+            next to the JSON file)
+        rename: Rename the JSON file to ``<name>.migrated`` after importing
+        overwrite: Replace an existing ``<name>.migrated`` file when renaming
+
+    Returns:
+        Number of entries imported
+
+    Raises:
+        FileExistsError: If renaming and ``<name>.migrated`` exists (without
+            overwrite); nothing is imported in that case
+        ValueError: If the JSON cache is not an object of URL -> entry
+    """
+    json_path = Path(json_path)
+    migrated = json_path.with_name(json_path.name + MIGRATED_SUFFIX)
+    if rename and not overwrite and migrated.exists():
+        raise FileExistsError(f"{migrated} already exists")
+    entries = read_json_cache(json_path)
+
+    with EtagCache(db_path or json_path.with_name(SQLITE_CACHE_FILENAME)) as cache:
+        cache.set_many(entries)
+        cache.compact()
+
+    if rename:
+        json_path.replace(migrated)
+    return len(entries)
@@ -0,0 +1,147 @@
+"""Line-oriented YAML frontmatter scanning.
+
+Agent, BASE-AGENT.md and skill files start with a YAML block delimited by
+``---`` lines. ``scan_frontmatter`` locates that block by offset instead of
+splitting the whole file with a DOTALL regex, so callers only copy the parts
+they use. It accepts ``str`` or ``bytes``, tolerates a UTF-8 BOM and CRLF line
+endings, and recognises files that contain frontmatter only.
+
+``read_frontmatter`` reads just the frontmatter block from disk and stops at
+the closing delimiter, leaving the body unread.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AnyStr, Optional, Union
+
+DELIMITER = "---"
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+@dataclass(frozen=True)
+class FrontmatterSpan:
+    """Offsets of the frontmatter block and body within a document.
+
+    ``content[frontmatter_start:frontmatter_end]`` is the YAML text (without
+    delimiters) and ``content[body_start:]`` is the body.
+    """
+
+    frontmatter_start: int
+    frontmatter_end: int
+    body_start: int
+
+    def frontmatter(self, content: AnyStr) -> AnyStr:
+        """Slice the frontmatter text out of the scanned content."""
+        return content[self.frontmatter_start : self.frontmatter_end]
+
+    def body(self, content: AnyStr) -> AnyStr:
+        """Slice the body out of the scanned content."""
+        return content[self.body_start :]
+
+
+@dataclass(frozen=True)
+class FrontmatterBlock:
+    """Frontmatter read from disk without reading the body."""
+
+    text: str
+    body_offset: int  # Byte offset of the body within the file
+
+
+def _is_delimiter(line: AnyStr) -> bool:
+    """Check whether a line (without its newline) is a ``---`` delimiter."""
+    if isinstance(line, bytes):
+        return line.rstrip(b"\r") == b"---"
+    return line.rstrip("\r") == DELIMITER
+
+
+def scan_frontmatter(content: AnyStr) -> Optional[FrontmatterSpan]:
+    """Locate the frontmatter block in a document.
+
+    Args:
+        content: Document text or bytes
+
+    Returns:
+        FrontmatterSpan with offsets into content, or None if there is no
+        frontmatter block
+    """
+    is_bytes = isinstance(content, bytes)
+    newline = b"\n" if is_bytes else "\n"
+    length = len(content)
+
+    start = 0
+    if is_bytes and content.startswith(UTF8_BOM):
+        start = len(UTF8_BOM)
+    elif not is_bytes and content.startswith("\ufeff"):
+        start = 1
+
+    first_end = content.find(newline, start)
+    if first_end == -1 or not _is_delimiter(content[start:first_end]):
+        return None
+
+    frontmatter_start = first_end + 1
+    position = frontmatter_start
+    while position < length:
+        line_end = content.find(newline, position)
+        if line_end == -1:
+            line_end = length
+
+        if _is_delimiter(content[position:line_end]):
+            # Exclude the newline (and CR) that precedes the closing delimiter
+            frontmatter_end = max(frontmatter_start, position - 1)
+            if content[frontmatter_end - 1 : frontmatter_end] in (b"\r", "\r"):
+                frontmatter_end = max(frontmatter_start, frontmatter_end - 1)
+            return FrontmatterSpan(
+                frontmatter_start=frontmatter_start,
+                frontmatter_end=frontmatter_end,
+                body_start=min(line_end + 1, length),
+            )
+
+        position = line_end + 1
+
+    return None
+
+
+def split_frontmatter(content: str) -> tuple[str, str]:
+    """Split a document into frontmatter text and body.
+
+    Args:
+        content: Document text
+
+    Returns:
+        Tuple of (frontmatter, body); frontmatter is "" and body is the whole
+        content when there is no frontmatter block
+    """
+    span = scan_frontmatter(content)
+    if span is None:
+        return "", content
+    return span.frontmatter(content), span.body(content)
+
+
+def read_frontmatter(path: Union[str, Path]) -> Optional[FrontmatterBlock]:
+    """Read only the frontmatter block of a file from disk.
+
+    Reading stops at the closing delimiter, so the body is never loaded.
+
+    Args:
+        path: Path to a markdown file
+
+    Returns:
+        FrontmatterBlock, or None if the file has no frontmatter block
+    """
+    with open(path, "rb") as f:
+        first = f.readline().removeprefix(UTF8_BOM)
+        if not first.endswith(b"\n") or not _is_delimiter(first[:-1]):
+            return None
+
+        lines = []
+        while True:
+            line = f.readline()
+            if not line:
+                return None
+            if _is_delimiter(line.rstrip(b"\n")):
+                text = b"".join(lines).decode("utf-8")
+                # Drop the newline that precedes the closing delimiter
+                if text.endswith("\n"):
+                    text = text[:-2] if text.endswith("\r\n") else text[:-1]
+                return FrontmatterBlock(text=text, body_offset=f.tell())
+            lines.append(line)
@@ -0,0 +1,140 @@
+"""Memoized BASE-AGENT.md inheritance resolution.
+
+Every agent inherits the BASE-AGENT.md files of its directory and all parent
+directories up to agents/. Resolving that chain naively costs one ``exists()``
+per ancestor directory plus a read and frontmatter split of every base file,
+repeated for each agent. ``BaseAgentResolver`` caches both per directory so a
+whole build touches each BASE-AGENT.md exactly once.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from claude_mpm_agents.frontmatter import split_frontmatter
+
+BASE_AGENT_FILENAME = "BASE-AGENT.md"
+
+
+@dataclass(frozen=True)
+class BaseAgent:
+    """A parsed BASE-AGENT.md file."""
+
+    path: Path
+    relative: Path  # Path relative to agents/
+    body: str  # Content with frontmatter removed
+    digest: str  # sha256 of the raw file bytes
+
+
+class BaseAgentResolver:
+    """Resolve and cache BASE-AGENT.md inheritance chains for a build."""
+
+    def __init__(
+        self,
+        agents_dir: Path,
+        extract_frontmatter: Callable[[str], tuple[str, str]] = split_frontmatter,
+    ):
+        """Initialize resolver.
+
+        Args:
+            agents_dir: Path to agents directory (inheritance stops here)
+            extract_frontmatter: Function splitting content into (frontmatter, body)
+        """
+        self.agents_dir = Path(agents_dir)
+        self.extract_frontmatter = extract_frontmatter
+        self._chains: dict[Path, tuple[Path, ...]] = {}
+        self._bases: dict[Path, BaseAgent] = {}
+
+    def chain_for_directory(self, directory: Path) -> tuple[Path, ...]:
+        """Get BASE-AGENT.md files inherited by agents in a directory.
+
+        Args:
+            directory: Directory containing agent files
+
+        Returns:
+            Tuple of BASE-AGENT.md paths ordered from agents/ root down
+        """
+        chain = self._chains.get(directory)
+        if chain is not None:
+            return chain
+
+        if directory == self.agents_dir:
+            parent_chain: tuple[Path, ...] = ()
+        elif self.agents_dir in directory.parents:
+            parent_chain = self.chain_for_directory(directory.parent)
+        else:
+            # Outside agents/ - nothing to inherit
+            self._chains[directory] = ()
+            return ()
+
+        base_file = directory / BASE_AGENT_FILENAME
+        chain = parent_chain + (base_file,) if base_file.exists() else parent_chain
+
+        self._chains[directory] = chain
+        return chain
+
+    def find_base_agents(self, agent_path: Path) -> list[Path]:
+        """Find all BASE-AGENT.md files from agent's directory up to agents root.
+
+        Args:
+            agent_path: Path to agent file
+
+        Returns:
+            List of BASE-AGENT.md paths in inheritance order (root first)
+        """
+        return list(self.chain_for_directory(agent_path.parent))
+
+    def get_base(self, base_path: Path) -> BaseAgent:
+        """Read and parse a BASE-AGENT.md file once per resolver.
+
+        Args:
+            base_path: Path to BASE-AGENT.md
+
+        Returns:
+            Parsed BaseAgent
+        """
+        base = self._bases.get(base_path)
+        if base is None:
+            raw = base_path.read_bytes()
+            # Match Path.read_text() universal-newline handling
+            content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            _, body = self.extract_frontmatter(content)
+            base = BaseAgent(
+                path=base_path,
+                relative=base_path.relative_to(self.agents_dir),
+                body=body,
+                digest=hashlib.sha256(raw).hexdigest(),
+            )
+            self._bases[base_path] = base
+        return base
+
+    def resolve(self, agent_path: Path) -> list[BaseAgent]:
+        """Resolve the parsed inheritance chain for an agent.
+
+        Args:
+            agent_path: Path to agent file
+
+        Returns:
+            List of BaseAgent in inheritance order (root first)
+        """
+        chain = self.chain_for_directory(agent_path.parent)
+        return [self.get_base(base_path) for base_path in chain]
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop cached state.
+
+        Args:
+            path: BASE-AGENT.md or directory that changed; clears everything if None
+        """
+        if path is None:
+            self._chains.clear()
+            self._bases.clear()
+            return
+
+        self._bases.pop(path, None)
+        if path.name == BASE_AGENT_FILENAME:
+            # A created or deleted base changes the chain of its whole subtree
+            directory = path.parent
+            for cached_dir in [d for d in self._chains if d == directory or directory in d.parents]:
+                del self._chains[cached_dir]
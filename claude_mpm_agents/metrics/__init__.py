@@ -0,0 +1,7 @@
+"""Custom DeepEval metrics for agent compliance testing.
+
+Used by the pytest suite in tests/ and by scripts/score_transcripts.py. The
+metric classes subclass DeepEval's ``BaseMetric``, so this package needs the
+``test`` extra (``pip install -e ".[test]"``); scoring itself is regex-only
+and needs no model or API key.
+"""
@@ -0,0 +1,145 @@
+"""Batch scoring for the custom compliance metrics.
+
+Each metric implements ``evaluate(output) -> CaseResult``, a pure function of
+the output and the metric's configuration. ``measure`` records one result on
+the metric as DeepEval expects, while ``measure_batch`` scores many cases
+into a columnar ``BatchResult`` without touching the metric's per-case state.
+Batches of at least ``PROCESS_POOL_MIN_BATCH`` cases are spread over a process
+pool; each worker unpickles one copy of the metric, so compiled patterns are
+built once per worker rather than once per case.
+"""
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, NamedTuple, Optional
+
+from deepeval.test_case import LLMTestCase
+
+# Smaller batches are scored in-process; pool startup costs more than it saves
+PROCESS_POOL_MIN_BATCH = 256
+
+EMPTY_OUTPUT = "empty_output"
+
+
+class CaseResult(NamedTuple):
+    """Score of one output."""
+
+    score: float
+    success: bool
+    reason: str
+    violations: tuple[str, ...] = ()  # Human-readable violation messages
+    codes: tuple[str, ...] = ()  # Stable violation codes, one per violation
+
+
+def empty_output_result() -> CaseResult:
+    """Result shared by every metric for an empty output."""
+    return CaseResult(0.0, False, "Empty output", codes=(EMPTY_OUTPUT,))
+
+
+@dataclass
+class BatchResult:
+    """Scores of a batch of outputs, one list entry per case."""
+
+    scores: list[float] = field(default_factory=list)
+    successes: list[bool] = field(default_factory=list)
+    reasons: list[str] = field(default_factory=list)
+    violations: list[tuple[str, ...]] = field(default_factory=list)  # Violation codes
+
+    @classmethod
+    def from_cases(cls, results: Iterable[CaseResult]) -> "BatchResult":
+        """Build columns from per-case results."""
+        batch = cls()
+        for result in results:
+            batch.scores.append(result.score)
+            batch.successes.append(result.success)
+            batch.reasons.append(result.reason)
+            batch.violations.append(result.codes)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @property
+    def passed(self) -> int:
+        """Number of successful cases."""
+        return sum(self.successes)
+
+    @property
+    def pass_rate(self) -> float:
+        """Fraction of successful cases (1.0 for an empty batch)."""
+        return self.passed / len(self) if self.scores else 1.0
+
+    @property
+    def mean_score(self) -> float:
+        """Average score (1.0 for an empty batch)."""
+        return sum(self.scores) / len(self) if self.scores else 1.0
+
+
+class BatchMetricMixin(ABC):
+    """Shared per-case recording, async offloading and batch scoring.
+
+    Metrics define ``evaluate``; ``measure`` and ``a_measure`` stay on each
+    metric class and delegate to ``_record`` and ``_measure_in_executor``.
+    """
+
+    @abstractmethod
+    def evaluate(self, output: str) -> CaseResult:
+        """Score one output without changing the metric's state."""
+
+    def _record(self, result: CaseResult) -> float:
+        self.score = result.score
+        self.success = result.success
+        self.reason = result.reason
+        self.violations = list(result.violations)
+        self.violation_codes = list(result.codes)
+        return result.score
+
+    async def _measure_in_executor(self, test_case: LLMTestCase) -> float:
+        """Run measure on the default executor so the event loop is not blocked."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.measure, test_case)
+
+    def evaluate_batch(self, outputs: list[str], jobs: Optional[int] = None) -> BatchResult:
+        """Score many outputs.
+
+        Args:
+            outputs: Agent outputs, in order
+            jobs: Worker processes (default: CPU count); batches smaller than
+                PROCESS_POOL_MIN_BATCH always run in-process
+
+        Returns:
+            BatchResult in input order
+        """
+        jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+        if jobs <= 1 or len(outputs) < PROCESS_POOL_MIN_BATCH:
+            return BatchResult.from_cases(self.evaluate(output) for output in outputs)
+
+        chunksize = max(1, len(outputs) // (jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            return BatchResult.from_cases(executor.map(_evaluate, outputs, chunksize=chunksize))
+
+    def measure_batch(
+        self, test_cases: Iterable[LLMTestCase], jobs: Optional[int] = None
+    ) -> BatchResult:
+        """Score many test cases (see evaluate_batch)."""
+        return self.evaluate_batch([case.actual_output for case in test_cases], jobs)
+
+
+# Per-process metric used by measure_batch worker processes
+_worker_metric: Optional[BatchMetricMixin] = None
+
+
+def _init_worker(metric: BatchMetricMixin) -> None:
+    """Keep this worker's copy of the metric."""
+    global _worker_metric
+    _worker_metric = metric
+
+
+def _evaluate(output: str) -> CaseResult:
+    """Score one output inside a worker process."""
+    return _worker_metric.evaluate(output)
@@ -1,14 +1,125 @@
 """Custom DeepEval metrics for instruction compliance."""
 
 import re
+import threading
+from collections import OrderedDict
 
 from deepeval.metrics import BaseMetric
 from deepeval.test_case import LLMTestCase
 
-from tests.fixtures.instruction_extractor import ExtractedRule
+from claude_mpm_agents.instruction_extractor import ExtractedRule
+from claude_mpm_agents.metrics.batch import BatchMetricMixin, CaseResult, empty_output_result
+from claude_mpm_agents.metrics.patterns import (
+    RESULT_CACHE_SIZE,
+    PatternSet,
+    ResultCache,
+    patterns_digest,
+    text_digest,
+)
 
+COMPILED_RULES_CACHE_SIZE = 64
 
-class InstructionComplianceMetric(BaseMetric):
+# Per-rule results keyed by (rule-set key, output digest), shared by all metrics
+_results = ResultCache(RESULT_CACHE_SIZE)
+
+
+class CompiledRules:
+    """The patterns of a rule list, compiled once.
+
+    Identical pattern strings shared by several rules are compiled and
+    searched once per output. A rule stops being searched as soon as its
+    outcome is known: after its first positive match, after all its
+    positive patterns miss, or at its first negative match.
+    """
+
+    def __init__(self, rules: list[ExtractedRule]):
+        """Compile rules.
+
+        Args:
+            rules: Rules to check, in order
+        """
+        self.key = rules_digest(rules)
+        index: dict[str, int] = {}
+        self.positive: list[tuple[int, ...]] = []
+        self.negative: list[tuple[int, ...]] = []
+        for rule in rules:
+            self.positive.append(
+                tuple(index.setdefault(p, len(index)) for p in rule.positive_patterns)
+            )
+            self.negative.append(
+                tuple(index.setdefault(p, len(index)) for p in rule.negative_patterns)
+            )
+        self.patterns = PatternSet(list(index))
+
+    def evaluate(self, output: str) -> tuple[bool, ...]:
+        """Check output against every rule.
+
+        A rule passes when at least one positive pattern matches (if it has
+        any) and no negative pattern matches.
+
+        Args:
+            output: Agent output to check
+
+        Returns:
+            Pass/fail per rule, in rule order
+        """
+        cache_key = (self.key, text_digest(output))
+        cached = _results.get(cache_key)
+        if cached is not None:
+            return cached
+
+        matched: dict[int, bool] = {}
+        prepared = self.patterns.prepare(output)
+
+        def hit(index: int) -> bool:
+            if index not in matched:
+                matched[index] = self.patterns.search(index, output, prepared) is not None
+            return matched[index]
+
+        results = tuple(
+            (not positive or any(hit(i) for i in positive)) and not any(hit(i) for i in negative)
+            for positive, negative in zip(self.positive, self.negative)
+        )
+        _results.put(cache_key, results)
+        return results
+
+
+def rules_digest(rules: list[ExtractedRule]) -> bytes:
+    """Hash the ids and patterns of a rule list."""
+    return patterns_digest(
+        [repr((r.rule_id, tuple(r.positive_patterns), tuple(r.negative_patterns))) for r in rules]
+    )
+
+
+_compiled: OrderedDict[bytes, CompiledRules] = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_rules(rules: list[ExtractedRule]) -> CompiledRules:
+    """Get the compiled form of a rule list, compiling it on first use.
+
+    Args:
+        rules: Rules to check
+
+    Returns:
+        CompiledRules shared by every metric with the same rules
+    """
+    key = rules_digest(rules)
+    with _compiled_lock:
+        compiled = _compiled.get(key)
+        if compiled is not None:
+            _compiled.move_to_end(key)
+            return compiled
+
+    compiled = CompiledRules(rules)
+    with _compiled_lock:
+        _compiled[key] = compiled
+        while len(_compiled) > COMPILED_RULES_CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return compiled
+
+
+class InstructionComplianceMetric(BatchMetricMixin, BaseMetric):
     """Metric to check compliance with instruction rules via regex patterns."""
 
     def __init__(
@@ -28,6 +139,7 @@ class InstructionComplianceMetric(BaseMetric):
         self.threshold = threshold
         self.strict_mode = strict_mode
         self.violations: list[str] = []
+        self.violation_codes: list[str] = []
 
     @property
     def __name__(self) -> str:
@@ -42,44 +154,53 @@ class InstructionComplianceMetric(BaseMetric):
         Returns:
             Score between 0.0 and 1.0
         """
-        self.violations = []
-        output = test_case.actual_output
+        return self._record(self.evaluate(test_case.actual_output))
+
+    def evaluate(self, output: str) -> CaseResult:
+        """Score one output against the rules.
+
+        Args:
+            output: Agent output to validate
 
+        Returns:
+            CaseResult; violation codes are the failed rule ids
+        """
         if not output:
-            self.score = 0.0
-            self.success = False
-            self.reason = "Empty output"
-            return self.score
+            return empty_output_result()
 
         passed_rules = 0
         total_rules = len(self.rules)
+        violations = []
+        codes = []
 
-        for rule in self.rules:
-            rule_passed = self._check_rule(output, rule)
+        results = compile_rules(self.rules).evaluate(output)
+        for rule, rule_passed in zip(self.rules, results):
             if rule_passed:
                 passed_rules += 1
             else:
-                self.violations.append(f"{rule.rule_id}: {rule.description}")
+                violations.append(f"{rule.rule_id}: {rule.description}")
+                codes.append(rule.rule_id)
 
         # Calculate score
         if total_rules == 0:
-            self.score = 1.0
+            score = 1.0
         else:
-            self.score = passed_rules / total_rules
+            score = passed_rules / total_rules
 
         # Determine success
         if self.strict_mode:
-            self.success = self.score == 1.0
+            success = score == 1.0
         else:
-            self.success = self.score >= self.threshold
+            success = score >= self.threshold
 
         # Build reason
-        if self.success:
-            self.reason = f"Passed {passed_rules}/{total_rules} rules"
+        if success:
+            reason = f"Passed {passed_rules}/{total_rules} rules"
         else:
-            self.reason = f"Failed {total_rules - passed_rules}/{total_rules} rules: {', '.join(self.violations[:3])}"
+            failed = total_rules - passed_rules
+            reason = f"Failed {failed}/{total_rules} rules: {', '.join(violations[:3])}"
 
-        return self.score
+        return CaseResult(score, success, reason, tuple(violations), tuple(codes))
 
     def _check_rule(self, output: str, rule: ExtractedRule) -> bool:
         """Check if output complies with a single rule.
@@ -91,29 +212,11 @@ class InstructionComplianceMetric(BaseMetric):
         Returns:
             True if rule passes, False otherwise
         """
-        # Check positive patterns (at least one must match)
-        if rule.positive_patterns:
-            has_positive = any(
-                re.search(pattern, output, re.IGNORECASE | re.MULTILINE)
-                for pattern in rule.positive_patterns
-            )
-            if not has_positive:
-                return False
-
-        # Check negative patterns (none should match)
-        if rule.negative_patterns:
-            has_negative = any(
-                re.search(pattern, output, re.IGNORECASE | re.MULTILINE)
-                for pattern in rule.negative_patterns
-            )
-            if has_negative:
-                return False
-
-        return True
+        return compile_rules([rule]).evaluate(output)[0]
 
     async def a_measure(self, test_case: LLMTestCase) -> float:
-        """Async version of measure."""
-        return self.measure(test_case)
+        """Async version of measure, run in an executor."""
+        return await self._measure_in_executor(test_case)
 
     def is_successful(self) -> bool:
         """Check if metric passed."""
@@ -0,0 +1,346 @@
+"""Precompiled regex pattern sets for compliance metrics.
+
+Metrics used to call ``re.search`` on raw pattern strings for every pattern
+of every check, paying a ``re`` module cache lookup per call and keeping no
+record of earlier results. A ``PatternSet`` compiles its patterns once and
+``ResultCache`` keeps results per (pattern-set digest, text digest), so a
+transcript scored twice with the same rules is only scanned once.
+
+Most metric patterns are plain keyword alternations such as
+``(deploy to production|kubectl apply|docker push)``. A ``PatternSet``
+matches those without regex: the text is case-folded once per scan and each
+keyword is located with ``str.find``, which runs the search in C. Only
+patterns with real regex syntax go through ``re``. Either way the reported
+span equals ``re.search(pattern, text, flags).span()``.
+
+Patterns are searched one by one rather than joined into a single
+alternation: CPython's ``re`` is a backtracking engine without a multi-pattern
+DFA, and an alternation loses the per-pattern literal prefix and charset
+skips, which made a combined scan about twice as slow as separate searches on
+the repository's rules.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, NamedTuple, Optional, Sequence
+
+MATCH_FLAGS = re.IGNORECASE | re.MULTILINE
+RESULT_CACHE_SIZE = 8192
+
+Span = tuple[int, int]
+
+# Flags that do not change what a keyword matches
+_KEYWORD_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE
+_REGEX_SYNTAX = set("\\.^$*+?{}[]()|")
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters
+_ASCII_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def keyword_alternatives(pattern: str) -> Optional[tuple[str, ...]]:
+    """Get the keywords of a pattern that is a plain ``(a|b|c)`` alternation.
+
+    Args:
+        pattern: Regex string
+
+    Returns:
+        Keywords in pattern order, or None if the pattern needs regex (any
+        other syntax, an empty alternative, or non-ASCII text)
+    """
+    if pattern.startswith("(") and pattern.endswith(")"):
+        pattern = pattern[1:-1]
+    keywords = tuple(pattern.split("|"))
+    for keyword in keywords:
+        if not keyword or not keyword.isascii() or _REGEX_SYNTAX.intersection(keyword):
+            return None
+    return keywords
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text the way re.IGNORECASE compares it with ASCII keywords.
+
+    The result has the same length as the text, so offsets carry over.
+    """
+    return text.translate(_ASCII_FOLDS).lower()
+
+
+def find_keywords(haystack: str, keywords: Sequence[str]) -> Optional[Span]:
+    """Find the leftmost match of a keyword alternation.
+
+    As with regex alternation, the first keyword (in order) that matches at
+    the leftmost position wins.
+
+    Returns:
+        (start, end) of the match, or None
+    """
+    start = -1
+    for keyword in keywords:
+        # Only occurrences starting before the best one so far matter
+        end = len(haystack) if start < 0 else start + len(keyword) - 1
+        found = haystack.find(keyword, 0, end)
+        if found >= 0:
+            start = found
+    if start < 0:
+        return None
+    for keyword in keywords:
+        if haystack.startswith(keyword, start):
+            return start, start + len(keyword)
+    return None
+
+
+def text_digest(text: str) -> bytes:
+    """Hash a text for use in result cache keys."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def patterns_digest(patterns: Sequence[str], flags: int = MATCH_FLAGS) -> bytes:
+    """Hash a pattern list and its flags."""
+    joined = "\0".join([str(flags), *patterns])
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).digest()
+
+
+class CacheInfo(NamedTuple):
+    """Result cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ResultCache:
+    """Thread-safe bounded LRU cache of scan results."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached result, or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used one if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all results and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+class PatternSet:
+    """A fixed list of patterns, compiled once."""
+
+    def __init__(self, patterns: Sequence[str], flags: int = MATCH_FLAGS):
+        """Compile the patterns.
+
+        Args:
+            patterns: Regex strings
+            flags: re flags applied to every pattern
+
+        Raises:
+            re.error: If a pattern is not a valid regex
+        """
+        self.patterns = tuple(patterns)
+        self.flags = flags
+        self.key = patterns_digest(self.patterns, flags)
+        self.compiled = tuple(re.compile(pattern, flags) for pattern in self.patterns)
+        self.ignore_case = bool(flags & re.IGNORECASE)
+
+        # Keywords per pattern (None where the pattern needs regex)
+        keyword_flags = not flags & ~_KEYWORD_FLAGS
+        self.keywords: tuple[Optional[tuple[str, ...]], ...] = tuple(
+            self._keywords(pattern) if keyword_flags else None for pattern in self.patterns
+        )
+        self.has_keywords = any(keywords is not None for keywords in self.keywords)
+
+    def _keywords(self, pattern: str) -> Optional[tuple[str, ...]]:
+        keywords = keyword_alternatives(pattern)
+        if keywords is not None and self.ignore_case:
+            keywords = tuple(keyword.lower() for keyword in keywords)
+        return keywords
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def prepare(self, text: str) -> str:
+        """Get the text that keyword patterns are matched against.
+
+        Pass it to search when checking several patterns against one text, so
+        the text is only case-folded once.
+        """
+        return fold_case(text) if self.ignore_case and self.has_keywords else text
+
+    def search(self, index: int, text: str, prepared: Optional[str] = None) -> Optional[Span]:
+        """Find the leftmost match of one pattern.
+
+        Args:
+            index: Pattern index
+            text: Text to search
+            prepared: prepare(text), if already computed
+
+        Returns:
+            (start, end) of the match, or None
+        """
+        keywords = self.keywords[index]
+        if keywords is not None:
+            return find_keywords(prepared if prepared is not None else self.prepare(text), keywords)
+        match = self.compiled[index].search(text)
+        return match.span() if match is not None else None
+
+    def scan(self, text: str, indices: Optional[Iterable[int]] = None) -> dict[int, Span]:
+        """Find the leftmost match of every pattern.
+
+        Args:
+            text: Text to scan
+            indices: Patterns to check (default: all)
+
+        Returns:
+            Mapping of pattern index to (start, end) of its leftmost match;
+            patterns without a match are absent
+        """
+        prepared = self.prepare(text)
+        found: dict[int, Span] = {}
+        for index in range(len(self.patterns)) if indices is None else indices:
+            span = self.search(index, text, prepared)
+            if span is not None:
+                found[index] = span
+        return found
+
+
+def prefix_stable(pattern: str) -> bool:
+    """Check whether a match found in a prefix of a text is a match in the text.
+
+    Anchors and assertions that look at the end of the input or past the
+    match (``$``, ``\\Z``, ``\\b``, ``\\B``, lookaheads) can match at the end
+    of a prefix and fail once more text arrives; any other pattern can.
+    """
+    return not any(token in pattern for token in ("$", "\\Z", "\\b", "\\B", "(?=", "(?!"))
+
+
+class PatternStream:
+    """Incremental matching of a PatternSet against text arriving in chunks.
+
+    Keyword patterns are checked on every chunk: only the last
+    ``longest keyword - 1`` case-folded characters are kept from earlier
+    chunks, so a keyword split across chunks is still found once. Regex
+    patterns that are prefix stable are re-searched once at least
+    ``regex_interval`` characters have arrived since their last check; all
+    remaining patterns are settled by ``finish``.
+
+    A pattern is reported once, with the span of the first match seen.
+    After ``finish`` the set of matched patterns equals
+    ``PatternSet.scan`` on the whole text.
+    """
+
+    def __init__(
+        self,
+        patterns: PatternSet,
+        indices: Optional[Iterable[int]] = None,
+        regex_interval: int = 2048,
+    ):
+        """Start a stream.
+
+        Args:
+            patterns: Compiled patterns
+            indices: Patterns to watch (default: all)
+            regex_interval: Minimum characters between regex re-checks
+        """
+        self.patterns = patterns
+        self.regex_interval = regex_interval
+        self.matched: dict[int, Span] = {}
+        watched = range(len(patterns)) if indices is None else indices
+        self._keywords = [i for i in watched if patterns.keywords[i] is not None]
+        self._regex = [i for i in watched if patterns.keywords[i] is None]
+        self._early_regex = [i for i in self._regex if prefix_stable(patterns.patterns[i])]
+        self._overlap = max(
+            (len(keyword) - 1 for i in self._keywords for keyword in patterns.keywords[i]),
+            default=0,
+        )
+        self._chunks: list[str] = []
+        self._length = 0
+        self._tail = ""  # Last prepared characters, for keywords split across chunks
+        self._regex_checked = 0
+        self.finished = False
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def feed(self, chunk: str) -> dict[int, Span]:
+        """Add a chunk of text.
+
+        Returns:
+            Patterns that matched for the first time, with their spans
+        """
+        if self.finished:
+            raise ValueError("Stream already finished")
+        if not chunk:
+            return {}
+        found: dict[int, Span] = {}
+        window_start = self._length - len(self._tail)
+        window = self._tail + self.patterns.prepare(chunk)
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+
+        for index in self._keywords:
+            if index not in self.matched:
+                span = find_keywords(window, self.patterns.keywords[index])
+                if span is not None:
+                    found[index] = (window_start + span[0], window_start + span[1])
+        self._tail = window[max(0, len(window) - self._overlap) :] if self._overlap else ""
+
+        if self._length - self._regex_checked >= self.regex_interval:
+            found.update(self._search_regex(self._early_regex))
+        self.matched.update(found)
+        return found
+
+    def finish(self) -> dict[int, Span]:
+        """End the stream and settle the patterns that could not be checked early.
+
+        Returns:
+            Patterns that matched for the first time, with their spans
+        """
+        if self.finished:
+            return {}
+        found = self._search_regex(self._regex)
+        self.matched.update(found)
+        self.finished = True
+        return found
+
+    def _search_regex(self, indices: list[int]) -> dict[int, Span]:
+        text = self.text
+        self._regex_checked = self._length
+        found = {}
+        for index in indices:
+            if index not in self.matched:
+                match = self.patterns.compiled[index].search(text)
+                if match is not None:
+                    found[index] = match.span()
+        return found
@@ -0,0 +1,336 @@
+"""Custom DeepEval metrics for role boundary enforcement."""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from deepeval.metrics import BaseMetric
+from deepeval.test_case import LLMTestCase
+
+from claude_mpm_agents.metrics.batch import BatchMetricMixin, CaseResult, empty_output_result
+from claude_mpm_agents.metrics.patterns import PatternSet
+
+HANDOFF_AGENTS = ["engineer", "qa", "ops", "security", "research", "documentation"]
+
+# Handoff checks, compiled once for every HandoffComplianceMetric
+HANDOFF_MENTION = re.compile(
+    r"(handoff|hand off|next agent|pass to|continue with|handing off to)", re.IGNORECASE
+)
+AGENT_MENTION = re.compile(rf"({'|'.join(HANDOFF_AGENTS)})\s+(can|should|will)", re.IGNORECASE)
+ACCOMPLISHED_SECTION = re.compile(r"(accomplished|completed).*:", re.IGNORECASE | re.MULTILINE)
+REMAINING_SECTION = re.compile(r"(remaining|next|todo|tasks?).*:", re.IGNORECASE | re.MULTILINE)
+CONTEXT_SECTION = re.compile(
+    r"(context|background|constraints|considerations).*:", re.IGNORECASE | re.MULTILINE
+)
+BULLET_LIST = re.compile(r"^[\-\*\+]\s+", re.MULTILINE)
+NUMBERED_LIST = re.compile(r"^\d+\.\s+", re.MULTILINE)
+
+
+class RoleMatch(NamedTuple):
+    """Where an output matched one of its agent type's role patterns."""
+
+    kind: str  # "allowed" or "forbidden"
+    pattern: str
+    start: int
+    end: int
+    text: str  # The matched phrase as written in the output
+
+
+@lru_cache(maxsize=64)
+def role_pattern_set(patterns: tuple[str, ...]) -> PatternSet:
+    """Compile an agent type's role patterns once per process.
+
+    Role patterns are keyword alternations, so they are matched with
+    PatternSet's case-folded keyword search rather than regex.
+    """
+    return PatternSet(patterns, re.IGNORECASE)
+
+
+class RoleBoundaryMetric(BatchMetricMixin, BaseMetric):
+    """Metric to check that agents stay within their role boundaries."""
+
+    # Define allowed and forbidden patterns per agent type
+    ROLE_PATTERNS = {
+        "engineer": {
+            "allowed": [
+                r"(implement|code|refactor|type|test|debug)",
+                r"(function|class|module|component|service)",
+                r"(git commit|pull request|code review)",
+            ],
+            "forbidden": [
+                r"(deploy to production|kubectl apply|docker push)",
+                r"(run in production|production deployment)",
+                r"(security audit|penetration test|compliance review)",
+            ],
+        },
+        "qa": {
+            "allowed": [
+                r"(test|bug|verify|validate|reproduce)",
+                r"(pytest|jest|cypress|playwright)",
+                r"(test case|test plan|bug report)",
+            ],
+            "forbidden": [
+                r"(implement feature|write production code|refactor)",
+                r"(deploy|kubernetes|docker push)",
+                r"(merge pull request|git push|release)",
+            ],
+        },
+        "ops": {
+            "allowed": [
+                r"(deploy|kubernetes|docker|infrastructure)",
+                r"(monitoring|logging|metrics|alerts)",
+                r"(rollback|health check|smoke test)",
+            ],
+            "forbidden": [
+                r"(implement feature|write business logic)",
+                r"(fix bug in code|refactor function)",
+                r"(write unit tests|add test coverage)",
+            ],
+        },
+        "security": {
+            "allowed": [
+                r"(vulnerability|security|audit|compliance)",
+                r"(CVE|OWASP|encryption|authentication)",
+                r"(penetration test|security scan|threat model)",
+            ],
+            "forbidden": [
+                r"(implement feature|write code)",
+                r"(deploy to production|kubectl apply)",
+                r"(write tests|add test coverage)",
+            ],
+        },
+        "research": {
+            "allowed": [
+                r"(research|investigate|analyze|explore)",
+                r"(documentation|article|paper|best practice)",
+                r"(comparison|evaluation|recommendation)",
+            ],
+            "forbidden": [
+                r"(implement|deploy|test in CI)",
+                r"(merge|commit|push to production)",
+            ],
+        },
+    }
+
+    def __init__(self, agent_type: str, threshold: float = 0.9):
+        """Initialize metric for specific agent type.
+
+        Args:
+            agent_type: Type of agent to check boundaries for
+            threshold: Minimum score to pass (0.0-1.0)
+        """
+        self.agent_type = agent_type
+        self.threshold = threshold
+        self.violations: list[str] = []
+        self.violation_codes: list[str] = []
+
+        patterns = self.ROLE_PATTERNS.get(agent_type)
+        self.role_patterns: Optional[PatternSet] = None
+        self.allowed_indices = range(0)
+        self.forbidden_indices = range(0)
+        if patterns:
+            allowed = tuple(patterns.get("allowed", []))
+            forbidden = tuple(patterns.get("forbidden", []))
+            self.role_patterns = role_pattern_set(allowed + forbidden)
+            self.allowed_indices = range(len(allowed))
+            self.forbidden_indices = range(len(allowed), len(allowed) + len(forbidden))
+
+    @property
+    def __name__(self) -> str:
+        return f"Role Boundary ({self.agent_type})"
+
+    def measure(self, test_case: LLMTestCase) -> float:
+        """Measure role boundary compliance.
+
+        Args:
+            test_case: Test case with actual_output to validate
+
+        Returns:
+            Score between 0.0 and 1.0
+        """
+        return self._record(self.evaluate(test_case.actual_output))
+
+    def evaluate(self, output: str) -> CaseResult:
+        """Score one output against the agent type's role patterns.
+
+        Args:
+            output: Agent output to validate
+
+        Returns:
+            CaseResult with codes "missing_role_activity" and
+            "crossed_role_boundary:<pattern>"
+        """
+        if not output:
+            return empty_output_result()
+
+        if self.role_patterns is None:
+            return CaseResult(1.0, True, f"No role patterns defined for {self.agent_type}")
+
+        checks_passed = 0
+        total_checks = 2
+        violations = []
+        codes = []
+        prepared = self.role_patterns.prepare(output)
+
+        def matches(index: int) -> bool:
+            return self.role_patterns.search(index, output, prepared) is not None
+
+        # Check 1: Has allowed patterns (shows working in role)
+        if self.allowed_indices:
+            has_allowed = any(matches(i) for i in self.allowed_indices)
+            if has_allowed:
+                checks_passed += 1
+            else:
+                violations.append(f"Missing expected {self.agent_type} activities")
+                codes.append("missing_role_activity")
+
+        # Check 2: No forbidden patterns (not crossing boundaries)
+        if self.forbidden_indices:
+            violations_found = [
+                self.role_patterns.patterns[i] for i in self.forbidden_indices if matches(i)
+            ]
+            if not violations_found:
+                checks_passed += 1
+            else:
+                for pattern in violations_found:
+                    violations.append(f"Crossed role boundary: {pattern}")
+                    codes.append(f"crossed_role_boundary:{pattern}")
+
+        # Calculate score
+        score = checks_passed / total_checks
+        success = score >= self.threshold
+
+        if success:
+            reason = f"{self.agent_type} stayed within role boundaries"
+        else:
+            reason = f"Role violations: {', '.join(violations)}"
+
+        return CaseResult(score, success, reason, tuple(violations), tuple(codes))
+
+    def find_matches(self, output: str) -> list[RoleMatch]:
+        """Find where the output shows allowed and forbidden activities.
+
+        Args:
+            output: Agent output to search
+
+        Returns:
+            Leftmost match of every allowed and forbidden pattern that
+            matches, ordered by offset
+        """
+        if not output or self.role_patterns is None:
+            return []
+        found = []
+        for index, (start, end) in self.role_patterns.scan(output).items():
+            kind = "allowed" if index in self.allowed_indices else "forbidden"
+            found.append(
+                RoleMatch(kind, self.role_patterns.patterns[index], start, end, output[start:end])
+            )
+        return sorted(found, key=lambda match: (match.start, match.end))
+
+    async def a_measure(self, test_case: LLMTestCase) -> float:
+        """Async version of measure, run in an executor."""
+        return await self._measure_in_executor(test_case)
+
+    def is_successful(self) -> bool:
+        """Check if metric passed."""
+        return self.success
+
+
+class HandoffComplianceMetric(BatchMetricMixin, BaseMetric):
+    """Metric to check proper handoff format when agents complete work."""
+
+    def __init__(self, threshold: float = 0.8):
+        """Initialize metric.
+
+        Args:
+            threshold: Minimum score to pass (0.0-1.0)
+        """
+        self.threshold = threshold
+        self.violations: list[str] = []
+        self.violation_codes: list[str] = []
+
+    @property
+    def __name__(self) -> str:
+        return "Handoff Compliance"
+
+    def measure(self, test_case: LLMTestCase) -> float:
+        """Measure handoff compliance.
+
+        Args:
+            test_case: Test case with actual_output to validate
+
+        Returns:
+            Score between 0.0 and 1.0
+        """
+        return self._record(self.evaluate(test_case.actual_output))
+
+    def evaluate(self, output: str) -> CaseResult:
+        """Score the handoff sections of one output.
+
+        Args:
+            output: Agent output to validate
+
+        Returns:
+            CaseResult with codes "missing_accomplished", "missing_remaining"
+            and "missing_context"
+        """
+        if not output:
+            return empty_output_result()
+
+        # Check if this is a handoff scenario (mentions another agent or handoff)
+        is_handoff = HANDOFF_MENTION.search(output) or AGENT_MENTION.search(output)
+
+        if not is_handoff:
+            # Not a handoff scenario, skip
+            return CaseResult(1.0, True, "Not a handoff scenario")
+
+        checks_passed = 0
+        total_checks = 3  # Reduced from 4, made stricter
+        violations = []
+        codes = []
+        has_list = BULLET_LIST.search(output) or NUMBERED_LIST.search(output)
+
+        # Check 1: States what was accomplished (requires list or detail)
+        has_accomplished = ACCOMPLISHED_SECTION.search(output) and has_list
+        if has_accomplished:
+            checks_passed += 1
+        else:
+            violations.append("Missing accomplished section with detailed list")
+            codes.append("missing_accomplished")
+
+        # Check 2: States remaining tasks (requires list)
+        has_remaining = REMAINING_SECTION.search(output) and has_list
+        if has_remaining:
+            checks_passed += 1
+        else:
+            violations.append("Missing remaining tasks section with list")
+            codes.append("missing_remaining")
+
+        # Check 3: Provides context (requires detailed explanation)
+        has_context = (
+            CONTEXT_SECTION.search(output) and len(output) > 100  # Must have substantial content
+        )
+        if has_context:
+            checks_passed += 1
+        else:
+            violations.append("Missing context section with sufficient detail")
+            codes.append("missing_context")
+
+        # Calculate score
+        score = checks_passed / total_checks
+        success = score >= self.threshold
+
+        if success:
+            reason = f"Handoff compliance: {score:.1%}"
+        else:
+            reason = f"Handoff violations: {', '.join(violations)}"
+
+        return CaseResult(score, success, reason, tuple(violations), tuple(codes))
+
+    async def a_measure(self, test_case: LLMTestCase) -> float:
+        """Async version of measure, run in an executor."""
+        return await self._measure_in_executor(test_case)
+
+    def is_successful(self) -> bool:
+        """Check if metric passed."""
+        return self.success
@@ -0,0 +1,143 @@
+"""Incremental compliance checking of streamed agent output.
+
+The metrics need the complete ``actual_output``. The checkers here take the
+output chunk by chunk as it streams from the model, reusing a metric's
+compiled patterns through a ``PatternStream``, and report a violation as soon
+as it becomes certain, so an orchestrator can cancel an out-of-role
+generation without waiting for the full response:
+
+    checker = RoleBoundaryStream(RoleBoundaryMetric(agent_type="qa"))
+    for chunk in response_stream:
+        if checker.feed(chunk):
+            cancel()  # e.g. the qa agent said "merge pull request"
+            break
+    result = checker.finish()
+
+Only violations that more text cannot undo fire early: forbidden role
+phrases, and negative instruction-rule patterns. Missing activities and
+missing positive patterns are only known at ``finish``, which returns the
+metric's own ``CaseResult`` for the whole output.
+"""
+
+from typing import NamedTuple
+
+from claude_mpm_agents.metrics.batch import CaseResult
+from claude_mpm_agents.metrics.instruction_compliance import (
+    InstructionComplianceMetric,
+    compile_rules,
+)
+from claude_mpm_agents.metrics.patterns import PatternSet, PatternStream, Span
+from claude_mpm_agents.metrics.role_boundary import RoleBoundaryMetric
+
+
+class Violation(NamedTuple):
+    """A violation detected while the output was streaming."""
+
+    code: str  # Same code the metric reports in CaseResult.codes
+    message: str  # Same message the metric reports in CaseResult.violations
+    start: int  # Offsets of the first offending match in the output
+    end: int
+
+
+class RoleBoundaryStream:
+    """Streaming RoleBoundaryMetric check; fires on forbidden phrases."""
+
+    def __init__(self, metric: RoleBoundaryMetric, regex_interval: int = 2048):
+        """Start checking a response.
+
+        Args:
+            metric: Metric whose agent type and role patterns to apply
+            regex_interval: Minimum characters between regex re-checks
+        """
+        self.metric = metric
+        self.violations: list[Violation] = []
+        patterns = metric.role_patterns or PatternSet([])
+        self._stream = PatternStream(patterns, metric.forbidden_indices, regex_interval)
+
+    @property
+    def violated(self) -> bool:
+        """Check whether a violation has fired."""
+        return bool(self.violations)
+
+    def feed(self, chunk: str) -> list[Violation]:
+        """Add a chunk of output.
+
+        Returns:
+            Violations detected by this chunk
+        """
+        return self._fire(self._stream.feed(chunk))
+
+    def finish(self) -> CaseResult:
+        """End the response and score it as a whole."""
+        self._fire(self._stream.finish())
+        return self.metric.evaluate(self._stream.text)
+
+    def _fire(self, found: dict[int, Span]) -> list[Violation]:
+        fired = []
+        for index, (start, end) in sorted(found.items(), key=lambda item: item[1]):
+            pattern = self._stream.patterns.patterns[index]
+            fired.append(
+                Violation(
+                    f"crossed_role_boundary:{pattern}",
+                    f"Crossed role boundary: {pattern}",
+                    start,
+                    end,
+                )
+            )
+        self.violations.extend(fired)
+        return fired
+
+
+class InstructionComplianceStream:
+    """Streaming InstructionComplianceMetric check; fires on negative patterns."""
+
+    def __init__(self, metric: InstructionComplianceMetric, regex_interval: int = 2048):
+        """Start checking a response.
+
+        Args:
+            metric: Metric whose rules to apply
+            regex_interval: Minimum characters between regex re-checks
+        """
+        self.metric = metric
+        self.violations: list[Violation] = []
+        self._compiled = compile_rules(metric.rules)
+        self._rules_by_pattern: dict[int, list[int]] = {}
+        for rule_index, negative in enumerate(self._compiled.negative):
+            for pattern_index in negative:
+                self._rules_by_pattern.setdefault(pattern_index, []).append(rule_index)
+        self._failed: set[int] = set()
+        self._stream = PatternStream(
+            self._compiled.patterns, sorted(self._rules_by_pattern), regex_interval
+        )
+
+    @property
+    def violated(self) -> bool:
+        """Check whether a violation has fired."""
+        return bool(self.violations)
+
+    def feed(self, chunk: str) -> list[Violation]:
+        """Add a chunk of output.
+
+        Returns:
+            Violations detected by this chunk (one per newly failed rule)
+        """
+        return self._fire(self._stream.feed(chunk))
+
+    def finish(self) -> CaseResult:
+        """End the response and score it as a whole."""
+        self._fire(self._stream.finish())
+        return self.metric.evaluate(self._stream.text)
+
+    def _fire(self, found: dict[int, Span]) -> list[Violation]:
+        fired = []
+        for pattern_index, (start, end) in sorted(found.items(), key=lambda item: item[1]):
+            for rule_index in self._rules_by_pattern[pattern_index]:
+                if rule_index in self._failed:
+                    continue
+                self._failed.add(rule_index)
+                rule = self.metric.rules[rule_index]
+                fired.append(
+                    Violation(rule.rule_id, f"{rule.rule_id}: {rule.description}", start, end)
+                )
+        self.violations.extend(fired)
+        return fired
@@ -0,0 +1,298 @@
+"""Offline scoring of agent transcripts from JSONL logs.
+
+Each line of a transcript log is a JSON object with ``agent_type`` and
+``output``; other keys (such as ``task``) are ignored, since the metrics only
+look at the output. Transcripts are read one line at a time and scored in
+chunks by ``InstructionComplianceMetric`` (root rules plus the agent type's
+category rules), ``RoleBoundaryMetric`` and ``HandoffComplianceMetric``.
+Agent types without role patterns are counted as skipped rather than scored.
+Only per-agent aggregates are kept, so memory stays constant however large the
+log is. With ``jobs > 1`` chunks are scored in worker processes that return
+partial aggregates, and at most ``2 * jobs`` chunks are in flight at a time.
+
+The metrics are pure regex checks: no model, API key or network is needed.
+"""
+
+import json
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, TextIO
+
+from claude_mpm_agents.instruction_extractor import InstructionExtractor
+from claude_mpm_agents.metrics.batch import BatchMetricMixin, CaseResult
+from claude_mpm_agents.metrics.instruction_compliance import InstructionComplianceMetric
+from claude_mpm_agents.metrics.role_boundary import HandoffComplianceMetric, RoleBoundaryMetric
+
+DEFAULT_CHUNK_SIZE = 256
+TOP_VIOLATIONS = 10
+MALFORMED_LINES_KEPT = 10
+
+
+class Transcript(NamedTuple):
+    """One agent response from a log."""
+
+    agent_type: str
+    output: str
+
+
+def read_transcripts(lines: Iterable[str], report: "ScoreReport") -> Iterator[Transcript]:
+    """Parse JSONL transcripts lazily.
+
+    Blank lines are skipped; lines that are not a JSON object with a string
+    ``agent_type`` are counted in ``report.malformed``.
+
+    Args:
+        lines: Lines of a JSONL file (e.g. an open file object)
+        report: Report that records malformed lines
+
+    Yields:
+        Transcript per valid line
+    """
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict) or not isinstance(data.get("agent_type"), str):
+            report.add_malformed(line_number)
+            continue
+        yield Transcript(
+            agent_type=data["agent_type"],
+            output=str(data.get("output") or ""),
+        )
+
+
+class TranscriptScorer:
+    """The metrics for each agent type, built on first use."""
+
+    def __init__(self, project_root: Path):
+        """Initialize scorer.
+
+        Args:
+            project_root: Repository root (for BASE-AGENT.md rules)
+        """
+        self.extractor = InstructionExtractor(project_root)
+        self._metrics: dict[str, dict[str, BatchMetricMixin]] = {}
+
+    def metrics(self, agent_type: str) -> dict[str, BatchMetricMixin]:
+        """Get the metrics that score an agent type, keyed by metric name."""
+        if agent_type not in self._metrics:
+            rules = self.extractor.extract_root_rules()
+            rules += self.extractor.extract_category_rules(agent_type)
+            self._metrics[agent_type] = {
+                "instruction_compliance": InstructionComplianceMetric(rules=rules),
+                "role_boundary": RoleBoundaryMetric(agent_type=agent_type),
+                "handoff_compliance": HandoffComplianceMetric(),
+            }
+        return self._metrics[agent_type]
+
+    def score(self, transcript: Transcript) -> dict[str, CaseResult]:
+        """Score one transcript with every metric."""
+        return {
+            name: metric.evaluate(transcript.output)
+            for name, metric in self.metrics(transcript.agent_type).items()
+        }
+
+    def score_chunk(self, transcripts: list[Transcript]) -> "ScoreReport":
+        """Score transcripts into a partial report."""
+        report = ScoreReport()
+        for transcript in transcripts:
+            if transcript.agent_type in RoleBoundaryMetric.ROLE_PATTERNS:
+                report.add(transcript.agent_type, self.score(transcript))
+            else:
+                report.skipped[transcript.agent_type] += 1
+        return report
+
+
+@dataclass
+class MetricAggregate:
+    """Running totals of one metric for one agent type."""
+
+    cases: int = 0
+    passed: int = 0
+    score_total: float = 0.0
+    violations: Counter = field(default_factory=Counter)  # Violation code counts
+
+    def add(self, result: CaseResult) -> None:
+        self.cases += 1
+        self.passed += result.success
+        self.score_total += result.score
+        self.violations.update(result.codes)
+
+    def merge(self, other: "MetricAggregate") -> None:
+        self.cases += other.cases
+        self.passed += other.passed
+        self.score_total += other.score_total
+        self.violations.update(other.violations)
+
+    @property
+    def mean_score(self) -> float:
+        return self.score_total / self.cases if self.cases else 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.cases if self.cases else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cases": self.cases,
+            "passed": self.passed,
+            "pass_rate": round(self.pass_rate, 4),
+            "mean_score": round(self.mean_score, 4),
+            "top_violations": dict(self.violations.most_common(TOP_VIOLATIONS)),
+        }
+
+
+@dataclass
+class AgentReport:
+    """Aggregates of every metric for one agent type."""
+
+    cases: int = 0
+    metrics: dict[str, MetricAggregate] = field(default_factory=dict)
+
+    def add(self, results: dict[str, CaseResult]) -> None:
+        self.cases += 1
+        for name, result in results.items():
+            self.metrics.setdefault(name, MetricAggregate()).add(result)
+
+    def merge(self, other: "AgentReport") -> None:
+        self.cases += other.cases
+        for name, aggregate in other.metrics.items():
+            self.metrics.setdefault(name, MetricAggregate()).merge(aggregate)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cases": self.cases,
+            "metrics": {name: aggregate.to_dict() for name, aggregate in self.metrics.items()},
+        }
+
+
+@dataclass
+class ScoreReport:
+    """Per-agent aggregates of a scoring run."""
+
+    agents: dict[str, AgentReport] = field(default_factory=dict)
+    malformed: int = 0
+    malformed_lines: list[int] = field(default_factory=list)  # First few only
+    skipped: Counter = field(default_factory=Counter)  # Transcripts per unknown agent type
+
+    @property
+    def cases(self) -> int:
+        """Number of transcripts scored."""
+        return sum(agent.cases for agent in self.agents.values())
+
+    def add(self, agent_type: str, results: dict[str, CaseResult]) -> None:
+        """Add one transcript's results."""
+        self.agents.setdefault(agent_type, AgentReport()).add(results)
+
+    def add_malformed(self, line_number: int) -> None:
+        """Record an unreadable log line."""
+        self.malformed += 1
+        if len(self.malformed_lines) < MALFORMED_LINES_KEPT:
+            self.malformed_lines.append(line_number)
+
+    def merge(self, other: "ScoreReport") -> None:
+        """Fold a partial report (e.g. from a worker) into this one."""
+        for agent_type, agent in other.agents.items():
+            self.agents.setdefault(agent_type, AgentReport()).merge(agent)
+        self.malformed += other.malformed
+        self.skipped.update(other.skipped)
+        room = MALFORMED_LINES_KEPT - len(self.malformed_lines)
+        self.malformed_lines.extend(other.malformed_lines[: max(0, room)])
+
+    def failing(self, min_pass_rate: float) -> list[tuple[str, str, float]]:
+        """Get (agent type, metric, pass rate) for every metric below a pass rate."""
+        return [
+            (agent_type, name, aggregate.pass_rate)
+            for agent_type, agent in sorted(self.agents.items())
+            for name, aggregate in agent.metrics.items()
+            if aggregate.pass_rate < min_pass_rate
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cases": self.cases,
+            "malformed": self.malformed,
+            "malformed_lines": self.malformed_lines,
+            "skipped": dict(sorted(self.skipped.items())),
+            "agents": {
+                agent_type: agent.to_dict() for agent_type, agent in sorted(self.agents.items())
+            },
+        }
+
+
+def _chunks(transcripts: Iterable[Transcript], size: int) -> Iterator[list[Transcript]]:
+    iterator = iter(transcripts)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def score_transcripts(
+    transcripts: Iterable[Transcript],
+    project_root: Path,
+    jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    report: Optional[ScoreReport] = None,
+) -> ScoreReport:
+    """Score a stream of transcripts into per-agent aggregates.
+
+    Args:
+        transcripts: Transcripts, consumed lazily
+        project_root: Repository root (for BASE-AGENT.md rules)
+        jobs: Worker processes (1 scores in-process)
+        chunk_size: Transcripts per worker task
+        report: Report to add to (default: a new one)
+
+    Returns:
+        The report
+    """
+    report = report if report is not None else ScoreReport()
+    chunks = _chunks(transcripts, chunk_size)
+
+    if jobs <= 1:
+        scorer = TranscriptScorer(project_root)
+        for chunk in chunks:
+            report.merge(scorer.score_chunk(chunk))
+        return report
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(project_root,)
+    ) as executor:
+        pending: set[Future] = set()
+        for chunk in chunks:
+            if len(pending) >= 2 * jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.merge(future.result())
+            pending.add(executor.submit(_score_chunk, chunk))
+        for future in pending:
+            report.merge(future.result())
+    return report
+
+
+def score_file(
+    file: TextIO, project_root: Path, jobs: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> ScoreReport:
+    """Score every transcript in an open JSONL file (see score_transcripts)."""
+    report = ScoreReport()
+    return score_transcripts(read_transcripts(file, report), project_root, jobs, chunk_size, report)
+
+
+# Per-process scorer used by worker processes
+_worker_scorer: Optional[TranscriptScorer] = None
+
+
+def _init_worker(project_root: Path) -> None:
+    """Create the TranscriptScorer used by this worker process."""
+    global _worker_scorer
+    _worker_scorer = TranscriptScorer(project_root)
+
+
+def _score_chunk(chunk: list[Transcript]) -> ScoreReport:
+    """Score one chunk inside a worker process."""
+    return _worker_scorer.score_chunk(chunk)
@@ -0,0 +1,137 @@
+"""Atomic, write-if-changed file output.
+
+Build outputs are only rewritten when their content actually changes, so
+unchanged agents keep their mtimes and downstream watchers, rsync and deploy
+syncers see no spurious updates. Changed files are written to a temporary file
+in the same directory and renamed over the target, so an interrupted build
+never leaves a half-written output behind.
+"""
+
+import contextlib
+import os
+import secrets
+from pathlib import Path
+from typing import Iterable, Union
+
+
+def _to_bytes(content: Union[str, bytes]) -> bytes:
+    return content.encode("utf-8") if isinstance(content, str) else content
+
+
+def has_content(path: Path, data: bytes) -> bool:
+    """Check whether a file already holds exactly the given bytes.
+
+    The size is compared first, so most changed files are detected from a
+    single stat() without reading them.
+
+    Args:
+        path: File to check
+        data: Expected content
+
+    Returns:
+        True if the file exists with identical content
+    """
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def _create_temp(path: Path) -> tuple[int, str]:
+    """Create a new temporary sibling of path for writing.
+
+    The file is created with mode 0o666 and the kernel applies the current
+    umask, so a new output gets the same mode write_text() would give it.
+
+    Returns:
+        (file descriptor, temporary file name)
+    """
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+def atomic_write(path: Path, content: Union[str, bytes]) -> None:
+    """Write a file via a temporary sibling file and an atomic rename.
+
+    The file keeps its existing permissions; new files get the default mode
+    for the process umask.
+
+    Args:
+        path: Destination file (its directory must exist)
+        content: Text (written as UTF-8) or bytes
+    """
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except OSError:
+        mode = None
+
+    fd, tmp_name = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_to_bytes(content))
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def write_if_changed(path: Path, content: Union[str, bytes]) -> bool:
+    """Atomically write a file unless it already has this content.
+
+    Args:
+        path: Destination file (its directory must exist)
+        content: Text (written as UTF-8) or bytes
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = _to_bytes(content)
+    if has_content(path, data):
+        return False
+    atomic_write(path, data)
+    return True
+
+
+class OutputWriter:
+    """Writes files with write_if_changed, creating each directory only once."""
+
+    def __init__(self) -> None:
+        self.written = 0
+        self.unchanged = 0
+        self._dirs: set[Path] = set()
+
+    def ensure_dirs(self, paths: Iterable[Path]) -> None:
+        """Create the parent directories of the given files in one batch.
+
+        Args:
+            paths: Files that are about to be written
+        """
+        for directory in sorted({Path(p).parent for p in paths} - self._dirs):
+            directory.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(directory)
+
+    def write(self, path: Path, content: Union[str, bytes]) -> bool:
+        """Write a file if its content changed.
+
+        Args:
+            path: Destination file
+            content: Text (written as UTF-8) or bytes
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        self.ensure_dirs([path])
+        if write_if_changed(path, content):
+            self.written += 1
+            return True
+        self.unchanged += 1
+        return False
@@ -0,0 +1,394 @@
+"""Structured validation of agent frontmatter against the agent schema.
+
+The schema is declared as plain data (a small JSON-Schema-like subset) and
+compiled once into nested checker functions. Validating a file parses its
+frontmatter a single time, keeping YAML node positions, and walks the parsed
+data once, collecting every problem with the line number it came from.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import yaml
+
+from claude_mpm_agents.yaml_loader import SafeLoader
+
+CURRENT_SCHEMA_VERSION = "1.3.0"
+
+KEBAB_CASE = r"^[a-z0-9]+(-[a-z0-9]+)*$"
+SEMVER = r"^\d+\.\d+\.\d+$"
+
+STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Frontmatter schema for CURRENT_SCHEMA_VERSION (see templates/AGENT_TEMPLATE_REFERENCE.md).
+# Enum mismatches are warnings because the enums document conventions rather than
+# values the deployment tooling rejects.
+AGENT_SCHEMA_1_3_0: dict[str, Any] = {
+    "type": "object",
+    "required": ["name", "description", "agent_id", "agent_type", "schema_version"],
+    "properties": {
+        "name": {"type": "string", "min_length": 1},
+        "description": {"type": "string", "min_length": 1},
+        "agent_id": {"type": "string", "pattern": KEBAB_CASE},
+        "agent_type": {
+            "type": "string",
+            "enum": [
+                "engineer",
+                "qa",
+                "ops",
+                "research",
+                "product",
+                "specialized",
+                "security",
+                "documentation",
+                "universal",
+                "claude-mpm",
+                "system",
+            ],
+            "enum_severity": "warning",
+        },
+        "schema_version": {"type": "string"},
+        "version": {"type": "string", "pattern": SEMVER},
+        "template_version": {"type": "string", "pattern": SEMVER},
+        "model": {"type": "string", "enum": ["sonnet", "opus", "haiku"]},
+        "resource_tier": {
+            "type": "string",
+            "enum": ["lightweight", "low", "standard", "medium", "high", "intensive"],
+            "enum_severity": "warning",
+        },
+        "source": {"type": "string"},
+        "category": {"type": "string"},
+        "color": {"type": "string"},
+        "author": {"type": "string"},
+        "tags": STRING_LIST,
+        "skills": STRING_LIST,
+        "temperature": {"type": "number", "minimum": 0, "maximum": 1},
+        "max_tokens": {"type": "integer", "minimum": 1},
+        "context_limit": {"type": "integer", "minimum": 1},
+        "timeout": {"type": "integer", "minimum": 1},
+        "maxTurns": {"type": "integer", "minimum": 1},
+        "permissionMode": {
+            "type": "string",
+            "enum": ["default", "acceptEdits", "bypassPermissions", "plan"],
+        },
+        "memory": {"type": "string", "enum": ["project", "user", "local"]},
+        "deprecated": {"type": "boolean"},
+        "capabilities": {
+            "type": "object",
+            "properties": {
+                "memory_limit": {"type": "integer", "minimum": 1},
+                "cpu_limit": {"type": "integer", "minimum": 1, "maximum": 100},
+                "network_access": {"type": "boolean"},
+            },
+        },
+        "dependencies": {"type": "object"},
+        "knowledge": {
+            "type": "object",
+            "properties": {
+                "domain_expertise": STRING_LIST,
+                "best_practices": STRING_LIST,
+                "constraints": STRING_LIST,
+                "examples": {"type": "array"},
+            },
+        },
+        "interactions": {
+            "type": "object",
+            "properties": {
+                "input_format": {"type": ["object", "null"]},
+                "output_format": {"type": ["object", "null"]},
+                "handoff_agents": STRING_LIST,
+                "triggers": {"type": "array", "items": {"type": ["string", "object"]}},
+            },
+        },
+        "memory_routing": {
+            "type": "object",
+            "properties": {
+                "description": {"type": "string"},
+                "categories": STRING_LIST,
+                "keywords": STRING_LIST,
+                "paths": STRING_LIST,
+                "extensions": STRING_LIST,
+            },
+        },
+        "template_changelog": {"type": "array"},
+    },
+}
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+_TYPE_NAMES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+# Key path into the frontmatter, e.g. ("capabilities", "cpu_limit") or ("skills", 0)
+KeyPath = tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A single schema validation problem."""
+
+    message: str
+    line: Optional[int] = None  # 1-based line in the source file
+    severity: str = "error"  # "error" or "warning"
+
+    def __str__(self) -> str:
+        return f"{self.message} (line {self.line})" if self.line else self.message
+
+
+class _Context:
+    """Collects issues and resolves key paths to line numbers during a walk."""
+
+    def __init__(self, lines: dict[KeyPath, int]):
+        self.lines = lines
+        self.issues: list[ValidationIssue] = []
+
+    def report(self, path: KeyPath, message: str, severity: str = "error") -> None:
+        line = None
+        # Fall back to the nearest ancestor with a known line
+        for depth in range(len(path), -1, -1):
+            line = self.lines.get(path[:depth])
+            if line is not None:
+                break
+        self.issues.append(ValidationIssue(message, line, severity))
+
+
+Checker = Callable[[Any, KeyPath, _Context], None]
+
+
+def _label(path: KeyPath) -> str:
+    return ".".join(str(part) for part in path) or "frontmatter"
+
+
+def compile_schema(schema: dict[str, Any]) -> Checker:
+    """Compile a schema into a checker function.
+
+    Args:
+        schema: Schema node (see AGENT_SCHEMA_1_3_0 for the supported keywords)
+
+    Returns:
+        Function ``check(value, path, context)`` validating one value
+    """
+    checks: list[Checker] = []
+
+    expected = schema.get("type")
+    if expected is not None:
+        expected_types = [expected] if isinstance(expected, str) else list(expected)
+        type_checks = [_TYPE_CHECKS[name] for name in expected_types]
+        type_label = " or ".join(expected_types)
+
+        def check_type(value: Any, path: KeyPath, ctx: _Context) -> bool:
+            if any(is_type(value) for is_type in type_checks):
+                return True
+            actual = _TYPE_NAMES.get(type(value), type(value).__name__)
+            ctx.report(
+                path, f"Invalid type for {_label(path)}: expected {type_label}, got {actual}"
+            )
+            return False
+
+    else:
+
+        def check_type(value: Any, path: KeyPath, ctx: _Context) -> bool:
+            return True
+
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+        severity = schema.get("enum_severity", "error")
+        allowed_label = ", ".join(schema["enum"])
+
+        def check_enum(value: Any, path: KeyPath, ctx: _Context) -> None:
+            if value not in allowed:
+                ctx.report(
+                    path,
+                    f"Invalid value for {_label(path)}: {value!r} "
+                    f"(expected one of: {allowed_label})",
+                    severity,
+                )
+
+        checks.append(check_enum)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any, path: KeyPath, ctx: _Context) -> None:
+            if isinstance(value, str) and not pattern.match(value):
+                ctx.report(path, f"Invalid format for {_label(path)}: {value!r}")
+
+        checks.append(check_pattern)
+
+    if "min_length" in schema:
+        min_length = schema["min_length"]
+
+        def check_length(value: Any, path: KeyPath, ctx: _Context) -> None:
+            if isinstance(value, str) and len(value.strip()) < min_length:
+                ctx.report(path, f"Empty value for {_label(path)}")
+
+        checks.append(check_length)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+
+        def check_range(value: Any, path: KeyPath, ctx: _Context) -> None:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return
+            if (minimum is not None and value < minimum) or (
+                maximum is not None and value > maximum
+            ):
+                ctx.report(
+                    path, f"Out of range for {_label(path)}: {value} (allowed {minimum}-{maximum})"
+                )
+
+        checks.append(check_range)
+
+    if "required" in schema:
+        required = list(schema["required"])
+
+        def check_required(value: Any, path: KeyPath, ctx: _Context) -> None:
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        ctx.report(path, f"Missing required field: {_label(path + (key,))}")
+
+        checks.append(check_required)
+
+    if "properties" in schema:
+        properties = {key: compile_schema(sub) for key, sub in schema["properties"].items()}
+
+        def check_properties(value: Any, path: KeyPath, ctx: _Context) -> None:
+            if isinstance(value, dict):
+                for key, sub_value in value.items():
+                    checker = properties.get(key)
+                    if checker is not None:
+                        checker(sub_value, path + (key,), ctx)
+
+        checks.append(check_properties)
+
+    if "items" in schema:
+        item_checker = compile_schema(schema["items"])
+
+        def check_items(value: Any, path: KeyPath, ctx: _Context) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    item_checker(item, path + (index,), ctx)
+
+        checks.append(check_items)
+
+    def check(value: Any, path: KeyPath, ctx: _Context) -> None:
+        # Further checks only make sense once the type is right
+        if check_type(value, path, ctx):
+            for sub_check in checks:
+                sub_check(value, path, ctx)
+
+    return check
+
+
+def _node_lines(node: yaml.Node, path: KeyPath, lines: dict[KeyPath, int], offset: int) -> None:
+    """Record the source line of every key and sequence item under a node."""
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            child = path + (key_node.value,)
+            lines[child] = key_node.start_mark.line + offset
+            _node_lines(value_node, child, lines, offset)
+    elif isinstance(node, yaml.SequenceNode):
+        for index, item in enumerate(node.value):
+            child = path + (index,)
+            lines[child] = item.start_mark.line + offset
+            _node_lines(item, child, lines, offset)
+
+
+def parse_with_lines(text: str, first_line: int = 1) -> tuple[Any, dict[KeyPath, int]]:
+    """Parse YAML once, returning the data and the line of each key path.
+
+    Args:
+        text: YAML document
+        first_line: File line number of the first line of text
+
+    Returns:
+        Tuple of (parsed data, mapping of key path to 1-based line number)
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    loader = SafeLoader(text)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None, {}
+        lines: dict[KeyPath, int] = {(): node.start_mark.line + first_line}
+        _node_lines(node, (), lines, first_line)
+        return loader.construct_document(node), lines
+    finally:
+        loader.dispose()
+
+
+_compiled_agent_schema = compile_schema(AGENT_SCHEMA_1_3_0)
+
+
+@dataclass
+class FrontmatterValidation:
+    """Result of validating one frontmatter block."""
+
+    data: Optional[dict[str, Any]]  # None if the frontmatter could not be parsed
+    issues: list[ValidationIssue]
+    lines: dict[KeyPath, int]
+
+    @property
+    def errors(self) -> list[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> list[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+
+def validate_frontmatter(text: str, first_line: int = 2) -> FrontmatterValidation:
+    """Validate agent frontmatter against the current schema in a single pass.
+
+    Args:
+        text: Frontmatter YAML (without ``---`` delimiters)
+        first_line: File line number of the first frontmatter line (2 after ``---``)
+
+    Returns:
+        FrontmatterValidation with the parsed data, issues and key line numbers
+    """
+    try:
+        data, lines = parse_with_lines(text, first_line)
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        line = mark.line + first_line if mark is not None else None
+        problem = getattr(e, "problem", None) or str(e)
+        issue = ValidationIssue(f"Invalid YAML frontmatter: {problem}", line)
+        return FrontmatterValidation(None, [issue], {})
+
+    ctx = _Context(lines)
+    if not isinstance(data, dict):
+        ctx.report((), "Frontmatter must be a mapping")
+        return FrontmatterValidation(None, ctx.issues, lines)
+
+    _compiled_agent_schema(data, (), ctx)
+
+    schema_version = data.get("schema_version")
+    if isinstance(schema_version, str) and schema_version != CURRENT_SCHEMA_VERSION:
+        ctx.report(
+            ("schema_version",),
+            f"schema_version is {schema_version}, current is {CURRENT_SCHEMA_VERSION}",
+            "warning",
+        )
+
+    return FrontmatterValidation(data, ctx.issues, lines)
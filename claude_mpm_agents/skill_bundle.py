@@ -0,0 +1,121 @@
+"""Progressive-disclosure skill summaries for built agents.
+
+Instead of paying for full skill bodies up front, an agent built with
+``--skill-summaries`` carries one compact entry-point block per skill in its
+``skills:`` list (summary, when to use, quick start and where the full skill
+lives). Each block is kept within the skill's ``context_limit`` tokens.
+``SkillBodyLoader`` loads the full SKILL.md body once a skill is needed.
+
+Skills without a local ``skills/<name>/SKILL.md`` (e.g. those deployed from
+the external skills repository) are left out and reported as missing.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from claude_mpm_agents.skills import SKILL_FILENAME, SKILLS_DIRNAME, Skill, SkillIndex, SkillLoader
+
+SKILLS_HEADING = "## Available Skills"
+SKILLS_INTRO = (
+    "Only summaries are included below. Read a skill's full SKILL.md when the task calls for it."
+)
+ELLIPSIS = "…"
+
+
+def _entry_lines(skill: Skill, fields: tuple[str, ...], summary: str) -> list[str]:
+    entry = skill.entry_point
+    lines = [f"### {skill.skill_id}"]
+    if summary:
+        lines.append(f"- Summary: {summary}")
+    if "when_to_use" in fields and entry.when_to_use:
+        lines.append(f"- When to use: {entry.when_to_use}")
+    if "quick_start" in fields and entry.quick_start:
+        lines.append(f"- Quick start: {entry.quick_start}")
+    lines.append(f"- Full skill: {SKILLS_DIRNAME}/{skill.skill_id}/{SKILL_FILENAME}")
+    return lines
+
+
+def entry_point_block(
+    skill: Skill, count_tokens: Callable[[str], int], limit: Optional[int] = None
+) -> str:
+    """Format a skill's entry point, trimmed to fit its token limit.
+
+    Fields are dropped least important first (quick start, then when to use),
+    then the summary is shortened word by word.
+
+    Args:
+        skill: Skill to summarize
+        count_tokens: Token counting function
+        limit: Token limit (default: the skill's context_limit, or no limit)
+
+    Returns:
+        Markdown block (heading plus bullet fields)
+    """
+    limit = limit if limit is not None else skill.context_limit
+    summary = skill.entry_point.summary
+    for fields in (("when_to_use", "quick_start"), ("when_to_use",), ()):
+        block = "\n".join(_entry_lines(skill, fields, summary))
+        if limit is None or count_tokens(block) <= limit:
+            return block
+
+    words = summary.split()
+    while words:
+        words.pop()
+        block = "\n".join(_entry_lines(skill, (), " ".join(words) + ELLIPSIS if words else ""))
+        if count_tokens(block) <= limit:
+            break
+    return block
+
+
+@dataclass
+class SkillBundle:
+    """Entry-point summaries of an agent's skills."""
+
+    text: str = ""
+    included: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    paths: list[Path] = field(default_factory=list)  # SKILL.md files the text was built from
+
+
+def bundle_skills(
+    names: list[str], skills: SkillIndex, count_tokens: Callable[[str], int]
+) -> SkillBundle:
+    """Build the skill summary section for an agent.
+
+    Args:
+        names: The agent's ``skills:`` list
+        skills: Index of the local skills (see SkillLoader)
+        count_tokens: Token counting function
+
+    Returns:
+        SkillBundle; text is "" when none of the skills exist locally
+    """
+    bundle = SkillBundle()
+    blocks = []
+    for name in dict.fromkeys(names):
+        skill = skills.get(name)
+        if skill is None:
+            bundle.missing.append(name)
+            continue
+        blocks.append(entry_point_block(skill, count_tokens))
+        bundle.included.append(name)
+        bundle.paths.append(skill.path)
+    if blocks:
+        bundle.text = "\n\n".join([SKILLS_HEADING, SKILLS_INTRO, *blocks])
+    return bundle
+
+
+class SkillBodyLoader:
+    """Loads full skill bodies on demand, once each."""
+
+    def __init__(self, skills_dir: Path):
+        self.index = SkillLoader(skills_dir).index()
+
+    def load(self, name: str) -> str:
+        """Get the full body of a skill.
+
+        Raises:
+            KeyError: If there is no local skill with this name
+        """
+        return self.index.body(name)
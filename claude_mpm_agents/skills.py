@@ -0,0 +1,273 @@
+"""Loading the repository's own ``skills/*/SKILL.md`` files.
+
+A skill file carries YAML frontmatter (name, version, category, tags,
+``context_limit`` and ``progressive_disclosure.entry_point``) followed by the
+full skill body. ``read_skill`` reads only the frontmatter; the body is read
+from its byte offset the first time ``Skill.load_body`` is called.
+
+``SkillLoader`` is the skills counterpart of the tests' ``AgentLoader``: it
+loads every skill in a directory into a ``SkillIndex`` with O(1) lookups by
+skill id (directory name, as used in agent ``skills:`` lists) and inverted
+indexes by tag and category. ``SkillIndex`` offers the same
+``names``/``describe_invalid`` interface as the claude-mpm-skills manifest
+index, so agent ``skills:`` references can be checked against the local
+skills without the external manifest.
+"""
+
+import difflib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+import yaml
+
+from claude_mpm_agents.frontmatter import read_frontmatter
+from claude_mpm_agents.yaml_loader import parse_frontmatter
+
+SKILLS_DIRNAME = "skills"
+SKILL_FILENAME = "SKILL.md"
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    """The ``progressive_disclosure.entry_point`` summary of a skill."""
+
+    summary: str = ""
+    when_to_use: str = ""
+    quick_start: str = ""
+
+
+@dataclass
+class Skill:
+    """A skill definition; the body stays on disk until load_body is called."""
+
+    name: str
+    path: Path
+    description: str = ""
+    version: str = ""
+    category: str = ""
+    tags: list[str] = field(default_factory=list)
+    context_limit: Optional[int] = None
+    entry_point: EntryPoint = field(default_factory=EntryPoint)
+    frontmatter: dict[str, Any] = field(default_factory=dict)
+    body_offset: int = 0
+    _body: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def skill_id(self) -> str:
+        """Identifier agents use in ``skills:`` (the skill's directory name)."""
+        return self.path.parent.name
+
+    @property
+    def body_loaded(self) -> bool:
+        """Check whether the body has been read into memory."""
+        return self._body is not None
+
+    def load_body(self) -> str:
+        """Read the full skill body (everything after the frontmatter), once.
+
+        Returns:
+            Stripped body text
+        """
+        if self._body is None:
+            with open(self.path, "rb") as f:
+                f.seek(self.body_offset)
+                raw = f.read()
+            self._body = raw.decode("utf-8").replace("\r\n", "\n").strip()
+        return self._body
+
+
+def default_skills_dir(root: Path) -> Path:
+    """Get the skills directory of a repository checkout."""
+    return Path(root) / SKILLS_DIRNAME
+
+
+def skill_path(skills_dir: Path, name: str) -> Path:
+    """Get the SKILL.md path of a skill by directory name."""
+    return Path(skills_dir) / name / SKILL_FILENAME
+
+
+def read_skill(path: Union[str, Path]) -> Skill:
+    """Read a skill's frontmatter without loading its body.
+
+    Args:
+        path: Path to a SKILL.md file
+
+    Returns:
+        Skill; name (the display name) defaults to the skill's directory name
+
+    Raises:
+        ValueError: If the file has no frontmatter or it is not a YAML mapping
+    """
+    path = Path(path)
+    block = read_frontmatter(path)
+    if block is None:
+        raise ValueError(f"No frontmatter found in {path}")
+    try:
+        frontmatter = parse_frontmatter(block.text)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in {path}: {e}") from e
+    if not isinstance(frontmatter, dict):
+        raise ValueError(f"Frontmatter must be a dict in {path}")
+
+    disclosure = frontmatter.get("progressive_disclosure") or {}
+    entry = disclosure.get("entry_point") if isinstance(disclosure, dict) else None
+    entry = entry if isinstance(entry, dict) else {}
+    context_limit = frontmatter.get("context_limit")
+    tags = frontmatter.get("tags") or []
+
+    return Skill(
+        name=str(frontmatter.get("name") or path.parent.name),
+        path=path,
+        description=str(frontmatter.get("description") or ""),
+        version=str(frontmatter.get("version") or ""),
+        category=str(frontmatter.get("category") or ""),
+        tags=[str(tag) for tag in tags] if isinstance(tags, list) else [],
+        context_limit=context_limit if isinstance(context_limit, int) else None,
+        entry_point=EntryPoint(
+            summary=str(entry.get("summary") or frontmatter.get("description") or ""),
+            when_to_use=str(entry.get("when_to_use") or ""),
+            quick_start=str(entry.get("quick_start") or ""),
+        ),
+        frontmatter=frontmatter,
+        body_offset=block.body_offset,
+    )
+
+
+def _normalize_key(value: str) -> str:
+    return value.strip().lower()
+
+
+@dataclass
+class SkillIndex:
+    """Skills by skill_id, with inverted indexes by tag and category."""
+
+    skills: dict[str, Skill] = field(default_factory=dict)
+    by_tag: dict[str, list[str]] = field(default_factory=dict)
+    by_category: dict[str, list[str]] = field(default_factory=dict)
+    source: Optional[Path] = None  # Directory the skills were loaded from
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[Skill], source: Optional[Path] = None) -> "SkillIndex":
+        """Index skills; the first skill with a given skill_id wins."""
+        index = cls(source=source)
+        for skill in skills:
+            skill_id = skill.skill_id
+            if skill_id in index.skills:
+                continue
+            index.skills[skill_id] = skill
+            for tag in dict.fromkeys(_normalize_key(tag) for tag in skill.tags):
+                index.by_tag.setdefault(tag, []).append(skill_id)
+            if skill.category:
+                index.by_category.setdefault(_normalize_key(skill.category), []).append(skill_id)
+        return index
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.skills
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def get(self, name: str) -> Optional[Skill]:
+        """Look up a skill by skill_id."""
+        return self.skills.get(name)
+
+    def names(self) -> set[str]:
+        """Get all skill ids."""
+        return set(self.skills)
+
+    def with_tag(self, tag: str) -> list[Skill]:
+        """Get the skills carrying a tag (case-insensitive)."""
+        return [self.skills[name] for name in self.by_tag.get(_normalize_key(tag), [])]
+
+    def in_category(self, category: str) -> list[Skill]:
+        """Get the skills in a category (case-insensitive)."""
+        return [self.skills[name] for name in self.by_category.get(_normalize_key(category), [])]
+
+    def find(self, tags: Iterable[str] = (), category: Optional[str] = None) -> list[Skill]:
+        """Get the skills matching every given tag and the category, if given.
+
+        Returns:
+            Matching skills in index order
+        """
+        candidates: Optional[set[str]] = None
+        if category is not None:
+            candidates = set(self.by_category.get(_normalize_key(category), []))
+        for tag in tags:
+            names = set(self.by_tag.get(_normalize_key(tag), []))
+            candidates = names if candidates is None else candidates & names
+        if candidates is None:
+            return list(self.skills.values())
+        return [skill for name, skill in self.skills.items() if name in candidates]
+
+    def body(self, name: str) -> str:
+        """Get the full body of a skill, loading it on first use.
+
+        Raises:
+            KeyError: If the skill is not in the index
+        """
+        skill = self.skills.get(name)
+        if skill is None:
+            raise KeyError(f"Skill not found: {name}")
+        return skill.load_body()
+
+    def describe_invalid(self, name: str) -> str:
+        """Format an unknown skill name with its closest local skill, if any."""
+        matches = difflib.get_close_matches(name, self.skills, n=1, cutoff=0.6)
+        if not matches:
+            return name
+        closest = self.skills[matches[0]]
+        return f"{name} (closest: {closest.skill_id} in {closest.category or 'skills'})"
+
+
+class SkillLoader:
+    """Load skill definitions from ``<skills_dir>/*/SKILL.md``."""
+
+    def __init__(self, skills_dir: Path):
+        """Initialize loader with a skills directory.
+
+        Args:
+            skills_dir: Directory containing one subdirectory per skill
+        """
+        self.skills_dir = Path(skills_dir)
+        self.errors: dict[Path, str] = {}  # Skill files that could not be read
+        self._index: Optional[SkillIndex] = None
+
+    def skill_files(self) -> list[Path]:
+        """Get every SKILL.md in the directory, sorted."""
+        if not self.skills_dir.is_dir():
+            return []
+        return sorted(self.skills_dir.glob(f"*/{SKILL_FILENAME}"))
+
+    def load_skill(self, path: Path) -> Skill:
+        """Load a single skill (frontmatter only).
+
+        Raises:
+            ValueError: If the frontmatter is missing or invalid
+        """
+        return read_skill(path)
+
+    def load_all_skills(self) -> list[Skill]:
+        """Load every skill, recording unreadable files in ``errors``.
+
+        Returns:
+            Skills in directory order
+        """
+        skills = []
+        self.errors = {}
+        for path in self.skill_files():
+            try:
+                skills.append(self.load_skill(path))
+            except (OSError, UnicodeDecodeError, ValueError) as e:
+                self.errors[path] = str(e)
+        return skills
+
+    def index(self) -> SkillIndex:
+        """Get the skill index, loading the directory on first use.
+
+        Returns:
+            SkillIndex (empty if the directory does not exist)
+        """
+        if self._index is None:
+            self._index = SkillIndex.from_skills(self.load_all_skills(), self.skills_dir)
+        return self._index
@@ -0,0 +1,222 @@
+"""Index of the claude-mpm-skills manifest.
+
+``manifest.json`` groups skills under ``universal``, ``toolchains.<name>`` and
+``examples``. ``load_skill_manifest`` flattens it once into a name -> entry
+dict and caches the result both in-process and on disk, keyed by the
+manifest's path, mtime and size, so build validation, scripts/audit_skills.py
+and the skills tests share one traversal.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+SKILL_INDEX_CACHE_VERSION = 1
+
+# Pseudo-toolchains for the non-toolchain manifest sections
+UNIVERSAL = "universal"
+EXAMPLES = "examples"
+
+
+def default_manifest_path(root_dir: Path) -> Path:
+    """Get the conventional manifest location next to this repository.
+
+    Args:
+        root_dir: Root directory of the agents repository
+
+    Returns:
+        Path to ../claude-mpm-skills/manifest.json
+    """
+    return Path(root_dir).parent / "claude-mpm-skills" / "manifest.json"
+
+
+def default_cache_dir() -> Path:
+    """Get the directory used for on-disk skill index caches."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "claude-mpm-agents"
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    """A skill listed in the manifest."""
+
+    name: str
+    toolchain: str  # Toolchain name, or "universal" / "examples"
+    metadata: dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+
+@dataclass
+class SkillManifestIndex:
+    """Flattened, O(1) lookup view of a skills manifest."""
+
+    skills: dict[str, SkillEntry]
+    source: Optional[Path] = None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.skills
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def get(self, name: str) -> Optional[SkillEntry]:
+        """Look up a skill by name."""
+        return self.skills.get(name)
+
+    def names(self) -> set[str]:
+        """Get all skill names."""
+        return set(self.skills)
+
+    def toolchain_of(self, name: str) -> Optional[str]:
+        """Get the toolchain a skill belongs to."""
+        entry = self.skills.get(name)
+        return entry.toolchain if entry else None
+
+    def closest(self, name: str) -> Optional[SkillEntry]:
+        """Find the manifest skill most similar to an unknown skill name.
+
+        Args:
+            name: Skill name that is not in the manifest
+
+        Returns:
+            Closest SkillEntry, or None if nothing is reasonably similar
+        """
+        matches = difflib.get_close_matches(name, self.skills, n=1, cutoff=0.6)
+        if not matches:
+            # Rank the skills of a toolchain named in the skill name (e.g. the
+            # rust- skills for rust-unsafe) with a looser cutoff
+            tokens = set(name.lower().split("-"))
+            candidates = [
+                entry.name for entry in self.skills.values() if entry.toolchain.lower() in tokens
+            ]
+            matches = difflib.get_close_matches(name, candidates, n=1, cutoff=0.4)
+        return self.skills[matches[0]] if matches else None
+
+    def describe_invalid(self, name: str) -> str:
+        """Format an unknown skill name with its closest manifest match, if any."""
+        entry = self.closest(name)
+        if entry is None:
+            return name
+        return f"{name} (closest: {entry.name} in {entry.toolchain})"
+
+
+def _add_skills(skills: dict[str, SkillEntry], items: Any, toolchain: str) -> None:
+    """Add manifest list items (dicts with a name, or bare strings) to the index."""
+    if not isinstance(items, list):
+        return
+    for item in items:
+        if isinstance(item, dict) and item.get("name"):
+            skills.setdefault(item["name"], SkillEntry(item["name"], toolchain, item))
+        elif isinstance(item, str) and item:
+            skills.setdefault(item, SkillEntry(item, toolchain))
+
+
+def build_skill_index(
+    manifest: dict[str, Any], source: Optional[Path] = None
+) -> SkillManifestIndex:
+    """Flatten a parsed manifest into a SkillManifestIndex.
+
+    Accepts both the nested (``{"skills": {"universal": ...}}``) and flat
+    (``{"universal": ...}``) layouts.
+
+    Args:
+        manifest: Parsed manifest.json
+        source: Manifest path, for reference
+
+    Returns:
+        SkillManifestIndex
+    """
+    sections = manifest.get("skills", manifest) if isinstance(manifest, dict) else {}
+    if not isinstance(sections, dict):
+        sections = {}
+
+    skills: dict[str, SkillEntry] = {}
+    _add_skills(skills, sections.get(UNIVERSAL), UNIVERSAL)
+    toolchains = sections.get("toolchains")
+    if isinstance(toolchains, dict):
+        for toolchain, items in toolchains.items():
+            _add_skills(skills, items, toolchain)
+    _add_skills(skills, sections.get(EXAMPLES), EXAMPLES)
+
+    return SkillManifestIndex(skills=skills, source=source)
+
+
+# In-process cache: resolved manifest path -> ((mtime_ns, size), index)
+_loaded: dict[Path, tuple[tuple[int, int], SkillManifestIndex]] = {}
+
+
+def _cache_file(manifest_path: Path, cache_dir: Path) -> Path:
+    key = hashlib.sha256(str(manifest_path).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"skills-index-{key}.json"
+
+
+def _read_disk_cache(
+    cache_file: Path, stamp: tuple[int, int], manifest_path: Path
+) -> Optional[SkillManifestIndex]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != SKILL_INDEX_CACHE_VERSION or data.get("stamp") != list(stamp):
+        return None
+    skills = {
+        name: SkillEntry(name, toolchain, metadata)
+        for name, (toolchain, metadata) in data.get("skills", {}).items()
+    }
+    return SkillManifestIndex(skills=skills, source=manifest_path)
+
+
+def _write_disk_cache(cache_file: Path, stamp: tuple[int, int], index: SkillManifestIndex) -> None:
+    payload = {
+        "version": SKILL_INDEX_CACHE_VERSION,
+        "stamp": list(stamp),
+        "skills": {name: [e.toolchain, e.metadata] for name, e in index.skills.items()},
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is an optimization; an unwritable cache dir is not an error
+        pass
+
+
+def load_skill_manifest(
+    manifest_path: Path, cache_dir: Optional[Path] = None, use_disk_cache: bool = True
+) -> SkillManifestIndex:
+    """Load the skill index for a manifest, reusing cached indexes when unchanged.
+
+    Args:
+        manifest_path: Path to manifest.json
+        cache_dir: Directory for the on-disk cache (default: XDG cache dir)
+        use_disk_cache: Whether to read and write the on-disk cache
+
+    Returns:
+        SkillManifestIndex
+
+    Raises:
+        FileNotFoundError: If the manifest does not exist
+        ValueError: If the manifest is not valid JSON
+    """
+    manifest_path = Path(manifest_path).resolve()
+    stat = manifest_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _loaded.get(manifest_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    cache_file = _cache_file(manifest_path, cache_dir or default_cache_dir())
+    index = _read_disk_cache(cache_file, stamp, manifest_path) if use_disk_cache else None
+    if index is None:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        index = build_skill_index(manifest, manifest_path)
+        if use_disk_cache:
+            _write_disk_cache(cache_file, stamp, index)
+
+    _loaded[manifest_path] = (stamp, index)
+    return index
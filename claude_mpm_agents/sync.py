@@ -0,0 +1,355 @@
+"""Manifest-driven agent sync.
+
+Instead of sending one conditional request per agent URL (as the etag cache in
+``agents/.etag-cache.json`` requires), a sync downloads the source's
+``MANIFEST.json`` (see ``claude_mpm_agents.build_manifest``), compares it with
+the state recorded by the previous sync, and fetches only the files whose
+digests differ. Fetches run concurrently on a bounded thread pool, each file is
+verified against its manifest digest and written atomically, and the sync state
+is replaced atomically once the fetches complete.
+
+Sources:
+
+- ``HttpSource``: a base URL serving MANIFEST.json and the files it lists
+- ``DirectorySource``: a local directory (e.g. ``dist/agents``)
+- ``TarballSource``: a local ``.tar``/``.tar.gz`` archive
+
+``DirectorySource`` and ``TarballSource`` hash their files when they have no
+MANIFEST.json, so they work as local stand-ins for a remote.
+"""
+
+import hashlib
+import json
+import tarfile
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Optional, Protocol, Union
+
+from claude_mpm_agents.build_manifest import MANIFEST_FILENAME, MANIFEST_VERSION
+from claude_mpm_agents.output import OutputWriter, write_if_changed
+
+SYNC_STATE_FILENAME = ".sync-state.json"
+SYNC_STATE_VERSION = 1
+DEFAULT_MAX_WORKERS = 8
+
+# Manifest entries keyed by path relative to the tree root
+Manifest = dict[str, dict[str, Any]]
+
+
+class SyncError(Exception):
+    """Raised when a source cannot be read or a fetched file fails verification."""
+
+
+class SyncSource(Protocol):
+    """A place agents are synced from."""
+
+    def manifest(self) -> Manifest:
+        """Get the source manifest (path -> entry with at least sha256 and size)."""
+        ...
+
+    def fetch(self, path: str) -> bytes:
+        """Get the content of one file listed in the manifest."""
+        ...
+
+
+def _digest_entry(data: bytes) -> dict[str, Any]:
+    return {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data)}
+
+
+def _is_synced_path(path: PurePosixPath) -> bool:
+    """Check whether a relative path is content (not a manifest or hidden file)."""
+    return str(path) != MANIFEST_FILENAME and not any(p.startswith(".") for p in path.parts)
+
+
+def _manifest_agents(data: Any, origin: str) -> Manifest:
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        raise SyncError(f"Unsupported manifest in {origin}")
+    return data.get("agents", {})
+
+
+def hash_tree(root: Path) -> Manifest:
+    """Build a manifest for a local directory by hashing its files.
+
+    Args:
+        root: Directory to hash
+
+    Returns:
+        Manifest of every non-hidden file except MANIFEST.json
+    """
+    entries = {}
+    for path in sorted(root.rglob("*")):
+        relative = PurePosixPath(path.relative_to(root).as_posix())
+        if path.is_file() and _is_synced_path(relative):
+            entries[str(relative)] = _digest_entry(path.read_bytes())
+    return entries
+
+
+class DirectorySource:
+    """Sync source backed by a local directory."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def manifest(self) -> Manifest:
+        manifest_path = self.root / MANIFEST_FILENAME
+        if manifest_path.is_file():
+            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+            return _manifest_agents(data, str(manifest_path))
+        return hash_tree(self.root)
+
+    def fetch(self, path: str) -> bytes:
+        return (self.root / path).read_bytes()
+
+
+class TarballSource:
+    """Sync source backed by a local tar archive.
+
+    Members are read once and kept in memory; agent catalogs are small.
+    """
+
+    def __init__(self, archive: Path, prefix: str = ""):
+        self.archive = Path(archive)
+        self.prefix = prefix.strip("/")
+        self._files: Optional[dict[str, bytes]] = None
+
+    def _load(self) -> dict[str, bytes]:
+        if self._files is None:
+            files = {}
+            with tarfile.open(self.archive) as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    name = PurePosixPath(member.name)
+                    if self.prefix:
+                        if not name.is_relative_to(self.prefix):
+                            continue
+                        name = name.relative_to(self.prefix)
+                    extracted = tar.extractfile(member)
+                    if extracted is not None:
+                        files[str(name)] = extracted.read()
+            self._files = files
+        return self._files
+
+    def manifest(self) -> Manifest:
+        files = self._load()
+        if MANIFEST_FILENAME in files:
+            data = json.loads(files[MANIFEST_FILENAME].decode("utf-8"))
+            return _manifest_agents(data, f"{self.archive}:{MANIFEST_FILENAME}")
+        return {
+            path: _digest_entry(data)
+            for path, data in sorted(files.items())
+            if _is_synced_path(PurePosixPath(path))
+        }
+
+    def fetch(self, path: str) -> bytes:
+        try:
+            return self._load()[path]
+        except KeyError:
+            raise SyncError(f"{path} not found in {self.archive}") from None
+
+
+class HttpSource:
+    """Sync source backed by a base URL that serves MANIFEST.json and its files."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.timeout = timeout
+
+    def _get(self, path: str) -> bytes:
+        url = urllib.parse.urljoin(self.base_url, urllib.parse.quote(path))
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                return response.read()
+        except OSError as e:  # URLError and HTTPError are OSErrors
+            raise SyncError(f"Failed to fetch {url}: {e}") from e
+
+    def manifest(self) -> Manifest:
+        data = json.loads(self._get(MANIFEST_FILENAME).decode("utf-8"))
+        return _manifest_agents(data, self.base_url + MANIFEST_FILENAME)
+
+    def fetch(self, path: str) -> bytes:
+        return self._get(path)
+
+
+def open_source(spec: Union[str, Path]) -> SyncSource:
+    """Create a sync source from a URL, directory or tarball path.
+
+    Args:
+        spec: ``http(s)://`` base URL, directory, or ``.tar``/``.tar.gz``/``.tgz`` file
+
+    Returns:
+        Matching SyncSource
+
+    Raises:
+        SyncError: If spec is none of the supported kinds
+    """
+    text = str(spec)
+    if text.startswith(("http://", "https://")):
+        return HttpSource(text)
+    path = Path(spec)
+    if path.is_dir():
+        return DirectorySource(path)
+    if path.is_file() and tarfile.is_tarfile(path):
+        return TarballSource(path)
+    raise SyncError(f"Unsupported sync source: {spec}")
+
+
+@dataclass
+class SyncPlan:
+    """Files a sync has to fetch and delete."""
+
+    fetch: list[str] = field(default_factory=list)
+    delete: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a sync."""
+
+    plan: SyncPlan
+    fetched: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def load_sync_state(dest: Path) -> Manifest:
+    """Load the manifest recorded by the last sync into dest.
+
+    Returns:
+        Manifest entries, or an empty dict if dest was never synced
+    """
+    try:
+        data = json.loads((Path(dest) / SYNC_STATE_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SYNC_STATE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_sync_state(dest: Path, files: Manifest) -> None:
+    """Atomically replace the sync state of dest."""
+    payload = {"version": SYNC_STATE_VERSION, "files": dict(sorted(files.items()))}
+    Path(dest).mkdir(parents=True, exist_ok=True)
+    write_if_changed(Path(dest) / SYNC_STATE_FILENAME, json.dumps(payload, indent=2) + "\n")
+
+
+def _local_matches(path: Path, entry: dict[str, Any], recorded: Optional[dict[str, Any]]) -> bool:
+    """Check whether a local file already has a manifest entry's content.
+
+    Files recorded by the last sync with the same digest are only checked for
+    size; unrecorded files (first sync into an existing tree) are hashed.
+    """
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return False
+    if size != entry.get("size", size):
+        return False
+    if recorded is not None and recorded.get("sha256") == entry["sha256"]:
+        return True
+    return hashlib.sha256(path.read_bytes()).hexdigest() == entry["sha256"]
+
+
+def plan_sync(source_manifest: Manifest, dest: Path, delete: bool = False) -> SyncPlan:
+    """Compute the minimal set of files to fetch into dest.
+
+    Args:
+        source_manifest: Manifest of the source
+        dest: Local tree being synced
+        delete: Whether files recorded by the last sync but no longer in the
+            source should be deleted
+
+    Returns:
+        SyncPlan with sorted relative paths
+
+    Raises:
+        SyncError: If the manifest lists a path outside dest
+    """
+    dest = Path(dest)
+    state = load_sync_state(dest)
+    plan = SyncPlan()
+
+    for path, entry in sorted(source_manifest.items()):
+        relative = PurePosixPath(path)
+        if relative.is_absolute() or ".." in relative.parts:
+            raise SyncError(f"Refusing to sync path outside the destination: {path}")
+        if _local_matches(dest / path, entry, state.get(path)):
+            plan.unchanged.append(path)
+        else:
+            plan.fetch.append(path)
+
+    if delete:
+        plan.delete = sorted(state.keys() - source_manifest.keys())
+    return plan
+
+
+def sync(
+    source: SyncSource,
+    dest: Path,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    delete: bool = False,
+) -> SyncResult:
+    """Sync a local tree with a source, fetching only changed files.
+
+    Args:
+        source: Where to sync from
+        dest: Local tree to update
+        max_workers: Maximum concurrent fetches
+        delete: Remove files the source no longer lists (only files written by
+            a previous sync are ever deleted)
+
+    Returns:
+        SyncResult; per-file failures are collected in ``errors`` and leave
+        those files (and their recorded state) unchanged
+    """
+    dest = Path(dest)
+    source_manifest = source.manifest()
+    plan = plan_sync(source_manifest, dest, delete=delete)
+    result = SyncResult(plan=plan)
+
+    writer = OutputWriter()
+    writer.ensure_dirs(dest / path for path in plan.fetch)
+
+    def fetch_one(path: str) -> None:
+        data = source.fetch(path)
+        expected = source_manifest[path]["sha256"]
+        if hashlib.sha256(data).hexdigest() != expected:
+            raise SyncError(f"Digest mismatch for {path}")
+        writer.write(dest / path, data)
+
+    if plan.fetch:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {path: executor.submit(fetch_one, path) for path in plan.fetch}
+        for path, future in futures.items():
+            error = future.exception()
+            if error is None:
+                result.fetched.append(path)
+            else:
+                result.errors[path] = str(error)
+
+    for path in plan.delete:
+        (dest / path).unlink(missing_ok=True)
+        result.deleted.append(path)
+
+    # Record what is now on disk: synced files plus previously recorded
+    # files whose fetch failed
+    previous = load_sync_state(dest)
+    state = {path: source_manifest[path] for path in plan.unchanged + result.fetched}
+    for path in result.errors:
+        if path in previous:
+            state[path] = previous[path]
+    if not delete:
+        for path, entry in previous.items():
+            state.setdefault(path, entry)
+    save_sync_state(dest, state)
+
+    return result
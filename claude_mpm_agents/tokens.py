@@ -0,0 +1,222 @@
+"""Approximate token counts and prompt budgets for built agents.
+
+The build measures every built agent and each of its sections (frontmatter,
+the agent's own body, and every inherited BASE-AGENT.md) and checks the total
+against a per-agent budget:
+
+- ``context_limit`` in the agent frontmatter, if set, is the budget
+- otherwise the budget is ``max_tokens * budget_ratio``
+- otherwise ``DEFAULT_TOKEN_BUDGET``
+
+Counting is offline. The default ``heuristic`` counter approximates a BPE
+tokenizer from word, number, punctuation and newline runs; when ``tiktoken``
+is installed the ``tiktoken`` counter gives exact cl100k_base counts.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+try:
+    import tiktoken
+
+    HAS_TIKTOKEN = True
+except ImportError:  # Optional dependency
+    tiktoken = None
+    HAS_TIKTOKEN = False
+
+TOKEN_REPORT_FILENAME = "token-report.json"
+DEFAULT_TOKEN_BUDGET = 16384
+DEFAULT_BUDGET_RATIO = 4.0
+TOKENIZERS = ("heuristic", "tiktoken")
+
+# Letters per token for long words, digits per token (cl100k splits numbers in
+# groups of three), and punctuation characters per token (``**``, ``---`` and
+# code fences usually merge)
+_LETTERS_PER_TOKEN = 6
+_DIGITS_PER_TOKEN = 3
+_PUNCT_PER_TOKEN = 2
+
+_PIECE = re.compile(
+    r"(?P<word>[A-Za-z]+)|(?P<number>[0-9]+)|(?P<punct>[!-/:-@\[-`{-~]+)|(?P<newline>\n+)"
+    r"|(?P<other>[^\x00-\x7f])"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Approximate token count
+    """
+    tokens = 0
+    for match in _PIECE.finditer(text):
+        kind = match.lastgroup
+        length = match.end() - match.start()
+        if kind == "word":
+            tokens += 1 + (length - 1) // _LETTERS_PER_TOKEN
+        elif kind == "number":
+            tokens += 1 + (length - 1) // _DIGITS_PER_TOKEN
+        elif kind == "punct":
+            tokens += 1 + (length - 1) // _PUNCT_PER_TOKEN
+        elif kind == "newline":
+            tokens += 1
+        else:
+            # Emoji and other non-ASCII characters cost about one token per two UTF-8 bytes
+            tokens += max(1, len(match.group().encode("utf-8")) // 2)
+    return tokens
+
+
+def get_token_counter(tokenizer: str = "heuristic") -> Callable[[str], int]:
+    """Get a token counting function.
+
+    Args:
+        tokenizer: "heuristic" or "tiktoken" (cl100k_base)
+
+    Returns:
+        Function mapping text to a token count
+
+    Raises:
+        ValueError: If the tokenizer is unknown or tiktoken is not installed
+    """
+    if tokenizer == "heuristic":
+        return estimate_tokens
+    if tokenizer == "tiktoken":
+        if not HAS_TIKTOKEN:
+            raise ValueError("tiktoken is not installed; use the heuristic tokenizer")
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    raise ValueError(f"Unknown tokenizer: {tokenizer} (expected one of {', '.join(TOKENIZERS)})")
+
+
+def measure_sections(
+    sections: list[tuple[str, str]], total_text: str, counter: Callable[[str], int]
+) -> dict[str, Any]:
+    """Count tokens of a built agent and its sections.
+
+    Args:
+        sections: (label, text) pairs, e.g. ("BASE-AGENT.md", base body)
+        total_text: Full built agent content
+        counter: Token counting function
+
+    Returns:
+        JSON-serializable {"total": int, "sections": [{"label", "tokens"}]}
+    """
+    return {
+        "total": counter(total_text),
+        "sections": [{"label": label, "tokens": counter(text)} for label, text in sections],
+    }
+
+
+def agent_budget(
+    frontmatter: dict[str, Any], budget_ratio: float = DEFAULT_BUDGET_RATIO
+) -> tuple[int, str]:
+    """Work out an agent's prompt token budget from its frontmatter.
+
+    Args:
+        frontmatter: Parsed agent frontmatter
+        budget_ratio: Budget as a multiple of max_tokens, when context_limit is unset
+
+    Returns:
+        (budget, source) where source names the frontmatter field used
+    """
+    context_limit = frontmatter.get("context_limit")
+    if isinstance(context_limit, int) and context_limit > 0:
+        return context_limit, "context_limit"
+    max_tokens = frontmatter.get("max_tokens")
+    if isinstance(max_tokens, int) and max_tokens > 0:
+        return int(max_tokens * budget_ratio), "max_tokens"
+    return DEFAULT_TOKEN_BUDGET, "default"
+
+
+@dataclass
+class AgentTokenUsage:
+    """Token usage of one built agent against its budget."""
+
+    path: str
+    agent_id: str
+    total: int
+    budget: int
+    budget_source: str
+    sections: list[dict[str, Any]]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.total > self.budget
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "agent_id": self.agent_id,
+            "total": self.total,
+            "budget": self.budget,
+            "budget_source": self.budget_source,
+            "over_budget": self.over_budget,
+            "sections": self.sections,
+        }
+
+
+def build_token_report(usages: list[AgentTokenUsage], tokenizer: str) -> dict[str, Any]:
+    """Build the token report for a set of agents.
+
+    Agents are sorted by total tokens. Sections are aggregated across agents
+    (an inherited BASE-AGENT.md is counted once per agent that includes it)
+    and sorted by the tokens they contribute to the whole catalog.
+
+    Args:
+        usages: Token usage of every built agent
+        tokenizer: Name of the tokenizer used
+
+    Returns:
+        JSON-serializable report
+    """
+    sections: dict[str, dict[str, Any]] = {}
+    for usage in usages:
+        for section in usage.sections:
+            entry = sections.setdefault(
+                section["label"], {"label": section["label"], "tokens": 0, "agents": 0}
+            )
+            entry["tokens"] = max(entry["tokens"], section["tokens"])
+            entry["agents"] += 1
+    for entry in sections.values():
+        entry["total_tokens"] = entry["tokens"] * entry["agents"]
+
+    agents = sorted(usages, key=lambda usage: (-usage.total, usage.path))
+    return {
+        "tokenizer": tokenizer,
+        "total_tokens": sum(usage.total for usage in usages),
+        "over_budget": [usage.path for usage in agents if usage.over_budget],
+        "agents": [usage.to_dict() for usage in agents],
+        "sections": sorted(sections.values(), key=lambda e: (-e["total_tokens"], e["label"])),
+    }
+
+
+def format_token_report(report: dict[str, Any], top: Optional[int] = 10) -> str:
+    """Format the heaviest agents and sections of a token report as text.
+
+    Args:
+        report: Report from build_token_report
+        top: Number of agents and sections to list (None for all)
+
+    Returns:
+        Multi-line report
+    """
+    lines = [f"Token report ({report['tokenizer']}), {report['total_tokens']:,} tokens total", ""]
+    lines.append("Heaviest agents:")
+    for agent in report["agents"][:top]:
+        marker = "❌" if agent["over_budget"] else "  "
+        lines.append(
+            f"{marker} {agent['total']:>8,} / {agent['budget']:<8,} {agent['path']}"
+            f" (budget from {agent['budget_source']})"
+        )
+    lines.append("")
+    lines.append("Heaviest sections (tokens x agents):")
+    for section in report["sections"][:top]:
+        lines.append(
+            f"   {section['total_tokens']:>8,} = {section['tokens']:>7,} x {section['agents']:<3}"
+            f" {section['label']}"
+        )
+    return "\n".join(lines)
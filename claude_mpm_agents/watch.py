@@ -0,0 +1,277 @@
+"""File watchers for rebuilding agents as their sources change.
+
+``InotifyWatcher`` uses Linux inotify through ctypes so no extra dependency is
+needed; ``PollingWatcher`` compares mtime/size snapshots and works everywhere.
+``create_watcher`` picks inotify when available and falls back to polling.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+WATCHED_SUFFIX = ".md"
+
+# inotify event flags (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def snapshot_tree(root: Path) -> dict[Path, tuple[int, int]]:
+    """Record (mtime_ns, size) for every watched file under root.
+
+    Args:
+        root: Directory to scan
+
+    Returns:
+        Dict mapping file path to (mtime_ns, size)
+    """
+    snapshot = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(Path(entry.path))
+            elif entry.name.endswith(WATCHED_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class PollingWatcher:
+    """Detect changed files by periodically comparing directory snapshots."""
+
+    def __init__(self, root: Path, interval: float = 0.5):
+        """Initialize watcher.
+
+        Args:
+            root: Directory to watch recursively
+            interval: Seconds between snapshots
+        """
+        self.root = Path(root)
+        self.interval = interval
+        self._snapshot = snapshot_tree(self.root)
+
+    def wait(self, timeout: Optional[float] = None) -> set[Path]:
+        """Block until files change or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Set of created, modified or deleted file paths (empty on timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = snapshot_tree(self.root)
+            changed = {
+                path
+                for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+
+    def close(self) -> None:
+        """Release resources (nothing to do for polling)."""
+
+
+class InotifyWatcher:
+    """Detect changed files with Linux inotify."""
+
+    def __init__(self, root: Path):
+        """Initialize watcher and add watches for every directory under root.
+
+        Args:
+            root: Directory to watch recursively
+
+        Raises:
+            OSError: If inotify is unavailable on this platform
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self.root = Path(root)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._watches: dict[int, Path] = {}
+        self._files: set[Path] = set()  # Watched files known to exist
+        self._add_tree(self.root)
+
+    def _add_watch(self, directory: Path) -> None:
+        """Watch a single directory."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._watches[wd] = directory
+
+    def _add_tree(self, directory: Path) -> set[Path]:
+        """Watch a directory tree.
+
+        Returns:
+            Watched files already present in the tree
+        """
+        self._add_watch(directory)
+        existing = set()
+        for entry in os.scandir(directory):
+            if entry.is_dir(follow_symlinks=False):
+                existing |= self._add_tree(Path(entry.path))
+            elif entry.name.endswith(WATCHED_SUFFIX):
+                existing.add(Path(entry.path))
+        self._files |= existing
+        return existing
+
+    def _drop_tree(self, directory: Path) -> set[Path]:
+        """Stop watching a directory tree that was moved away or deleted.
+
+        Returns:
+            Watched files that were in the tree
+        """
+        for wd, watched in list(self._watches.items()):
+            if watched.is_relative_to(directory):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+        gone = {path for path in self._files if path.is_relative_to(directory)}
+        self._files -= gone
+        return gone
+
+    def _read_events(self) -> set[Path]:
+        """Drain pending inotify events into a set of changed files."""
+        changed: set[Path] = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, name_len = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                raw_name = buffer[offset : offset + name_len]
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were lost - report every file, present or gone, as changed
+                    current = set(snapshot_tree(self.root))
+                    changed |= current | self._files
+                    self._files = current
+                    continue
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    # The watched directory itself went away (e.g. the root was renamed)
+                    changed |= self._drop_tree(directory)
+                    continue
+                if not name_len:
+                    continue
+                path = directory / os.fsdecode(raw_name.rstrip(b"\0"))
+
+                if mask & IN_ISDIR:
+                    if mask & (IN_MOVED_FROM | IN_DELETE):
+                        # Directory moved away or removed: its files are deleted
+                        changed |= self._drop_tree(path)
+                    elif mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                        # New directory: watch it and treat its contents as created
+                        changed |= self._add_tree(path)
+                elif path.name.endswith(WATCHED_SUFFIX):
+                    if mask & (IN_MOVED_FROM | IN_DELETE):
+                        self._files.discard(path)
+                    else:
+                        self._files.add(path)
+                    changed.add(path)
+
+    def wait(self, timeout: Optional[float] = None) -> set[Path]:
+        """Block until files change or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Set of created, modified or deleted file paths (empty on timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if readable:
+                changed = self._read_events()
+                if changed:
+                    return changed
+            elif deadline is not None:
+                return set()
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(root: Path, poll_interval: float = 0.5, use_polling: bool = False):
+    """Create the best available watcher for a directory tree.
+
+    Args:
+        root: Directory to watch recursively
+        poll_interval: Seconds between snapshots when polling
+        use_polling: Force the polling watcher
+
+    Returns:
+        InotifyWatcher when supported, otherwise PollingWatcher
+    """
+    if not use_polling:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            # No inotify (non-Linux, missing libc symbol, or watch limit reached)
+            pass
+    return PollingWatcher(root, poll_interval)
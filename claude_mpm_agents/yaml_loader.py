@@ -0,0 +1,119 @@
+"""Fast YAML parsing for agent and skill frontmatter.
+
+Uses PyYAML's LibYAML-backed ``CSafeLoader`` when PyYAML was built with it and
+falls back to the pure-Python ``SafeLoader`` otherwise. Frontmatter results
+are kept in a bounded LRU cache keyed by a hash of the YAML text, so the same
+frontmatter parsed by several tools in one process is only parsed once.
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+    HAS_LIBYAML = False
+
+FRONTMATTER_CACHE_SIZE = 1024
+
+
+class CacheInfo(NamedTuple):
+    """Frontmatter cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def load_yaml(text: str, loader: type = SafeLoader) -> Any:
+    """Parse YAML text with the fastest available safe loader.
+
+    Args:
+        text: YAML document
+        loader: Loader class (defaults to CSafeLoader when available)
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    return yaml.load(text, Loader=loader)
+
+
+class _FrontmatterCache:
+    """Thread-safe bounded LRU cache of parsed frontmatter."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, text: str) -> Any:
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+
+        data = load_yaml(text)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        # Callers may mutate the result, so never hand out the cached object
+        return copy.deepcopy(data)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache = _FrontmatterCache(FRONTMATTER_CACHE_SIZE)
+
+
+def parse_frontmatter(text: str) -> Any:
+    """Parse frontmatter YAML, reusing cached results for identical text.
+
+    Args:
+        text: Frontmatter YAML (without ``---`` delimiters)
+
+    Returns:
+        Parsed YAML data (a fresh copy the caller may modify)
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    return _cache.parse(text)
+
+
+def frontmatter_cache_info() -> CacheInfo:
+    """Get frontmatter cache hit/miss statistics."""
+    return _cache.info()
+
+
+def clear_frontmatter_cache() -> None:
+    """Empty the frontmatter cache and reset its statistics."""
+    _cache.clear()
@@ -2,40 +2,18 @@
 """
 Audit skill references in agents against claude-mpm-skills manifest.
 """
-import json
 import re
+import sys
 from pathlib import Path
-from collections import defaultdict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_mpm_agents.skills_manifest import load_skill_manifest
 
 
 def extract_skills_from_manifest(manifest_path):
     """Extract all skill names from the manifest."""
-    with open(manifest_path) as f:
-        manifest = json.load(f)
-
-    skills = set()
-
-    # Handle universal skills (list of dicts)
-    if 'universal' in manifest['skills']:
-        for skill in manifest['skills']['universal']:
-            if isinstance(skill, dict) and 'name' in skill:
-                skills.add(skill['name'])
-
-    # Handle toolchains (nested dict of lists of dicts)
-    if 'toolchains' in manifest['skills']:
-        for toolchain, toolchain_skills in manifest['skills']['toolchains'].items():
-            if isinstance(toolchain_skills, list):
-                for skill in toolchain_skills:
-                    if isinstance(skill, dict) and 'name' in skill:
-                        skills.add(skill['name'])
-
-    # Handle examples (if present)
-    if 'examples' in manifest['skills']:
-        for skill in manifest['skills']['examples']:
-            if isinstance(skill, dict) and 'name' in skill:
-                skills.add(skill['name'])
-
-    return skills
+    return load_skill_manifest(manifest_path).names()
 
 
 def extract_skills_from_agent(agent_path):
@@ -68,7 +46,8 @@ def main():
         print(f"❌ Manifest not found at {manifest_path}")
         return
     
-    valid_skills = extract_skills_from_manifest(manifest_path)
+    skill_index = load_skill_manifest(manifest_path)
+    valid_skills = skill_index.names()
     print(f"✅ Found {len(valid_skills)} valid skills in manifest\n")
     
     # Scan all agents
@@ -97,6 +76,7 @@ def main():
                 'path': rel_path,
                 'valid': valid,
                 'invalid': invalid,
+                'closest': {s: skill_index.closest(s) for s in invalid},
                 'all_skills': agent_skills
             })
     
@@ -107,6 +87,9 @@ def main():
         if agent['valid']:
             print(f"   ✅ Keep: {', '.join(agent['valid'])}")
         print(f"   ❌ Remove: {', '.join(agent['invalid'])}")
+        for skill, entry in agent['closest'].items():
+            if entry is not None:
+                print(f"      ↪ {skill}: closest is {entry.name} ({entry.toolchain})")
         print()
     
     print(f"Summary:")
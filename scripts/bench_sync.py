@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark manifest-driven sync against per-file conditional requests.
+
+Generates a tree of synthetic agent files, serves it from a local HTTP server
+with an artificial per-request latency, and compares:
+
+- etag-style polling: one conditional GET per file (what .etag-cache.json needs)
+- manifest sync with no changes, with a few changes, and from an empty tree
+
+Usage:
+    python scripts/bench_sync.py [--files N] [--latency MS] [--jobs N] [--changed PCT]
+"""
+
+import argparse
+import email.utils
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_mpm_agents.build_manifest import MANIFEST_FILENAME, write_manifest
+from claude_mpm_agents.sync import HttpSource, hash_tree, sync
+
+
+class LatencyHandler(SimpleHTTPRequestHandler):
+    """Static file handler that simulates network round-trip time and counts requests."""
+
+    latency = 0.0
+    requests = 0
+    lock = threading.Lock()
+
+    def handle_one_request(self):
+        time.sleep(self.latency)
+        super().handle_one_request()
+        with self.lock:
+            type(self).requests += 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def generate_tree(root: Path, files: int) -> None:
+    """Write synthetic agents and their MANIFEST.json."""
+    for i in range(files):
+        path = root / f"category-{i % 12}" / f"agent-{i:04d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = f"# Agent {i}\n\n" + "".join(f"- Rule {j} for agent {i}\n" for j in range(200))
+        path.write_text(f"---\nname: agent-{i}\nversion: 1.0.0\n---\n{body}")
+    write_manifest(root / MANIFEST_FILENAME, hash_tree(root), "1.3.0")
+
+
+def timed(name: str, func) -> None:
+    """Run func and print its wall time and HTTP request count."""
+    LatencyHandler.requests = 0
+    start = time.perf_counter()
+    detail = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<38} {elapsed * 1000:9.1f} ms {LatencyHandler.requests:6d} requests  {detail}")
+
+
+def poll_conditional(base_url: str, paths: list[str], since: str) -> str:
+    """Send one If-Modified-Since GET per file, like per-URL etag polling."""
+    not_modified = 0
+    for path in paths:
+        request = urllib.request.Request(base_url + path, headers={"If-Modified-Since": since})
+        try:
+            urllib.request.urlopen(request).read()
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            not_modified += 1
+    return f"{not_modified} not modified"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=300, help="Files in the tree (default: 300)")
+    parser.add_argument(
+        "--latency", type=float, default=10.0, help="Per-request latency in ms (default: 10)"
+    )
+    parser.add_argument("--jobs", type=int, default=8, help="Concurrent fetches (default: 8)")
+    parser.add_argument(
+        "--changed", type=float, default=5.0, help="Percent of files changed (default: 5)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = Path(tmp) / "source"
+        dest = Path(tmp) / "dest"
+        generate_tree(source_dir, args.files)
+        paths = sorted(str(p.relative_to(source_dir)) for p in source_dir.rglob("*.md"))
+
+        LatencyHandler.latency = args.latency / 1000
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), partial(LatencyHandler, directory=str(source_dir))
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}/"
+        source = HttpSource(base_url)
+
+        print(
+            f"{args.files} files, {args.latency:.0f} ms latency, {args.jobs} jobs, "
+            f"{args.changed:.0f}% changed\n"
+        )
+        try:
+            timed(
+                "cold sync (1 job)",
+                lambda: f"{len(sync(source, Path(tmp) / 'serial', max_workers=1).fetched)} fetched",
+            )
+            timed(
+                f"cold sync ({args.jobs} jobs)",
+                lambda: f"{len(sync(source, dest, max_workers=args.jobs).fetched)} fetched",
+            )
+
+            since = email.utils.formatdate(time.time() + 60, usegmt=True)
+            timed(
+                "per-file conditional GET, no changes",
+                lambda: poll_conditional(base_url, paths, since),
+            )
+            timed(
+                "manifest sync, no changes",
+                lambda: f"{len(sync(source, dest, max_workers=args.jobs).fetched)} fetched",
+            )
+
+            step = max(1, round(100 / args.changed)) if args.changed > 0 else len(paths) + 1
+            for path in paths[::step]:
+                with open(source_dir / path, "a") as f:
+                    f.write("\nUpdated rule.\n")
+            write_manifest(source_dir / MANIFEST_FILENAME, hash_tree(source_dir), "1.3.0")
+            timed(
+                "manifest sync, changed files",
+                lambda: f"{len(sync(source, dest, max_workers=args.jobs).fetched)} fetched",
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
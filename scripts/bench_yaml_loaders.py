@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark YAML frontmatter parsing over the agents/ tree.
+
+Compares PyYAML's pure-Python SafeLoader with the LibYAML-backed CSafeLoader
+and the cached parse_frontmatter entry point used by the loaders.
+
+Usage:
+    python scripts/bench_yaml_loaders.py [--repeat N] [--agents-dir agents]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_mpm_agents.frontmatter import read_frontmatter
+from claude_mpm_agents.yaml_loader import (
+    HAS_LIBYAML,
+    clear_frontmatter_cache,
+    load_yaml,
+    parse_frontmatter,
+)
+
+
+def collect_frontmatter(agents_dir: Path) -> list[str]:
+    """Read the frontmatter block of every markdown file under agents_dir."""
+    blocks = []
+    for path in sorted(agents_dir.rglob("*.md")):
+        block = read_frontmatter(path)
+        if block is not None:
+            blocks.append(block.text)
+    return blocks
+
+
+def time_parser(name: str, parse, blocks: list[str], repeat: int) -> float:
+    """Parse every block `repeat` times and print the per-pass timing."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in blocks:
+            parse(text)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {name:<28} {elapsed * 1000:8.2f} ms/pass")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the tree (default: 10)")
+    parser.add_argument(
+        "--agents-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "agents",
+        help="Agents directory to parse (default: repository agents/)",
+    )
+    args = parser.parse_args()
+
+    blocks = collect_frontmatter(args.agents_dir)
+    total_kb = sum(len(b) for b in blocks) / 1024
+    print(f"Parsing {len(blocks)} frontmatter blocks ({total_kb:.1f} KB), {args.repeat} passes\n")
+
+    pure = time_parser(
+        "SafeLoader (pure Python)", lambda t: yaml.load(t, yaml.SafeLoader), blocks, args.repeat
+    )
+
+    if not HAS_LIBYAML:
+        print("\n⚠️  PyYAML was built without LibYAML; CSafeLoader unavailable")
+        return 0
+
+    fast = time_parser("CSafeLoader (LibYAML)", load_yaml, blocks, args.repeat)
+
+    clear_frontmatter_cache()
+    cached = time_parser("parse_frontmatter (cached)", parse_frontmatter, blocks, args.repeat)
+
+    print(f"\nCSafeLoader speedup:       {pure / fast:5.1f}x")
+    print(f"Cached entry point speedup: {pure / cached:5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Migrate a .etag-cache.json file to the SQLite etag cache.
+
+The JSON file is renamed to .etag-cache.json.migrated after a successful
+import; the SQLite cache is written next to it as .etag-cache.sqlite. If a
+.migrated file from an earlier migration exists, nothing is migrated unless
+--overwrite is given (or --keep, which leaves the JSON file in place).
+
+Usage:
+    python scripts/migrate_etag_cache.py [JSON_CACHE] [--db PATH] [--keep] [--overwrite]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_mpm_agents.etag_cache import (
+    JSON_CACHE_FILENAME,
+    SQLITE_CACHE_FILENAME,
+    migrate_json_cache,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "json_cache",
+        nargs="?",
+        type=Path,
+        default=Path("agents") / JSON_CACHE_FILENAME,
+        help=f"JSON cache to migrate (default: agents/{JSON_CACHE_FILENAME})",
+    )
+    parser.add_argument(
+        "--db", type=Path, help=f"SQLite cache path (default: {SQLITE_CACHE_FILENAME} next to it)"
+    )
+    parser.add_argument("--keep", action="store_true", help="Do not rename the JSON cache")
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace an existing .migrated file from an earlier migration",
+    )
+    args = parser.parse_args()
+
+    if not args.json_cache.exists():
+        print(f"❌ Etag cache not found at {args.json_cache}", file=sys.stderr)
+        return 1
+
+    json_size = args.json_cache.stat().st_size
+    db_path = args.db or args.json_cache.with_name(SQLITE_CACHE_FILENAME)
+    try:
+        count = migrate_json_cache(
+            args.json_cache, db_path, rename=not args.keep, overwrite=args.overwrite
+        )
+    except FileExistsError as e:
+        print(f"❌ {e}; pass --overwrite to replace it or --keep", file=sys.stderr)
+        return 1
+
+    print(f"✅ Migrated {count} entries to {db_path}")
+    print(f"   {json_size:,} bytes JSON -> {db_path.stat().st_size:,} bytes SQLite")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Score agent transcripts from a JSONL log with the compliance metrics.
+
+Each line is a JSON object with agent_type and output. Every transcript is
+scored by the instruction compliance, role boundary and handoff metrics from
+claude_mpm_agents/metrics/, and a per-agent report is printed (and optionally
+written as JSON). Transcripts of unknown agent types are counted as skipped. Runs offline: no OpenAI key or network access is needed.
+
+Usage:
+    python scripts/score_transcripts.py LOG [--jobs N] [--report FILE] [--min-pass-rate R]
+
+Examples:
+    python scripts/score_transcripts.py logs/agents.jsonl --jobs 8 --report report.json
+    zcat logs/agents.jsonl.gz | python scripts/score_transcripts.py - --min-pass-rate 0.9
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# The metrics only use DeepEval's base classes; keep it from phoning home
+os.environ.setdefault("DEEPEVAL_TELEMETRY_OPT_OUT", "1")
+
+from claude_mpm_agents.metrics.transcripts import DEFAULT_CHUNK_SIZE, ScoreReport, score_file
+
+
+def print_report(report: ScoreReport) -> None:
+    """Print per-agent pass rates and the most common violations."""
+    for agent_type, agent in sorted(report.agents.items()):
+        print(f"\n{agent_type} ({agent.cases} transcripts)")
+        for name, aggregate in agent.metrics.items():
+            print(
+                f"  {name:<24} pass {aggregate.pass_rate:6.1%}  "
+                f"mean score {aggregate.mean_score:.3f}"
+            )
+            for code, count in aggregate.violations.most_common(3):
+                print(f"      {count:>6}  {code}")
+
+    print(f"\n📊 {report.cases} transcripts scored")
+    if report.malformed:
+        lines = ", ".join(str(n) for n in report.malformed_lines)
+        print(f"⚠️  {report.malformed} malformed lines skipped (first: {lines})")
+    if report.skipped:
+        counts = ", ".join(f"{agent} {count}" for agent, count in sorted(report.skipped.items()))
+        print(
+            f"⚠️  {sum(report.skipped.values())} transcripts of unknown agent types "
+            f"skipped ({counts})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("log", help="JSONL transcript log ('-' for stdin)")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes (default: 1, 0 = CPU count)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Transcripts per worker task (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument("--report", type=Path, help="Write the report as JSON to this file")
+    parser.add_argument(
+        "--min-pass-rate",
+        type=float,
+        help="Exit with 1 if any agent's metric passes less than this fraction of transcripts",
+    )
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    try:
+        if args.log == "-":
+            report = score_file(sys.stdin, ROOT, jobs, args.chunk_size)
+        else:
+            with open(args.log, encoding="utf-8") as f:
+                report = score_file(f, ROOT, jobs, args.chunk_size)
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    print_report(report)
+    if args.report:
+        args.report.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+        print(f"📝 Report written to {args.report}")
+
+    if args.min_pass_rate is not None:
+        failing = report.failing(args.min_pass_rate)
+        for agent_type, name, pass_rate in failing:
+            print(
+                f"❌ {agent_type} {name}: {pass_rate:.1%} < {args.min_pass_rate:.1%}",
+                file=sys.stderr,
+            )
+        if failing:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Sync a local agent tree from a manifest source, fetching only changed files.
+
+The source is a base URL serving MANIFEST.json (as written by
+build-agent.py --all), a local directory, or a .tar/.tar.gz archive.
+
+Usage:
+    python scripts/sync_agents.py SOURCE DEST [--jobs N] [--delete] [--dry-run]
+
+Examples:
+    python scripts/sync_agents.py dist/agents ~/.claude/agents
+    python scripts/sync_agents.py https://example.com/agents/ ~/.claude/agents --delete
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claude_mpm_agents.sync import (
+    DEFAULT_MAX_WORKERS,
+    SyncError,
+    open_source,
+    plan_sync,
+    sync,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("source", help="Base URL, directory or tarball to sync from")
+    parser.add_argument("dest", type=Path, help="Local agent tree to update")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximum concurrent fetches (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--delete", action="store_true", help="Remove previously synced files the source dropped"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only print what would change")
+    args = parser.parse_args()
+
+    try:
+        source = open_source(args.source)
+        if args.dry_run:
+            plan = plan_sync(source.manifest(), args.dest, delete=args.delete)
+            for path in plan.fetch:
+                print(f"⬇️  {path}")
+            for path in plan.delete:
+                print(f"🗑️  {path}")
+            print(
+                f"\n{len(plan.fetch)} to fetch, {len(plan.delete)} to delete, "
+                f"{len(plan.unchanged)} unchanged"
+            )
+            return 0
+
+        result = sync(source, args.dest, max_workers=args.jobs, delete=args.delete)
+    except SyncError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    for path in result.fetched:
+        print(f"⬇️  {path}")
+    for path in result.deleted:
+        print(f"🗑️  {path}")
+    for path, error in result.errors.items():
+        print(f"❌ {path}: {error}", file=sys.stderr)
+
+    print(
+        f"\n✅ {len(result.fetched)} fetched, {len(result.deleted)} deleted, "
+        f"{len(result.plan.unchanged)} unchanged"
+    )
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
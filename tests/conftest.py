@@ -1,17 +1,20 @@
 """Pytest fixtures for agent testing."""
 
+import importlib.util
+import sys
 from pathlib import Path
+from types import ModuleType
 from typing import Callable
 
 import pytest
 
+from claude_mpm_agents.instruction_extractor import ExtractedRule, InstructionExtractor
 from tests.fixtures.agent_loader import (
     AgentDefinition,
     AgentLoader,
     CompiledAgent,
     CompiledAgentLoader,
 )
-from tests.fixtures.instruction_extractor import ExtractedRule, InstructionExtractor
 from tests.fixtures.mock_responses import MockResponseGenerator
 
 
@@ -43,13 +46,16 @@ def agents_dir(project_root: Path) -> Path:
 def agent_loader(agents_dir: Path) -> AgentLoader:
     """Create agent loader instance.
 
+    Bodies are loaded lazily so session-scoped agent lists only hold
+    frontmatter until a test reads body_content.
+
     Args:
         agents_dir: Path to agents directory
 
     Returns:
         AgentLoader instance
     """
-    return AgentLoader(agents_dir)
+    return AgentLoader(agents_dir, lazy=True)
 
 
 @pytest.fixture(scope="session")
@@ -228,3 +234,24 @@ def base_agent_files(agents_dir: Path) -> list[Path]:
         List of paths to BASE-AGENT.md files
     """
     return list(agents_dir.rglob("BASE-AGENT.md"))
+
+
+# Build script fixtures
+
+
+@pytest.fixture(scope="session")
+def build_agent_module(project_root: Path) -> ModuleType:
+    """Import build-agent.py as a module.
+
+    Args:
+        project_root: Project root path
+
+    Returns:
+        The loaded build-agent module
+    """
+    spec = importlib.util.spec_from_file_location("build_agent", project_root / "build-agent.py")
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing so worker processes can unpickle its functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
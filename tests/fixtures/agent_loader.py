@@ -7,6 +7,35 @@ from typing import Any, Optional
 
 import yaml
 
+from claude_mpm_agents.frontmatter import read_frontmatter, scan_frontmatter, split_frontmatter
+from claude_mpm_agents.inheritance import BaseAgentResolver
+from claude_mpm_agents.tokens import agent_budget, estimate_tokens
+from claude_mpm_agents.yaml_loader import parse_frontmatter
+
+
+class _LazyBody:
+    """Descriptor for ``AgentDefinition.body_content`` supporting deferred loading.
+
+    Assigning None marks the body as not yet loaded; the first read then loads
+    it from ``body_offset`` in the agent file.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, instance: Optional["AgentDefinition"], owner: type) -> str:
+        if instance is None:
+            # Dataclass default value
+            return ""
+        value = instance.__dict__.get(self._attr)
+        if value is None:
+            value = instance.load_body()
+            instance.__dict__[self._attr] = value
+        return value
+
+    def __set__(self, instance: "AgentDefinition", value: Optional[str]) -> None:
+        instance.__dict__[self._attr] = value
+
 
 @dataclass
 class AgentDefinition:
@@ -22,8 +51,27 @@ class AgentDefinition:
     tags: list[str] = field(default_factory=list)
     knowledge: list[str] = field(default_factory=list)
     interactions: dict[str, Any] = field(default_factory=dict)
-    body_content: str = ""
+    body_content: str = _LazyBody()  # type: ignore[assignment]
     raw_frontmatter: dict[str, Any] = field(default_factory=dict)
+    # Byte offset of the body, set by lazy loading; not part of the definition itself
+    body_offset: Optional[int] = field(default=None, compare=False, repr=False)
+
+    @property
+    def body_loaded(self) -> bool:
+        """Check whether the body has been read into memory."""
+        return self.__dict__.get("_body_content") is not None
+
+    def load_body(self) -> str:
+        """Read the body from disk, starting at body_offset.
+
+        Returns:
+            Stripped body content (same as eager loading)
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self.body_offset or 0)
+            raw = f.read()
+        # Match Path.read_text() universal-newline handling
+        return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").strip()
 
 
 @dataclass
@@ -52,6 +100,16 @@ class CompiledAgent:
         """Return list of BASE-AGENT.md files in inheritance order."""
         return [str(b["relative"]) for b in self.base_agents]
 
+    @property
+    def estimated_tokens(self) -> int:
+        """Approximate token count of the compiled prompt."""
+        return estimate_tokens(self.compiled_content)
+
+    @property
+    def token_budget(self) -> int:
+        """Prompt token budget from context_limit or max_tokens frontmatter."""
+        return agent_budget(self.frontmatter)[0]
+
     def has_instruction(self, pattern: str) -> bool:
         """Check if compiled agent contains instruction matching pattern.
 
@@ -80,16 +138,15 @@ class CompiledAgent:
 class AgentLoader:
     """Load agent definitions from markdown files."""
 
-    # Regex to extract YAML frontmatter
-    FRONTMATTER_PATTERN = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
-
-    def __init__(self, agents_dir: Path):
+    def __init__(self, agents_dir: Path, lazy: bool = False):
         """Initialize loader with agents directory.
 
         Args:
             agents_dir: Path to directory containing agent markdown files
+            lazy: Read only frontmatter up front and load body_content on first access
         """
         self.agents_dir = Path(agents_dir)
+        self.lazy = lazy
 
     def load_agent(self, path: Path) -> AgentDefinition:
         """Load a single agent definition from markdown file.
@@ -103,19 +160,31 @@ class AgentLoader:
         Raises:
             ValueError: If frontmatter is missing or invalid
         """
-        content = path.read_text(encoding="utf-8")
-
-        # Extract frontmatter and body
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if not match:
-            raise ValueError(f"No frontmatter found in {path}")
-
-        frontmatter_text = match.group(1)
-        body_content = match.group(2).strip()
+        body_content: Optional[str]
+        body_offset: Optional[int] = None
+
+        if self.lazy:
+            # Stop reading at the closing delimiter; the body is loaded on access
+            block = read_frontmatter(path)
+            if block is None:
+                raise ValueError(f"No frontmatter found in {path}")
+            frontmatter_text = block.text
+            body_content = None
+            body_offset = block.body_offset
+        else:
+            content = path.read_text(encoding="utf-8")
+
+            # Extract frontmatter and body
+            span = scan_frontmatter(content)
+            if span is None:
+                raise ValueError(f"No frontmatter found in {path}")
+
+            frontmatter_text = span.frontmatter(content)
+            body_content = span.body(content).strip()
 
         # Parse YAML frontmatter
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = parse_frontmatter(frontmatter_text)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {path}: {e}")
 
@@ -136,6 +205,7 @@ class AgentLoader:
             interactions=frontmatter.get("interactions", {}),
             body_content=body_content,
             raw_frontmatter=frontmatter,
+            body_offset=body_offset,
         )
 
     def load_all_agents(self) -> list[AgentDefinition]:
@@ -182,9 +252,6 @@ class AgentLoader:
 class CompiledAgentLoader:
     """Load and compile agents with full BASE-AGENT.md inheritance."""
 
-    # Regex to extract YAML frontmatter
-    FRONTMATTER_PATTERN = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
-
     def __init__(self, agents_dir: Path):
         """Initialize loader with agents directory.
 
@@ -193,6 +260,8 @@ class CompiledAgentLoader:
         """
         self.agents_dir = Path(agents_dir)
         self.root_dir = agents_dir.parent
+        # Shared across all compile_agent calls so each BASE-AGENT.md is read once
+        self.base_resolver = BaseAgentResolver(self.agents_dir, self._extract_frontmatter)
 
     def find_base_agents(self, agent_path: Path) -> list[Path]:
         """Find all BASE-AGENT.md files from agent's directory up to agents root.
@@ -203,16 +272,7 @@ class CompiledAgentLoader:
         Returns:
             List of BASE-AGENT.md paths in inheritance order (root first)
         """
-        base_files = []
-        current = agent_path.parent
-
-        while current >= self.agents_dir:
-            base_file = current / "BASE-AGENT.md"
-            if base_file.exists():
-                base_files.insert(0, base_file)
-            current = current.parent
-
-        return base_files
+        return self.base_resolver.find_base_agents(agent_path)
 
     def _extract_frontmatter(self, content: str) -> tuple[str, str]:
         """Extract YAML frontmatter from content.
@@ -223,10 +283,7 @@ class CompiledAgentLoader:
         Returns:
             Tuple of (frontmatter, body)
         """
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if match:
-            return match.group(1), match.group(2)
-        return "", content
+        return split_frontmatter(content)
 
     def compile_agent(self, agent_path: Path) -> CompiledAgent:
         """Compile agent with all inherited BASE-AGENT.md content.
@@ -252,25 +309,17 @@ class CompiledAgentLoader:
         frontmatter = {}
         if frontmatter_text:
             try:
-                frontmatter = yaml.safe_load(frontmatter_text)
+                frontmatter = parse_frontmatter(frontmatter_text)
                 if not isinstance(frontmatter, dict):
                     frontmatter = {}
             except yaml.YAMLError as e:
                 raise ValueError(f"Invalid YAML frontmatter in {agent_path}: {e}")
 
-        # Find and read all BASE-AGENT.md files
-        base_files = self.find_base_agents(agent_path)
-        base_contents = []
-        for base_path in base_files:
-            base_content = base_path.read_text(encoding="utf-8")
-            _, base_body = self._extract_frontmatter(base_content)
-            base_contents.append(
-                {
-                    "path": base_path,
-                    "content": base_body,
-                    "relative": base_path.relative_to(self.agents_dir),
-                }
-            )
+        # Resolve all BASE-AGENT.md files (cached across agents)
+        base_contents = [
+            {"path": base.path, "content": base.body, "relative": base.relative}
+            for base in self.base_resolver.resolve(agent_path)
+        ]
 
         # Combine: agent body + all BASE-AGENT content (root first)
         compiled_content = body.strip()
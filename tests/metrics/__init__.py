@@ -1 +0,0 @@
-"""Custom DeepEval metrics for agent compliance testing."""
@@ -0,0 +1,62 @@
+"""Tests for AgentLoader loading modes."""
+
+from pathlib import Path
+
+import pytest
+
+from tests.fixtures.agent_loader import AgentLoader
+
+
+@pytest.mark.registry
+class TestLazyAgentLoading:
+    """Test frontmatter-only lazy loading of agent bodies."""
+
+    def test_lazy_matches_eager(self, agents_dir: Path):
+        """Lazy and eager loading produce identical agent definitions."""
+        eager = {a.path: a for a in AgentLoader(agents_dir).load_all_agents()}
+        lazy = {a.path: a for a in AgentLoader(agents_dir, lazy=True).load_all_agents()}
+
+        assert eager.keys() == lazy.keys()
+        for path, agent in lazy.items():
+            assert agent == eager[path]
+
+    def test_body_loaded_on_first_access(self, agents_dir: Path):
+        """Lazy agents hold no body until body_content is read."""
+        agent = AgentLoader(agents_dir, lazy=True).load_all_agents()[0]
+
+        assert not agent.body_loaded
+        assert agent.body_offset is not None
+        body = agent.body_content
+        assert agent.body_loaded
+        assert agent.body_content is body
+
+    def test_lazy_load_reads_only_frontmatter(self, tmp_path: Path, monkeypatch):
+        """Lazy loading never reads the full file while scanning."""
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_text("---\nname: lazy\nagent_type: qa\n---\n# Body\n\nDetails.\n")
+        monkeypatch.setattr(
+            Path, "read_text", lambda *a, **k: pytest.fail("read_text called during lazy load")
+        )
+
+        agent = AgentLoader(tmp_path, lazy=True).load_agent(agent_file)
+
+        assert agent.name == "lazy"
+        monkeypatch.undo()
+        assert agent.body_content == "# Body\n\nDetails."
+
+    def test_lazy_crlf_body_matches_eager(self, tmp_path: Path):
+        """CRLF files load the same body lazily and eagerly."""
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_bytes(b"---\r\nname: crlf\r\n---\r\n# Body\r\nLine\r\n")
+
+        eager = AgentLoader(tmp_path).load_agent(agent_file)
+        lazy = AgentLoader(tmp_path, lazy=True).load_agent(agent_file)
+
+        assert lazy == eager
+        assert lazy.body_content == "# Body\nLine"
+
+    def test_eager_body_is_loaded(self, agents_dir: Path):
+        """Eager loading keeps its existing behavior."""
+        agent = AgentLoader(agents_dir).load_all_agents()[0]
+        assert agent.body_loaded
+        assert agent.body_offset is None
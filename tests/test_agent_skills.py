@@ -13,6 +13,9 @@ from typing import List, Set
 import pytest
 import yaml
 
+from claude_mpm_agents.skills import SkillLoader
+from claude_mpm_agents.skills_manifest import load_skill_manifest
+from claude_mpm_agents.yaml_loader import load_yaml
 from tests.fixtures.agent_loader import AgentDefinition
 
 
@@ -48,7 +51,7 @@ class TestAgentSkills:
 
             try:
                 if registry_path.suffix == ".yaml":
-                    data = yaml.safe_load(registry_path.read_text())
+                    data = load_yaml(registry_path.read_text())
                     if "skills" in data:
                         for skill in data["skills"]:
                             if isinstance(skill, dict):
@@ -56,26 +59,9 @@ class TestAgentSkills:
                             else:
                                 valid_skills.add(str(skill))
                 elif registry_path.suffix == ".json":
-                    data = json.loads(registry_path.read_text())
-
-                    # Handle both nested (skills.universal) and flat (universal) formats
-                    skills_data = data.get("skills", data)
-
-                    # Extract from universal section
-                    for skill in skills_data.get("universal", []):
-                        if isinstance(skill, dict):
-                            valid_skills.add(skill.get("name", ""))
-                        else:
-                            valid_skills.add(str(skill))
-
-                    # Extract from toolchains section
-                    for category, skills_list in skills_data.get("toolchains", {}).items():
-                        if isinstance(skills_list, list):
-                            for skill in skills_list:
-                                if isinstance(skill, dict):
-                                    valid_skills.add(skill.get("name", ""))
-                                else:
-                                    valid_skills.add(str(skill))
+                    # Shared in-process manifest index; no on-disk cache from tests
+                    index = load_skill_manifest(registry_path, use_disk_cache=False)
+                    valid_skills |= index.names()
             except (yaml.YAMLError, json.JSONDecodeError) as e:
                 print(f"Warning: Failed to parse {registry_path}: {e}")
                 continue
@@ -88,6 +74,9 @@ class TestAgentSkills:
                 skill_name = skill_file.stem
                 valid_skills.add(skill_name)
 
+        # Skills defined in this repository
+        valid_skills |= SkillLoader(project_root / "skills").index().names()
+
         # Remove empty strings
         valid_skills.discard("")
 
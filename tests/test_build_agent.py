@@ -0,0 +1,746 @@
+"""Tests for build-agent.py build pipeline features.
+
+These tests run the AgentBuilder against a small synthetic agents/ tree so
+they stay fast and independent of the real agent catalog.
+"""
+
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+AGENT_TEMPLATE = """---
+name: {name}
+description: {name} agent
+agent_id: {name}
+agent_type: {agent_type}
+schema_version: 1.3.0
+version: 1.0.0
+---
+# {name}
+
+Body for {name}.
+"""
+
+
+@pytest.fixture
+def agents_tree(tmp_path: Path) -> Path:
+    """Create a minimal repository tree with a two-level BASE-AGENT hierarchy.
+
+    Returns:
+        Path to the repository root
+    """
+    agents = tmp_path / "agents"
+    (agents / "engineer" / "backend").mkdir(parents=True)
+    (agents / "qa").mkdir()
+
+    (agents / "BASE-AGENT.md").write_text("# Root Base\n\nRoot rules.\n")
+    (agents / "engineer" / "BASE-AGENT.md").write_text("# Engineer Base\n\nEngineer rules.\n")
+    (agents / "engineer" / "backend" / "python-engineer.md").write_text(
+        AGENT_TEMPLATE.format(name="python-engineer", agent_type="engineer")
+    )
+    (agents / "engineer" / "backend" / "rust-engineer.md").write_text(
+        AGENT_TEMPLATE.format(name="rust-engineer", agent_type="engineer")
+    )
+    (agents / "qa" / "qa.md").write_text(AGENT_TEMPLATE.format(name="qa", agent_type="qa"))
+    return tmp_path
+
+
+@pytest.fixture
+def builder(build_agent_module: ModuleType, agents_tree: Path):
+    """Create an AgentBuilder for the synthetic tree."""
+    return build_agent_module.AgentBuilder(agents_tree)
+
+
+def run_build(build_agent_module: ModuleType, root: Path, *args: str) -> int:
+    """Run the build-agent CLI against a repository root."""
+    argv = sys.argv
+    sys.argv = ["build-agent.py", "--root", str(root), *args]
+    try:
+        return build_agent_module.main()
+    finally:
+        sys.argv = argv
+
+
+@pytest.mark.build
+class TestIncrementalBuild:
+    """Test the persistent content-hash build cache."""
+
+    def test_full_build_writes_cache(self, build_agent_module, agents_tree):
+        """A full build records every agent in the build cache."""
+        assert run_build(build_agent_module, agents_tree, "--all") == 0
+
+        builder = build_agent_module.AgentBuilder(agents_tree)
+        cache = builder.load_build_cache()
+        assert set(cache) == {
+            "engineer/backend/python-engineer.md",
+            "engineer/backend/rust-engineer.md",
+            "qa/qa.md",
+        }
+
+    def test_unchanged_agents_are_skipped(self, build_agent_module, agents_tree):
+        """An incremental build after a full build rebuilds nothing."""
+        run_build(build_agent_module, agents_tree, "--all")
+
+        builder = build_agent_module.AgentBuilder(agents_tree)
+        results, _, skipped = builder.build_changed_agents()
+        assert results == {}
+        assert len(skipped) == 3
+
+    def test_base_agent_edit_rebuilds_only_subtree(self, build_agent_module, agents_tree):
+        """Editing a category BASE-AGENT.md rebuilds only agents below it."""
+        run_build(build_agent_module, agents_tree, "--all")
+        base = agents_tree / "agents" / "engineer" / "BASE-AGENT.md"
+        base.write_text(base.read_text() + "\nNew engineer rule.\n")
+
+        builder = build_agent_module.AgentBuilder(agents_tree)
+        results, _, skipped = builder.build_changed_agents()
+        assert {p.name for p in results} == {"python-engineer.md", "rust-engineer.md"}
+        assert [p.name for p in skipped] == ["qa.md"]
+
+    def test_skipped_outputs_are_not_touched(self, build_agent_module, agents_tree):
+        """Unchanged outputs keep their mtime across incremental builds."""
+        run_build(build_agent_module, agents_tree, "--all")
+        output = agents_tree / "dist" / "agents" / "qa" / "qa.md"
+        mtime = output.stat().st_mtime_ns
+
+        leaf = agents_tree / "agents" / "engineer" / "backend" / "rust-engineer.md"
+        leaf.write_text(leaf.read_text() + "\nMore.\n")
+        assert run_build(build_agent_module, agents_tree, "--all", "--incremental") == 0
+
+        assert output.stat().st_mtime_ns == mtime
+        built = agents_tree / "dist" / "agents" / "engineer" / "backend" / "rust-engineer.md"
+        assert "More." in built.read_text()
+
+    def test_full_rebuild_keeps_identical_outputs(self, build_agent_module, agents_tree):
+        """A full rebuild rewrites only outputs whose content changed."""
+        run_build(build_agent_module, agents_tree, "--all")
+        dist = agents_tree / "dist" / "agents"
+        outputs = [dist / "qa" / "qa.md", dist / "agents.index.json", dist / ".build-cache.json"]
+        mtimes = [path.stat().st_mtime_ns for path in outputs]
+
+        assert run_build(build_agent_module, agents_tree, "--all") == 0
+
+        assert [path.stat().st_mtime_ns for path in outputs] == mtimes
+        assert not list(dist.rglob("*.tmp"))
+
+    def test_missing_output_is_rebuilt(self, build_agent_module, agents_tree):
+        """A cached agent whose output was deleted is rebuilt."""
+        run_build(build_agent_module, agents_tree, "--all")
+        (agents_tree / "dist" / "agents" / "qa" / "qa.md").unlink()
+
+        builder = build_agent_module.AgentBuilder(agents_tree)
+        results, _, _ = builder.build_changed_agents()
+        assert [p.name for p in results] == ["qa.md"]
+
+
+@pytest.mark.build
+class TestParallelBuild:
+    """Test --jobs process-pool builds."""
+
+    def test_parallel_build_matches_serial(self, builder):
+        """Parallel and serial builds produce identical content in identical order."""
+        serial = builder.build_all_agents(jobs=1)
+        parallel = builder.build_all_agents(jobs=2)
+
+        assert list(parallel) == list(serial)
+        assert parallel == serial
+
+    def test_parallel_validation_matches_serial(self, builder, agents_tree):
+        """Parallel validation reports the same errors as serial validation."""
+        (agents_tree / "agents" / "qa" / "broken.md").write_text("No frontmatter here\n")
+
+        serial = builder.validate_all_agents(jobs=1)
+        parallel = builder.validate_all_agents(jobs=2)
+
+        assert parallel == serial
+        assert [p.name for p in parallel] == ["broken.md"]
+
+    def test_parallel_build_writes_outputs(self, build_agent_module, agents_tree):
+        """The CLI writes every agent when building with multiple jobs."""
+        assert run_build(build_agent_module, agents_tree, "--all", "--jobs", "2") == 0
+
+        outputs = sorted(p.name for p in (agents_tree / "dist" / "agents").rglob("*.md"))
+        assert outputs == ["python-engineer.md", "qa.md", "rust-engineer.md"]
+
+    def test_worker_errors_are_reported(self, builder, agents_tree, capsys):
+        """Build errors raised in workers are reported like serial build errors."""
+        bad = agents_tree / "agents" / "qa" / "unreadable.md"
+        bad.write_bytes(b"\xff\xfe invalid utf-8")
+
+        results = builder.build_all_agents(jobs=2)
+
+        assert bad not in results
+        assert f"Error building {bad}" in capsys.readouterr().err
+
+
+@pytest.mark.build
+class TestWatchRebuilds:
+    """Test dependency-aware partial rebuilds used by --watch."""
+
+    def test_base_change_affects_only_subtree(self, builder, agents_tree):
+        """Editing engineer/BASE-AGENT.md affects only agents under engineer/."""
+        base = agents_tree / "agents" / "engineer" / "BASE-AGENT.md"
+        affected = builder.agents_affected_by({base})
+
+        assert [p.name for p in affected] == ["python-engineer.md", "rust-engineer.md"]
+
+    def test_leaf_change_affects_only_itself(self, builder, agents_tree):
+        """Editing a leaf agent affects only that agent."""
+        leaf = agents_tree / "agents" / "qa" / "qa.md"
+        assert builder.agents_affected_by({leaf}) == [leaf]
+
+    def test_new_base_is_picked_up(self, builder, agents_tree):
+        """Creating a BASE-AGENT.md rebuilds its subtree with the new content."""
+        builder.build_all_agents()
+        new_base = agents_tree / "agents" / "qa" / "BASE-AGENT.md"
+        new_base.write_text("# QA Base\n\nQA rules.\n")
+
+        results, _ = builder.rebuild_changed({new_base})
+
+        assert [r.agent_path.name for r in results] == ["qa.md"]
+        assert "QA rules." in results[0].output_path.read_text()
+
+    def test_deleted_agent_output_is_removed(self, build_agent_module, agents_tree):
+        """Deleting an agent removes its built output."""
+        run_build(build_agent_module, agents_tree, "--all")
+        leaf = agents_tree / "agents" / "qa" / "qa.md"
+        leaf.unlink()
+
+        builder = build_agent_module.AgentBuilder(agents_tree)
+        results, removed = builder.rebuild_changed({leaf})
+
+        assert results == []
+        assert removed == [agents_tree / "dist" / "agents" / "qa" / "qa.md"]
+        assert "qa/qa.md" not in builder.load_build_cache()
+
+
+@pytest.mark.build
+class TestWatchers:
+    """Test file watchers detect agent source changes."""
+
+    def test_polling_watcher_detects_changes(self, agents_tree):
+        """PollingWatcher reports modified, created and deleted files."""
+        from claude_mpm_agents.watch import PollingWatcher
+
+        agents = agents_tree / "agents"
+        watcher = PollingWatcher(agents, interval=0.01)
+        modified = agents / "qa" / "qa.md"
+        modified.write_text(modified.read_text() + "\nChanged.\n")
+        created = agents / "qa" / "new.md"
+        created.write_text("new\n")
+        deleted = agents / "engineer" / "backend" / "rust-engineer.md"
+        deleted.unlink()
+
+        assert watcher.wait(timeout=1) == {modified, created, deleted}
+        assert watcher.wait(timeout=0.05) == set()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_watcher_detects_changes(self, agents_tree):
+        """InotifyWatcher reports writes, including files in new directories."""
+        from claude_mpm_agents.watch import InotifyWatcher
+
+        agents = agents_tree / "agents"
+        watcher = InotifyWatcher(agents)
+        try:
+            base = agents / "engineer" / "BASE-AGENT.md"
+            base.write_text("changed\n")
+            assert watcher.wait(timeout=2) == {base}
+
+            new_dir = agents / "ops"
+            new_dir.mkdir()
+            agent = new_dir / "ops.md"
+            agent.write_text("ops\n")
+            changed = watcher.wait(timeout=2)
+            while more := watcher.wait(timeout=0.1):
+                changed |= more
+            assert changed == {agent}
+        finally:
+            watcher.close()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_watcher_detects_directory_moves(self, agents_tree, tmp_path):
+        """InotifyWatcher reports files under renamed and moved-away directories."""
+        from claude_mpm_agents.watch import InotifyWatcher
+
+        agents = agents_tree / "agents"
+        backend = agents / "engineer" / "backend"
+        old_files = {backend / "python-engineer.md", backend / "rust-engineer.md"}
+        watcher = InotifyWatcher(agents)
+
+        def drain() -> set:
+            changed = watcher.wait(timeout=2)
+            while more := watcher.wait(timeout=0.1):
+                changed |= more
+            return changed
+
+        try:
+            renamed = agents / "engineer" / "server"
+            backend.rename(renamed)
+            new_files = {renamed / path.name for path in old_files}
+            assert drain() == old_files | new_files
+            assert set(watcher._watches.values()) == {
+                agents,
+                agents / "engineer",
+                renamed,
+                agents / "qa",
+            }
+
+            renamed.rename(tmp_path / "outside")
+            assert drain() == new_files
+            assert renamed not in watcher._watches.values()
+
+            (tmp_path / "outside" / "python-engineer.md").write_text("changed\n")
+            assert watcher.wait(timeout=0.2) == set()
+        finally:
+            watcher.close()
+
+
+@pytest.mark.build
+class TestAgentIndex:
+    """Test the agents.index.json catalog emitted by --all."""
+
+    def test_index_lists_every_agent(self, build_agent_module, agents_tree):
+        """The index has one entry per built agent with deployment fields."""
+        from claude_mpm_agents.agent_index import load_index
+
+        run_build(build_agent_module, agents_tree, "--all")
+        index = load_index(agents_tree / "dist" / "agents" / "agents.index.json")
+
+        assert [e["agent_id"] for e in index.agents] == ["python-engineer", "rust-engineer", "qa"]
+        entry = index.get("python-engineer")
+        assert entry["agent_type"] == "engineer"
+        assert entry["version"] == "1.0.0"
+        assert entry["inheritance"] == ["BASE-AGENT.md", "engineer/BASE-AGENT.md"]
+        assert entry["frontmatter"]["schema_version"] == "1.3.0"
+
+    def test_output_dir_outside_repository(
+        self, build_agent_module, agents_tree, tmp_path_factory, capsys
+    ):
+        """Building to an --output-dir outside the repository prints absolute paths."""
+        output_dir = tmp_path_factory.mktemp("dist")
+
+        assert (
+            run_build(build_agent_module, agents_tree, "--all", "--output-dir", str(output_dir))
+            == 0
+        )
+
+        out = capsys.readouterr().out
+        assert f"📇 Agent index: {output_dir / 'agents.index.json'}" in out
+        assert f"qa/qa.md -> {output_dir / 'qa' / 'qa.md'}" in out
+
+    def test_offsets_point_into_built_output(self, build_agent_module, agents_tree):
+        """Recorded offsets slice the frontmatter and body out of the output."""
+        from claude_mpm_agents.agent_index import load_index
+
+        run_build(build_agent_module, agents_tree, "--all")
+        index = load_index(agents_tree / "dist" / "agents" / "agents.index.json")
+        entry = index.get("qa")
+        data = (agents_tree / "dist" / "agents" / entry["path"]).read_bytes()
+
+        start, end = entry["frontmatter_offset"]
+        assert data[start:end].decode().startswith("name: qa")
+        assert entry["size"] == len(data)
+        assert index.read_body("qa").lstrip().startswith("# qa")
+
+    def test_incremental_build_keeps_skipped_entries(self, build_agent_module, agents_tree):
+        """Agents skipped by an incremental build stay in the index."""
+        from claude_mpm_agents.agent_index import load_index
+
+        run_build(build_agent_module, agents_tree, "--all")
+        leaf = agents_tree / "agents" / "qa" / "qa.md"
+        leaf.write_text(leaf.read_text().replace("version: 1.0.0", "version: 1.1.0"))
+        run_build(build_agent_module, agents_tree, "--all", "--incremental")
+
+        index = load_index(agents_tree / "dist" / "agents" / "agents.index.json")
+        assert len(index.agents) == 3
+        assert index.get("qa")["version"] == "1.1.0"
+
+
+@pytest.mark.build
+class TestBuildManifest:
+    """Test the MANIFEST.json digests emitted by --all."""
+
+    def test_manifest_digests_outputs_and_bases(self, build_agent_module, agents_tree):
+        """Each entry hashes the built output and the BASE-AGENT.md files it inherits."""
+        import hashlib
+
+        from claude_mpm_agents.build_manifest import load_manifest
+
+        run_build(build_agent_module, agents_tree, "--all")
+        dist = agents_tree / "dist" / "agents"
+        manifest = load_manifest(dist / "MANIFEST.json")
+
+        assert sorted(manifest) == [
+            "engineer/backend/python-engineer.md",
+            "engineer/backend/rust-engineer.md",
+            "qa/qa.md",
+        ]
+        entry = manifest["engineer/backend/python-engineer.md"]
+        output = (dist / "engineer" / "backend" / "python-engineer.md").read_bytes()
+        assert entry["sha256"] == hashlib.sha256(output).hexdigest()
+        assert entry["size"] == len(output)
+        assert (entry["agent_id"], entry["version"]) == ("python-engineer", "1.0.0")
+        base = agents_tree / "agents" / "engineer" / "BASE-AGENT.md"
+        assert entry["bases"][1] == {
+            "path": "engineer/BASE-AGENT.md",
+            "sha256": hashlib.sha256(base.read_bytes()).hexdigest(),
+        }
+
+    def test_manifest_diff_finds_changed_agents(self, build_agent_module, agents_tree):
+        """Diffing manifests across builds yields exactly the changed outputs."""
+        from claude_mpm_agents.build_manifest import diff_manifests, load_manifest
+
+        manifest_path = agents_tree / "dist" / "agents" / "MANIFEST.json"
+        run_build(build_agent_module, agents_tree, "--all")
+        before = load_manifest(manifest_path)
+
+        base = agents_tree / "agents" / "engineer" / "BASE-AGENT.md"
+        base.write_text(base.read_text() + "\nNew engineer rule.\n")
+        (agents_tree / "agents" / "qa" / "qa.md").unlink()
+        run_build(build_agent_module, agents_tree, "--all", "--incremental")
+        diff = diff_manifests(before, load_manifest(manifest_path))
+
+        assert diff.to_fetch == [
+            "engineer/backend/python-engineer.md",
+            "engineer/backend/rust-engineer.md",
+        ]
+        assert diff.removed == ["qa/qa.md"]
+
+
+@pytest.mark.build
+class TestDedupBuild:
+    """Test the content-addressed --dedup output format."""
+
+    def test_reassembled_outputs_match_regular_build(self, build_agent_module, agents_tree):
+        """Loading a deduplicated agent yields exactly the regular build output."""
+        from claude_mpm_agents.blocks import BlockLoader
+
+        run_build(build_agent_module, agents_tree, "--all")
+        regular = agents_tree / "dist" / "agents"
+        dedup = agents_tree / "dist" / "dedup"
+        run_build(build_agent_module, agents_tree, "--all", "--dedup", "--output-dir", str(dedup))
+
+        loader = BlockLoader(dedup)
+        for output in regular.rglob("*.md"):
+            relative = output.relative_to(regular)
+            assert loader.load(relative) == output.read_text()
+
+    def test_blocks_are_stored_once_and_listed_in_manifest(self, build_agent_module, agents_tree):
+        """Each distinct base body is one block; the manifest lists blocks and references."""
+        from claude_mpm_agents.agent_index import load_index
+        from claude_mpm_agents.build_manifest import load_manifest
+
+        run_build(build_agent_module, agents_tree, "--all", "--dedup")
+        dist = agents_tree / "dist" / "agents"
+
+        blocks = sorted(p.stem for p in (dist / "_blocks").glob("*.md"))
+        assert len(blocks) == 2  # Root and engineer bases
+        manifest = load_manifest(dist / "MANIFEST.json")
+        assert sorted(p for p in manifest if p.startswith("_blocks/")) == [
+            f"_blocks/{digest}.md" for digest in blocks
+        ]
+        assert len(manifest["engineer/backend/rust-engineer.md"]["blocks"]) == 2
+        body = load_index(dist / "agents.index.json").read_body("rust-engineer")
+        assert "Engineer rules." in body
+
+    def test_switching_format_rebuilds_and_prunes_blocks(self, build_agent_module, agents_tree):
+        """The format is part of the cache key; unreferenced blocks are removed."""
+        run_build(build_agent_module, agents_tree, "--all", "--dedup")
+        run_build(build_agent_module, agents_tree, "--all", "--incremental")
+
+        dist = agents_tree / "dist" / "agents"
+        assert "Root rules." in (dist / "qa" / "qa.md").read_text()
+        assert not list((dist / "_blocks").glob("*.md"))
+
+
+@pytest.mark.build
+class TestTokenBudgets:
+    """Test the token budget stage of --all."""
+
+    def test_report_covers_agents_and_sections(self, build_agent_module, agents_tree):
+        """Every agent is measured, with one section per inherited base."""
+        import json
+
+        run_build(build_agent_module, agents_tree, "--all")
+        report = json.loads((agents_tree / "dist" / "agents" / "token-report.json").read_text())
+
+        assert len(report["agents"]) == 3
+        python = next(a for a in report["agents"] if a["agent_id"] == "python-engineer")
+        labels = [section["label"] for section in python["sections"]]
+        assert labels[2:] == ["BASE-AGENT.md", "engineer/BASE-AGENT.md"]
+        assert python["total"] >= sum(section["tokens"] for section in python["sections"])
+        assert python["budget_source"] == "default"
+
+    def test_fail_policy_fails_build_over_budget(self, build_agent_module, agents_tree, capsys):
+        """An agent over its context_limit fails the build with --token-budget fail."""
+        qa = agents_tree / "agents" / "qa" / "qa.md"
+        qa.write_text(qa.read_text().replace("version: 1.0.0", "version: 1.0.0\ncontext_limit: 10"))
+
+        assert run_build(build_agent_module, agents_tree, "--all") == 0
+        assert run_build(build_agent_module, agents_tree, "--all", "--token-budget", "fail") == 1
+        assert "qa/qa.md" in capsys.readouterr().err
+
+
+@pytest.mark.build
+class TestCompressBuild:
+    """Test the --compress build profile."""
+
+    def test_compressed_output_drops_markers_and_repeated_rules(
+        self, build_agent_module, agents_tree, capsys
+    ):
+        """Markers and root rules a child base repeats are removed; savings are reported."""
+        agents = agents_tree / "agents"
+        (agents / "BASE-AGENT.md").write_text("# 🤖 Root Base\n\n- Run tests.\n- Root rules.\n")
+        (agents / "engineer" / "BASE-AGENT.md").write_text(
+            "# Engineer Base\n\n\n\n- run tests\n- Engineer rules.\n"
+        )
+
+        assert run_build(build_agent_module, agents_tree, "--all", "--compress") == 0
+
+        content = agents_tree / "dist" / "agents" / "engineer" / "backend" / "rust-engineer.md"
+        content = content.read_text()
+        assert "Inherited from" not in content
+        assert "# Root Base\n\n- Root rules." in content
+        assert "# Engineer Base\n\n- run tests\n- Engineer rules." in content
+        qa = (agents_tree / "dist" / "agents" / "qa" / "qa.md").read_text()
+        assert "- Run tests.\n- Root rules." in qa
+        output = capsys.readouterr().out
+        assert "engineer/backend/rust-engineer.md:" in output
+        assert "1 base duplicates dropped" in output
+        assert "BASE-AGENT.md: rule '- Run tests.' (kept in engineer/BASE-AGENT.md)" in output
+
+    def test_dedupe_bases_keeps_other_content(self, build_agent_module, agents_tree):
+        """--dedupe-bases alone drops duplicates but keeps markers and formatting."""
+        agents = agents_tree / "agents"
+        (agents / "BASE-AGENT.md").write_text(
+            "# Root Base\n\nRoot rules.\n\n## Git\n\n- Small commits\n"
+        )
+        (agents / "engineer" / "BASE-AGENT.md").write_text(
+            "# Engineer\n\n## git\n\n- small commits\n"
+        )
+
+        assert run_build(build_agent_module, agents_tree, "--all", "--dedupe-bases") == 0
+
+        content = agents_tree / "dist" / "agents" / "engineer" / "backend" / "rust-engineer.md"
+        content = content.read_text()
+        assert (
+            "<!-- Inherited from BASE-AGENT.md -->\n\n\n# Root Base\n\nRoot rules.\n\n\n<!--"
+            in content
+        )
+        assert content.endswith("# Engineer\n\n## git\n\n- small commits")
+
+    def test_dedupe_bases_removes_repository_repeats(self, build_agent_module, project_root):
+        """Known repeats between the real root and category bases are removed."""
+        options = build_agent_module.BuildOptions(dedupe_bases=True)
+        builder = build_agent_module.AgentBuilder(project_root, options=options)
+        agents = project_root / "agents"
+
+        def build(relative: str) -> str:
+            return builder.build_agent(agents / relative)
+
+        ops = build("ops/core/ops.md")
+        assert ops.count("## Handoff Protocol") == 1
+        assert ops.index("### To QA") < ops.index("### Common Handoff Flows")
+
+        mpm = build("claude-mpm/mpm-agent-manager.md")
+        assert "Engineer → Security: After auth/crypto changes" not in mpm
+        assert "- Engineer → Security (for auth/crypto changes)" in mpm
+
+        for relative, heading in [
+            ("qa/qa.md", "## Test Quality Standards"),
+            ("engineer/core/engineer.md", "### Code Quality Standards"),
+        ]:
+            content = build(relative)
+            assert "## Quality Standards\n" not in content
+            assert content.count("Before Declaring Complete") == 1
+            assert content.index(heading) < content.index("Before Declaring Complete")
+
+    def test_compress_with_dedup_reassembles_compressed_build(
+        self, build_agent_module, agents_tree
+    ):
+        """Compressed bases are shared as blocks like uncompressed ones."""
+        from claude_mpm_agents.blocks import BlockLoader
+
+        run_build(build_agent_module, agents_tree, "--all", "--compress")
+        compressed = agents_tree / "dist" / "agents"
+        dedup = agents_tree / "dist" / "dedup"
+        run_build(
+            build_agent_module,
+            agents_tree,
+            "--all",
+            "--compress",
+            "--dedup",
+            "--output-dir",
+            str(dedup),
+        )
+
+        loader = BlockLoader(dedup)
+        for output in compressed.rglob("*.md"):
+            assert loader.load(output.relative_to(compressed)) == output.read_text()
+
+
+@pytest.mark.build
+class TestSkillSummaries:
+    """Test the --skill-summaries build option."""
+
+    def test_summaries_are_built_and_track_skill_changes(self, build_agent_module, agents_tree):
+        """Local skills get an entry-point block; editing a SKILL.md rebuilds its agents."""
+        skill = agents_tree / "skills" / "rust-core" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text(
+            "---\nname: rust-core\nprogressive_disclosure:\n  entry_point:\n"
+            "    summary: Ownership and borrowing\ncontext_limit: 700\n---\n# Rust\n\nFull body.\n"
+        )
+        rust = agents_tree / "agents" / "engineer" / "backend" / "rust-engineer.md"
+        rust.write_text(rust.read_text().replace("---\n#", "skills:\n- rust-core\n- other\n---\n#"))
+
+        assert run_build(build_agent_module, agents_tree, "--all", "--skill-summaries") == 0
+        output = agents_tree / "dist" / "agents" / "engineer" / "backend" / "rust-engineer.md"
+        content = output.read_text()
+        assert "Body for rust-engineer.\n\n## Available Skills" in content
+        assert "- Summary: Ownership and borrowing" in content
+        assert "Full body." not in content
+
+        skill.write_text(skill.read_text().replace("Ownership", "Lifetimes"))
+        builder = build_agent_module.AgentBuilder(
+            agents_tree, options=build_agent_module.BuildOptions(skill_summaries=True)
+        )
+        results, _, _ = builder.build_changed_agents()
+        assert [p.name for p in results] == ["rust-engineer.md"]
+
+
+@pytest.mark.build
+class TestSchemaValidation:
+    """Test structured frontmatter validation in validate_agent."""
+
+    def write_agent(self, agents_tree: Path, frontmatter: str, body: str = "# Body\n") -> Path:
+        """Write an agent file with the given frontmatter."""
+        path = agents_tree / "agents" / "qa" / "candidate.md"
+        path.write_text(f"---\n{frontmatter}---\n{body}")
+        return path
+
+    def test_reports_all_errors_with_lines(self, builder, agents_tree):
+        """Every schema error is reported in one pass with its line number."""
+        path = self.write_agent(
+            agents_tree,
+            "name: candidate\n"
+            "description: test\n"
+            "agent_id: Not_Kebab\n"
+            "agent_type: qa\n"
+            "schema_version: 1.3.0\n"
+            "temperature: hot\n"
+            "capabilities:\n"
+            "  cpu_limit: 500\n"
+            "  network_access: 'yes'\n",
+        )
+
+        errors = builder.validate_agent(path)
+
+        assert errors == [
+            "Invalid format for agent_id: 'Not_Kebab' (line 4)",
+            "Invalid type for temperature: expected number, got string (line 7)",
+            "Out of range for capabilities.cpu_limit: 500 (allowed 1-100) (line 9)",
+            "Invalid type for capabilities.network_access: expected boolean, got string (line 10)",
+        ]
+
+    def test_missing_required_fields(self, builder, agents_tree):
+        """Missing required fields are reported, not substring-matched."""
+        # 'agent_id:' appears inside the description but the field itself is missing
+        path = self.write_agent(
+            agents_tree,
+            "name: candidate\ndescription: 'mentions agent_id: here'\nagent_type: qa\n",
+        )
+
+        errors = builder.validate_agent(path)
+
+        assert "Missing required field: agent_id (line 2)" in errors
+        assert "Missing required field: schema_version (line 2)" in errors
+
+    def test_enum_and_schema_version_warnings(self, builder, agents_tree):
+        """Unknown conventional enum values and old schema versions are warnings."""
+        path = self.write_agent(
+            agents_tree,
+            "name: c\ndescription: d\nagent_id: c\nagent_type: wizard\n"
+            "schema_version: 1.2.0\nresource_tier: standard\n",
+        )
+
+        errors = builder.validate_agent(path)
+
+        assert all(error.startswith("WARNING: ") for error in errors)
+        assert len(errors) == 2
+
+    def test_invalid_yaml_reports_line(self, builder, agents_tree):
+        """YAML syntax errors are reported with their line."""
+        path = self.write_agent(agents_tree, "name: c\ntags: [unclosed\n")
+
+        errors = builder.validate_agent(path)
+
+        assert len(errors) == 1
+        assert errors[0].startswith("Invalid YAML frontmatter")
+
+    def test_skills_are_read_from_frontmatter_only(self, builder, agents_tree, monkeypatch):
+        """Skill lists in the body are not mistaken for frontmatter skills."""
+        monkeypatch.setattr(builder, "load_valid_skills", lambda: {"git-workflow"})
+        path = self.write_agent(
+            agents_tree,
+            "name: c\ndescription: d\nagent_id: c\nagent_type: qa\nschema_version: 1.3.0\n"
+            "skills:\n- git-workflow\n- made-up-skill\n",
+            body="# Body\n\nskills:\n- another-unknown\n",
+        )
+
+        errors = builder.validate_agent(path)
+
+        assert errors == [
+            "Invalid skill references (not in claude-mpm-skills): made-up-skill (line 7)"
+        ]
+
+    def test_invalid_skill_reports_closest_toolchain(self, builder, agents_tree, monkeypatch):
+        """Unknown skills name the closest manifest skill and its toolchain."""
+        from claude_mpm_agents.skills_manifest import build_skill_index
+
+        index = build_skill_index({"toolchains": {"python": ["python-async-patterns"]}})
+        monkeypatch.setattr(builder, "_skill_index", index)
+        path = self.write_agent(
+            agents_tree,
+            "name: c\ndescription: d\nagent_id: c\nagent_type: qa\nschema_version: 1.3.0\n"
+            "skills:\n- python-async-pattern\n",
+        )
+
+        errors = builder.validate_agent(path)
+
+        assert errors == [
+            (
+                "Invalid skill references (not in claude-mpm-skills): python-async-pattern "
+                "(closest: python-async-patterns in python) (line 7)"
+            )
+        ]
+
+    def test_local_skills_validate_without_manifest(self, builder, agents_tree):
+        """Skills defined in skills/ are valid in both modes; --local-skills needs no manifest."""
+        from claude_mpm_agents.skills_manifest import build_skill_index
+
+        skill = agents_tree / "skills" / "rust-core" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text("---\nname: Rust Core\ncategory: toolchain\n---\n# Rust\n")
+        path = self.write_agent(
+            agents_tree,
+            "name: c\ndescription: d\nagent_id: c\nagent_type: qa\nschema_version: 1.3.0\n"
+            "skills:\n- rust-core\n- rust-cor\n",
+        )
+
+        assert builder.validate_agent(path) == []  # No manifest: skipped
+        assert builder.validate_agent(path, local_skills=True) == [
+            (
+                "Invalid skill references (not in skills/): rust-cor "
+                "(closest: rust-core in toolchain) (line 7)"
+            )
+        ]
+        builder._skill_index = build_skill_index({"universal": ["rust-cor"]})
+        assert builder.validate_agent(path) == []
+
+    def test_repository_agents_are_valid(self, build_agent_module, project_root):
+        """All agents in the repository pass schema validation."""
+        builder = build_agent_module.AgentBuilder(project_root)
+        assert builder.validate_all_agents() == {}
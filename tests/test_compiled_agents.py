@@ -4,11 +4,12 @@ This module tests fully compiled agents (agent + all BASE-AGENT.md inheritance)
 to verify that required instructions are present after compilation.
 """
 
-import pytest
 from pathlib import Path
 
+import pytest
+
+from claude_mpm_agents.instruction_extractor import InstructionExtractor
 from tests.fixtures.agent_loader import CompiledAgentLoader
-from tests.fixtures.instruction_extractor import InstructionExtractor
 
 
 @pytest.mark.compiled
@@ -0,0 +1,170 @@
+"""Tests for the --compress passes."""
+
+from claude_mpm_agents.compress import (
+    Removal,
+    collapse_whitespace,
+    compress_markdown,
+    compression_stats,
+    dedupe_hierarchy,
+    headings_match,
+    rule_words,
+    similar_rules,
+    split_code_blocks,
+    strip_decorative_emoji,
+    strip_html_comments,
+)
+from claude_mpm_agents.tokens import estimate_tokens
+
+CODE = "```python\nx  =  1   \n<!-- kept -->\n\n\n\ny = '🚀'\n```\n"
+
+
+class TestCompressMarkdown:
+    """Tests for the per-document passes."""
+
+    def test_split_roundtrips(self):
+        text = f"# Title\n\n{CODE}\nAfter.\n~~~\nunterminated"
+        segments = split_code_blocks(text)
+
+        assert "".join(segment for _, segment in segments) == text
+        assert [is_code for is_code, _ in segments] == [False, True, False, True]
+
+    def test_code_blocks_are_untouched(self):
+        text = f"Intro   text.\n\n\n\n{CODE}"
+
+        assert CODE.strip() in compress_markdown(text)
+
+    def test_strips_html_comments(self):
+        text = "Before\n<!-- Inherited from BASE-AGENT.md -->\nAfter <!-- inline -->"
+
+        assert strip_html_comments(text) == "Before\n\nAfter "
+
+    def test_strips_decorative_but_keeps_status_emoji(self):
+        text = "## 🚀 Deploy\n\n- 💡 Tip\n✅ Do this ❌ not that ⚠️ careful\n📋\n→ next"
+
+        assert strip_decorative_emoji(text) == (
+            "## Deploy\n\n- Tip\n✅ Do this ❌ not that ⚠️ careful\n→ next"
+        )
+
+    def test_collapses_whitespace_but_keeps_indentation(self):
+        text = "\n\nA  line   here.   \n\n\n\n    - nested  item\n\n"
+
+        assert collapse_whitespace(text) == "A line here.\n\n    - nested item"
+
+
+class TestDedupeHierarchy:
+    """Tests for dropping sections and rules repeated across base levels."""
+
+    def test_ancestor_copy_of_rule_is_dropped(self):
+        root = "# Root\n\n- Always run tests.\n- Keep commits small\n"
+        local = "# Engineer\n\n- always run  `tests`\n- Prefer composition\n"
+
+        documents, removals = dedupe_hierarchy([root, local])
+
+        assert documents == ["# Root\n\n- Keep commits small\n", local]
+        assert removals == [Removal("rule", "- Always run tests.", 0, 1)]
+
+    def test_duplicate_section_is_dropped_with_subsections(self):
+        section = "## Git Workflow\n\n### Commits\n\n- Use conventional commits\n"
+        root = f"# Root\n\n{section}\n## Memory\n\nRemember things.\n"
+        middle = "# Engineer\n\n## 🔀 git workflow\n\n### Commits:\n\n* Use conventional commits.\n"
+        local = "# Python\n\n- Use pytest\n"
+
+        documents, removals = dedupe_hierarchy([root, middle, local])
+
+        assert documents[0] == "# Root\n\n## Memory\n\nRemember things.\n"
+        assert documents[1:] == [middle, local]
+        assert removals == [Removal("section", "## Git Workflow", 0, 1)]
+
+    def test_emptied_heading_is_dropped(self):
+        root = "# Root\n\n## Checks\n\n- Lint\n- Test\n\n## Other\n\nText.\n"
+        local = "# Local\n\n- Test\n- Lint\n"
+
+        documents, removals = dedupe_hierarchy([root, local])
+
+        assert documents[0] == "# Root\n\n## Other\n\nText.\n"
+        assert [removal.kind for removal in removals] == ["rule", "rule"]
+
+    def test_parents_code_and_similar_rules_are_kept(self):
+        root = "- Testing\n  - Use pytest\n```\n- Logging\n```\n- Skip error handling\n"
+        local = "- Testing\n- Logging\n- Improve error handling\n"
+
+        documents, removals = dedupe_hierarchy([root, local])
+
+        assert documents == [root, local]
+        assert removals == []
+
+    def test_rule_in_similar_words_is_dropped(self):
+        root = "# Root\n\n- Engineer → Security: After auth/crypto changes\n- Keep it short\n"
+        local = "# MPM\n\n- Engineer → Security (for auth/crypto changes)\n"
+
+        documents, removals = dedupe_hierarchy([root, local])
+
+        assert documents == ["# Root\n\n- Keep it short\n", local]
+        assert removals == [
+            Removal("rule", "- Engineer → Security: After auth/crypto changes", 0, 1)
+        ]
+
+    def test_shared_heading_is_merged_into_specific_section(self):
+        root = (
+            "# Root\n\n## Handoff Protocol\n\n### Flows\n\n- Engineer → QA\n\n"
+            "## Quality Standards\n\n### Before Declaring Complete\n\n- Tests pass\n\n"
+            "## Memory\n\nRemember.\n"
+        )
+        local = (
+            "# Ops\n\n## Core\n\n### Code Quality Standards\n\n#### Types\n\n- Strict\n\n"
+            "## Handoff Protocol\n\n- To QA\n"
+        )
+
+        documents, removals = dedupe_hierarchy([root, local])
+
+        assert documents == [
+            "# Root\n\n## Memory\n\nRemember.\n",
+            "# Ops\n\n## Core\n\n### Code Quality Standards\n\n#### Types\n\n- Strict\n\n"
+            "#### Before Declaring Complete\n\n- Tests pass\n\n"
+            "## Handoff Protocol\n\n- To QA\n\n### Flows\n\n- Engineer → QA\n",
+        ]
+        assert removals == [
+            Removal("merged", "## Handoff Protocol", 0, 1),
+            Removal("merged", "## Quality Standards", 0, 1),
+        ]
+
+
+class TestSimilarity:
+    """Tests for near-duplicate rules and matching headings."""
+
+    def test_similar_rules(self):
+        def similar(a: str, b: str) -> bool:
+            return similar_rules(rule_words(a), rule_words(b))
+
+        assert similar(
+            "Engineer → QA: After implementation, for testing",
+            "Engineer → QA (after implementation)",
+        )
+        assert not similar(
+            "Engineer → QA after implementation", "QA → Engineer after implementation"
+        )
+        assert not similar(
+            "Skip error handling or edge cases", "Improve error handling and edge cases"
+        )
+        assert not similar(
+            "Never commit secrets to the repository", "Commit secrets to the repository"
+        )
+        assert not similar(
+            "Hard limit of 800 lines per source file", "Hard limit of 600 lines per source file"
+        )
+        assert not similar("Edge cases", "Consideration of edge cases")
+
+    def test_headings_match(self):
+        assert headings_match("## Handoff Protocol", "## 🤝 handoff protocol:")
+        assert headings_match("## Quality Standards", "## Test Quality Standards")
+        assert not headings_match("### Structure", "### Test Structure")
+        assert not headings_match("## Quality Gates", "## Quality Standards")
+
+
+def test_compression_stats():
+    stats = compression_stats("a  b\n\n\n", "a b", estimate_tokens, duplicates_removed=2)
+
+    assert (stats.bytes_before, stats.bytes_after) == (7, 3)
+    assert stats.bytes_saved_pct > 50
+    assert stats.tokens_after <= stats.tokens_before
+    assert stats.duplicates_removed == 2
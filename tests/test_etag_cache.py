@@ -0,0 +1,100 @@
+"""Tests for the SQLite etag cache."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents.etag_cache import EtagCache, EtagEntry, migrate_json_cache, read_json_cache
+
+RAW = "https://raw.githubusercontent.com/bobmatnyc/claude-mpm-agents/main/agents/"
+
+
+class TestEtagCache:
+    """Tests for single-entry updates and prefix sharing."""
+
+    def test_set_get_and_update_single_entry(self, tmp_path: Path):
+        with EtagCache(tmp_path / "cache.sqlite") as cache:
+            cache.set(RAW + "qa/qa.md", 'W/"a"', "2025-12-20T16:15:43+00:00", 100)
+            cache.set(RAW + "qa/qa.md", 'W/"b"', "2025-12-21T10:00:00+00:00", 120)
+
+            assert len(cache) == 1
+            assert cache.get(RAW + "qa/qa.md") == EtagEntry(
+                'W/"b"', "2025-12-21T10:00:00+00:00", 120
+            )
+            assert cache.get(RAW + "qa/missing.md") is None
+
+    def test_prefix_stored_once(self, tmp_path: Path):
+        with EtagCache(tmp_path / "cache.sqlite") as cache:
+            for name in ("a.md", "b.md", "c.md"):
+                cache.set(RAW + "engineer/" + name, name)
+            prefixes = cache._conn.execute("SELECT prefix FROM prefixes").fetchall()
+
+        assert prefixes == [(RAW + "engineer/",)]
+
+    def test_persists_and_deletes(self, tmp_path: Path):
+        path = tmp_path / "cache.sqlite"
+        with EtagCache(path) as cache:
+            cache.set(RAW + "BASE-AGENT.md", 'W/"x"')
+            cache.set(RAW + "qa/qa.md", 'W/"y"')
+
+        with EtagCache(path) as cache:
+            assert cache.delete(RAW + "qa/qa.md") is True
+            assert cache.delete(RAW + "qa/qa.md") is False
+            assert [url for url, _ in cache.items()] == [RAW + "BASE-AGENT.md"]
+
+
+class TestMigration:
+    """Tests for importing .etag-cache.json."""
+
+    def test_migrates_repository_cache(self, tmp_path: Path, project_root: Path):
+        json_path = tmp_path / ".etag-cache.json"
+        shutil.copy(project_root / "agents" / ".etag-cache.json", json_path)
+        original = json.loads(json_path.read_text())
+
+        count = migrate_json_cache(json_path)
+
+        assert count == len(original)
+        assert not json_path.exists()
+        assert (tmp_path / ".etag-cache.json.migrated").exists()
+        with EtagCache(tmp_path / ".etag-cache.sqlite") as cache:
+            assert cache.to_dict() == original
+
+    def test_keep_json_cache(self, tmp_path: Path):
+        json_path = tmp_path / ".etag-cache.json"
+        json_path.write_text(json.dumps({RAW + "qa/qa.md": {"etag": "e", "file_size": 3}}))
+
+        migrate_json_cache(json_path, tmp_path / "out.sqlite", rename=False)
+
+        assert json_path.exists()
+        with EtagCache(tmp_path / "out.sqlite") as cache:
+            assert cache.get(RAW + "qa/qa.md") == EtagEntry("e", None, 3)
+
+    def test_refuses_to_replace_migrated_file(self, tmp_path: Path, project_root: Path):
+        json_path = tmp_path / ".etag-cache.json"
+        previous = tmp_path / ".etag-cache.json.migrated"
+        shutil.copy(project_root / "agents" / ".etag-cache.json", json_path)
+        shutil.copy(project_root / "agents" / ".etag-cache.json.migrated", previous)
+        previous_text = previous.read_text()
+
+        with pytest.raises(FileExistsError):
+            migrate_json_cache(json_path)
+
+        assert json_path.exists()
+        assert previous.read_text() == previous_text
+        assert not (tmp_path / ".etag-cache.sqlite").exists()
+
+        count = migrate_json_cache(json_path, overwrite=True)
+
+        assert count == len(read_json_cache(previous))
+        assert not json_path.exists()
+        with EtagCache(tmp_path / ".etag-cache.sqlite") as cache:
+            assert dict(cache.items()) == read_json_cache(previous)
+
+    def test_rejects_non_object_cache(self, tmp_path: Path):
+        json_path = tmp_path / ".etag-cache.json"
+        json_path.write_text("[]")
+
+        with pytest.raises(ValueError):
+            migrate_json_cache(json_path)
@@ -0,0 +1,101 @@
+"""Tests for the shared frontmatter scanner."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents.frontmatter import (
+    read_frontmatter,
+    scan_frontmatter,
+    split_frontmatter,
+)
+
+
+@pytest.mark.registry
+class TestScanFrontmatter:
+    """Test offset-based frontmatter scanning."""
+
+    def test_matches_legacy_regex_split(self, agents_dir: Path):
+        """Scanner output matches the previous DOTALL regex on every agent file."""
+        legacy = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
+        for path in agents_dir.rglob("*.md"):
+            content = path.read_text(encoding="utf-8")
+            match = legacy.match(content)
+            if match:
+                assert split_frontmatter(content) == (match.group(1), match.group(2)), path
+
+    def test_no_frontmatter(self):
+        """Documents without an opening delimiter have no span."""
+        assert scan_frontmatter("# Title\n\n---\nnot frontmatter\n---\n") is None
+        assert split_frontmatter("# Title\n") == ("", "# Title\n")
+
+    def test_unclosed_frontmatter(self):
+        """An opening delimiter without a closing one is not frontmatter."""
+        assert scan_frontmatter("---\nname: x\n# Body\n") is None
+
+    def test_crlf_and_bom(self):
+        """CRLF line endings and a UTF-8 BOM are handled."""
+        content = "\ufeff---\r\nname: x\r\nversion: 1\r\n---\r\n# Body\r\n"
+        assert split_frontmatter(content) == ("name: x\r\nversion: 1", "# Body\r\n")
+
+    def test_frontmatter_only(self):
+        """A file ending at the closing delimiter has an empty body."""
+        assert split_frontmatter("---\nname: x\n---") == ("name: x", "")
+        assert split_frontmatter("---\nname: x\n---\n") == ("name: x", "")
+
+    def test_closing_delimiter_must_be_exact(self):
+        """Lines such as '----' or '--- x' do not close the block."""
+        content = "---\na: 1\n----\nb: 2\n--- x\n---\nbody"
+        assert split_frontmatter(content) == ("a: 1\n----\nb: 2\n--- x", "body")
+
+    def test_bytes_offsets(self):
+        """Bytes input yields offsets usable with memoryview slices."""
+        data = b"---\nname: x\n---\nbody bytes"
+        span = scan_frontmatter(data)
+
+        assert bytes(memoryview(data)[span.body_start :]) == b"body bytes"
+        assert span.frontmatter(data) == b"name: x"
+
+
+@pytest.mark.registry
+class TestReadFrontmatter:
+    """Test reading only the frontmatter block from disk."""
+
+    def test_reads_frontmatter_and_body_offset(self, tmp_path: Path):
+        """The body offset points at the first byte after the closing delimiter."""
+        path = tmp_path / "agent.md"
+        path.write_bytes("---\r\nname: é\r\n---\r\nBody\n".encode())
+
+        block = read_frontmatter(path)
+
+        assert block.text == "name: é"
+        assert path.read_bytes()[block.body_offset :] == b"Body\n"
+
+    def test_stops_at_closing_delimiter(self, tmp_path: Path):
+        """Reading stops before the body is consumed."""
+        path = tmp_path / "agent.md"
+        path.write_text("---\nname: x\n---\n" + "body line\n" * 10000)
+
+        block = read_frontmatter(path)
+
+        assert block.text == "name: x"
+        assert block.body_offset == len("---\nname: x\n---\n")
+
+    def test_missing_frontmatter(self, tmp_path: Path):
+        """Files without frontmatter return None."""
+        path = tmp_path / "agent.md"
+        path.write_text("# No frontmatter\n")
+        assert read_frontmatter(path) is None
+
+    def test_matches_scan_on_agent_files(self, agents_dir: Path):
+        """Disk reads agree with in-memory scans for every agent file."""
+        for path in agents_dir.rglob("*.md"):
+            data = path.read_bytes()
+            span = scan_frontmatter(data)
+            block = read_frontmatter(path)
+            if span is None:
+                assert block is None, path
+            else:
+                assert block.text == span.frontmatter(data).decode("utf-8"), path
+                assert block.body_offset == span.body_start, path
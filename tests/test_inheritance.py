@@ -0,0 +1,93 @@
+"""Tests for memoized BASE-AGENT.md inheritance resolution."""
+
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents.inheritance import BaseAgentResolver
+from tests.fixtures.agent_loader import CompiledAgentLoader
+
+
+@pytest.fixture
+def base_tree(tmp_path: Path) -> Path:
+    """Create an agents/ tree with root, category and subcategory bases."""
+    agents = tmp_path / "agents"
+    (agents / "engineer" / "backend").mkdir(parents=True)
+    (agents / "engineer" / "frontend").mkdir()
+    (agents / "BASE-AGENT.md").write_text("---\nx: 1\n---\nRoot body\n")
+    (agents / "engineer" / "BASE-AGENT.md").write_text("Engineer body\n")
+    (agents / "engineer" / "backend" / "BASE-AGENT.md").write_text("Backend body\n")
+    return agents
+
+
+@pytest.mark.compiled
+class TestBaseAgentResolver:
+    """Test BaseAgentResolver caching and ordering."""
+
+    def test_chain_is_root_first(self, base_tree: Path):
+        """Inheritance chain is ordered from agents/ root downwards."""
+        resolver = BaseAgentResolver(base_tree)
+        chain = resolver.find_base_agents(base_tree / "engineer" / "backend" / "python.md")
+
+        assert [p.relative_to(base_tree).as_posix() for p in chain] == [
+            "BASE-AGENT.md",
+            "engineer/BASE-AGENT.md",
+            "engineer/backend/BASE-AGENT.md",
+        ]
+
+    def test_directories_without_base_inherit_parent_chain(self, base_tree: Path):
+        """A directory without BASE-AGENT.md inherits its parent's chain."""
+        resolver = BaseAgentResolver(base_tree)
+        chain = resolver.find_base_agents(base_tree / "engineer" / "frontend" / "react.md")
+
+        assert len(chain) == 2
+
+    def test_base_files_are_read_once(self, base_tree: Path, monkeypatch):
+        """Each BASE-AGENT.md is read once no matter how many agents inherit it."""
+        reads: list[Path] = []
+        original = Path.read_bytes
+
+        def counting_read_bytes(self: Path) -> bytes:
+            reads.append(self)
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        resolver = BaseAgentResolver(base_tree)
+        for name in ("a.md", "b.md", "c.md"):
+            resolver.resolve(base_tree / "engineer" / "backend" / name)
+
+        assert len(reads) == 3
+        assert len(set(reads)) == 3
+
+    def test_base_body_has_frontmatter_removed(self, base_tree: Path):
+        """Parsed bases expose the body without frontmatter."""
+        resolver = BaseAgentResolver(base_tree)
+        root = resolver.resolve(base_tree / "agent.md")[0]
+
+        assert root.body == "Root body\n"
+        assert root.relative == Path("BASE-AGENT.md")
+
+    def test_invalidate_picks_up_new_base(self, base_tree: Path):
+        """Invalidating a newly created BASE-AGENT.md updates its subtree chains."""
+        resolver = BaseAgentResolver(base_tree)
+        agent = base_tree / "engineer" / "frontend" / "react.md"
+        assert len(resolver.find_base_agents(agent)) == 2
+
+        new_base = base_tree / "engineer" / "frontend" / "BASE-AGENT.md"
+        new_base.write_text("Frontend body\n")
+        resolver.invalidate(new_base)
+
+        assert resolver.find_base_agents(agent)[-1] == new_base
+
+    def test_compiled_loader_shares_resolver(self, agents_dir: Path):
+        """CompiledAgentLoader resolves bases through one shared resolver."""
+        loader = CompiledAgentLoader(agents_dir)
+        compiled = loader.compile_all_agents()
+
+        root_bases = {
+            id(b["content"])
+            for agent in compiled.values()
+            for b in agent.base_agents
+            if str(b["relative"]) == "BASE-AGENT.md"
+        }
+        assert len(root_bases) == 1
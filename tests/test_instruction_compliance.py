@@ -1,16 +1,20 @@
 """Tests for BASE-AGENT.md instruction compliance."""
 
+from typing import ClassVar
+
 import pytest
 from deepeval import assert_test
 from deepeval.test_case import LLMTestCase
 
-from tests.fixtures.instruction_extractor import ExtractedRule
-from tests.fixtures.mock_responses import MockResponseGenerator
-from tests.metrics.instruction_compliance import (
+from claude_mpm_agents.instruction_extractor import ExtractedRule
+from claude_mpm_agents.metrics.instruction_compliance import (
     GitWorkflowComplianceMetric,
     InstructionComplianceMetric,
     OutputFormatComplianceMetric,
+    compile_rules,
 )
+from claude_mpm_agents.metrics.patterns import PatternSet, ResultCache
+from tests.fixtures.mock_responses import MockResponseGenerator
 
 
 @pytest.mark.instruction_compliance
@@ -232,3 +236,86 @@ class TestOpsAgentCompliance:
         except AssertionError:
             # Expected to fail
             pass
+
+
+class TestCompiledRules:
+    """Test precompiled rule evaluation and result caching."""
+
+    RULES: ClassVar[list[ExtractedRule]] = [
+        ExtractedRule(
+            rule_id="commits",
+            category="git_workflow",
+            description="Conventional commits",
+            positive_patterns=[r"^(feat|fix):", r"^chore:"],
+            negative_patterns=[r"^wip"],
+        ),
+        ExtractedRule(
+            rule_id="headers",
+            category="output_format",
+            description="Markdown headers",
+            positive_patterns=[r"^##\s+.+"],
+        ),
+        ExtractedRule(
+            rule_id="no_wip",
+            category="git_workflow",
+            description="No WIP commits",
+            negative_patterns=[r"^wip"],
+        ),
+    ]
+
+    def test_evaluate_matches_per_rule_semantics(self):
+        """Test that each rule needs a positive match and no negative match."""
+        compiled = compile_rules(self.RULES)
+
+        assert compiled.evaluate("## Summary\nfeat: add login") == (True, True, True)
+        assert compiled.evaluate("Chore: bump deps") == (True, False, True)
+        assert compiled.evaluate("fix: typo\nWIP stuff") == (False, False, False)
+        assert compiled.evaluate("nothing here") == (False, False, True)
+
+    def test_shared_patterns_compiled_once(self):
+        """Test that a pattern used by several rules is compiled once."""
+        compiled = compile_rules(self.RULES)
+
+        assert compiled.patterns.patterns.count(r"^wip") == 1
+        assert compiled.negative[0] == compiled.negative[2]
+
+    def test_compiled_rules_are_shared(self):
+        """Test that equal rule lists reuse the same compiled patterns."""
+        assert compile_rules(list(self.RULES)) is compile_rules(self.RULES)
+        assert compile_rules(self.RULES[:1]) is not compile_rules(self.RULES)
+
+    def test_results_cached_per_rules_and_output(self, monkeypatch):
+        """Test that an output is only searched once per rule set."""
+        from claude_mpm_agents.metrics import instruction_compliance
+
+        cache = ResultCache(16)
+        monkeypatch.setattr(instruction_compliance, "_results", cache)
+        compiled = compile_rules(self.RULES)
+
+        first = compiled.evaluate("## Summary\nfeat: add login")
+        second = compiled.evaluate("## Summary\nfeat: add login")
+
+        assert first == second
+        assert cache.info().hits == 1
+        assert cache.info().misses == 1
+
+    def test_metric_reports_violations(self):
+        """Test that the metric lists the rules the output broke."""
+        metric = InstructionComplianceMetric(rules=self.RULES, threshold=1.0)
+        metric.measure(LLMTestCase(input="Commit", actual_output="wip: stuff"))
+
+        assert metric.score == 0.0
+        assert metric.violations == [
+            "commits: Conventional commits",
+            "headers: Markdown headers",
+            "no_wip: No WIP commits",
+        ]
+
+
+def test_pattern_set_scan_finds_leftmost_matches():
+    """Test that scan reports each pattern's leftmost match span."""
+    patterns = PatternSet([r"test", r"^deploy", r"missing"])
+    text = "Run tests\nDeploy then test again"
+
+    assert patterns.scan(text) == {0: (4, 8), 1: (10, 16)}
+    assert patterns.scan(text, indices=[1]) == {1: (10, 16)}
@@ -0,0 +1,124 @@
+"""Tests for batch scoring of the custom metrics."""
+
+import asyncio
+
+import pytest
+from deepeval.test_case import LLMTestCase
+
+from claude_mpm_agents.instruction_extractor import ExtractedRule
+from claude_mpm_agents.metrics import batch
+from claude_mpm_agents.metrics.batch import BatchResult
+from claude_mpm_agents.metrics.instruction_compliance import InstructionComplianceMetric
+from claude_mpm_agents.metrics.role_boundary import HandoffComplianceMetric, RoleBoundaryMetric
+
+OUTPUTS = [
+    "## Plan\n\nImplement the service and write a unit test.\n\nfeat: add service",
+    "Deployed with kubectl apply and ran a security audit.",
+    "",
+    (
+        "Accomplished:\n- Added login\n\nRemaining tasks:\n- Add logout\n\n"
+        "Context: the session store is shared, so QA should test expiry before the next release."
+    ),
+]
+
+RULES = [
+    ExtractedRule(
+        rule_id="headers",
+        category="output_format",
+        description="Markdown headers",
+        positive_patterns=[r"^##\s+.+"],
+    ),
+    ExtractedRule(
+        rule_id="commits",
+        category="git_workflow",
+        description="Conventional commits",
+        positive_patterns=[r"^(feat|fix):"],
+    ),
+]
+
+
+def make_metrics():
+    return [
+        InstructionComplianceMetric(rules=RULES, threshold=1.0),
+        RoleBoundaryMetric(agent_type="engineer"),
+        HandoffComplianceMetric(),
+    ]
+
+
+@pytest.mark.parametrize("metric", make_metrics(), ids=lambda m: m.__name__)
+def test_batch_matches_per_case_measure(metric):
+    """Test that batch columns equal what measure records case by case."""
+    result = metric.measure_batch([LLMTestCase(input="x", actual_output=o) for o in OUTPUTS])
+
+    assert len(result) == len(OUTPUTS)
+    for i, output in enumerate(OUTPUTS):
+        score = metric.measure(LLMTestCase(input="x", actual_output=output))
+        assert result.scores[i] == score
+        assert result.successes[i] == metric.success
+        assert result.reasons[i] == metric.reason
+        assert list(result.violations[i]) == metric.violation_codes
+
+
+def test_violation_codes():
+    """Test that each metric reports stable violation codes."""
+    compliance, role, handoff = make_metrics()
+
+    assert compliance.evaluate(OUTPUTS[1]).codes == ("headers", "commits")
+    assert role.evaluate(OUTPUTS[1]).codes == (
+        "missing_role_activity",
+        "crossed_role_boundary:(deploy to production|kubectl apply|docker push)",
+        "crossed_role_boundary:(security audit|penetration test|compliance review)",
+    )
+    assert handoff.evaluate(OUTPUTS[3]).codes == ()
+    assert handoff.evaluate(OUTPUTS[2]).codes == (batch.EMPTY_OUTPUT,)
+
+
+def test_batch_leaves_metric_state_alone():
+    """Test that measure_batch does not overwrite the last measured case."""
+    metric = RoleBoundaryMetric(agent_type="engineer")
+    metric.measure(LLMTestCase(input="x", actual_output=OUTPUTS[1]))
+
+    metric.evaluate_batch(OUTPUTS)
+
+    assert metric.success is False
+    assert metric.violation_codes
+
+
+def test_process_pool_batch_matches_in_process(monkeypatch):
+    """Test that a pooled batch returns the same columns in input order."""
+    metric = InstructionComplianceMetric(rules=RULES, threshold=1.0)
+    outputs = OUTPUTS * 5
+    expected = metric.evaluate_batch(outputs, jobs=1)
+
+    monkeypatch.setattr(batch, "PROCESS_POOL_MIN_BATCH", 4)
+    assert metric.evaluate_batch(outputs, jobs=2) == expected
+
+
+def test_batch_result_aggregates():
+    """Test pass rate and mean score of a batch."""
+    result = BatchResult(scores=[1.0, 0.5], successes=[True, False], reasons=["", ""])
+
+    assert result.passed == 1
+    assert result.pass_rate == 0.5
+    assert result.mean_score == 0.75
+    assert BatchResult().pass_rate == 1.0
+
+
+def test_evaluate_is_required():
+    """Test that a metric without evaluate cannot be instantiated."""
+
+    class Incomplete(batch.BatchMetricMixin):
+        pass
+
+    with pytest.raises(TypeError, match="evaluate"):
+        Incomplete()
+
+
+def test_a_measure_runs_in_executor():
+    """Test that a_measure scores the case off the event loop thread."""
+    metric = HandoffComplianceMetric()
+
+    score = asyncio.run(metric.a_measure(LLMTestCase(input="x", actual_output=OUTPUTS[3])))
+
+    assert score == 1.0
+    assert metric.reason == "Handoff compliance: 100.0%"
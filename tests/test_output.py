@@ -0,0 +1,89 @@
+"""Tests for atomic, write-if-changed output."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents import output
+from claude_mpm_agents.output import OutputWriter, atomic_write, write_if_changed
+
+
+class TestWriteIfChanged:
+    """Tests for write_if_changed and atomic_write."""
+
+    def test_creates_and_skips_identical(self, tmp_path: Path):
+        path = tmp_path / "agent.md"
+
+        assert write_if_changed(path, "content\n") is True
+        mtime = path.stat().st_mtime_ns
+        assert write_if_changed(path, "content\n") is False
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_rewrites_changed_content_of_same_size(self, tmp_path: Path):
+        path = tmp_path / "agent.md"
+        path.write_text("aaaa")
+
+        assert write_if_changed(path, b"bbbb") is True
+        assert path.read_text() == "bbbb"
+
+    def test_preserves_existing_mode(self, tmp_path: Path):
+        path = tmp_path / "agent.md"
+        path.write_text("old")
+        path.chmod(0o640)
+
+        atomic_write(path, "new")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_new_file_mode_follows_umask(self, tmp_path: Path):
+        path = tmp_path / "agent.md"
+        old_umask = os.umask(0o027)
+        try:
+            atomic_write(path, "new")
+            assert os.umask(0o027) == 0o027
+        finally:
+            os.umask(old_umask)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_failed_write_leaves_original_and_no_temp_file(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "agent.md"
+        path.write_text("original")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(output.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            atomic_write(path, "replacement")
+
+        assert path.read_text() == "original"
+        assert os.listdir(tmp_path) == ["agent.md"]
+
+
+class TestOutputWriter:
+    """Tests for OutputWriter directory batching and counters."""
+
+    def test_creates_each_directory_once(self, tmp_path: Path, monkeypatch):
+        writer = OutputWriter()
+        created = []
+        original_mkdir = Path.mkdir
+
+        def tracking_mkdir(self, *args, **kwargs):
+            created.append(self)
+            return original_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", tracking_mkdir)
+        for name in ("a.md", "b.md", "c.md"):
+            writer.write(tmp_path / "engineer" / name, name)
+
+        assert created == [tmp_path / "engineer"]
+
+    def test_counts_written_and_unchanged(self, tmp_path: Path):
+        writer = OutputWriter()
+        writer.write(tmp_path / "a.md", "a")
+        writer.write(tmp_path / "a.md", "a")
+
+        assert (writer.written, writer.unchanged) == (1, 1)
@@ -1,11 +1,18 @@
 """Tests for agent role boundary enforcement."""
 
+import re
+
 import pytest
 from deepeval import assert_test
 from deepeval.test_case import LLMTestCase
 
+from claude_mpm_agents.metrics.patterns import PatternSet, keyword_alternatives
+from claude_mpm_agents.metrics.role_boundary import (
+    HandoffComplianceMetric,
+    RoleBoundaryMetric,
+    RoleMatch,
+)
 from tests.fixtures.mock_responses import MockResponseGenerator
-from tests.metrics.role_boundary import HandoffComplianceMetric, RoleBoundaryMetric
 
 
 @pytest.mark.role_boundary
@@ -187,3 +194,72 @@ const authMiddleware = (req, res, next) => {
         # Should pass because it's not a handoff scenario
         metric = HandoffComplianceMetric(threshold=0.8)
         assert_test(test_case, [metric])
+
+
+@pytest.mark.role_boundary
+class TestRoleKeywordMatching:
+    """Test keyword matching of role patterns."""
+
+    def test_role_patterns_are_matched_as_keywords(self):
+        """Test that every built-in role pattern avoids regex."""
+        for agent_type in RoleBoundaryMetric.ROLE_PATTERNS:
+            patterns = RoleBoundaryMetric(agent_type=agent_type).role_patterns
+            assert None not in patterns.keywords, agent_type
+
+    def test_find_matches_reports_offsets(self):
+        """Test that allowed and forbidden phrases come back with offsets."""
+        output = "Wrote a Test Plan, then will Merge Pull Request."
+        metric = RoleBoundaryMetric(agent_type="qa")
+
+        assert metric.find_matches(output) == [
+            RoleMatch("allowed", "(test|bug|verify|validate|reproduce)", 8, 12, "Test"),
+            RoleMatch("allowed", "(test case|test plan|bug report)", 8, 17, "Test Plan"),
+            RoleMatch(
+                "forbidden",
+                "(merge pull request|git push|release)",
+                29,
+                47,
+                "Merge Pull Request",
+            ),
+        ]
+        assert metric.evaluate(output).codes == (
+            "crossed_role_boundary:(merge pull request|git push|release)",
+        )
+
+    def test_keyword_alternatives(self):
+        """Test which patterns count as plain keyword alternations."""
+        assert keyword_alternatives("(deploy|docker push)") == ("deploy", "docker push")
+        assert keyword_alternatives("kubectl apply") == ("kubectl apply",)
+        assert keyword_alternatives(r"(--interactive|-i\s)") is None
+        assert keyword_alternatives("(a|)") is None
+        assert keyword_alternatives("(café|bar)") is None
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "I will DEPLOY to production",
+            "ab then a",
+            "\u212aubectl apply and \u017fecurity",
+            "D\u0130D deploy",
+            "",
+        ],
+    )
+    def test_keyword_spans_match_regex(self, text):
+        """Test that keyword search reports the same spans as re.search."""
+        patterns = PatternSet(
+            [
+                "(deploy to production|deploy)",
+                "(a|ab)",
+                "(ab|a)",
+                "kubectl apply",
+                "(security|did)",
+            ],
+            re.IGNORECASE,
+        )
+        expected = {
+            i: match.span()
+            for i, compiled in enumerate(patterns.compiled)
+            if (match := compiled.search(text))
+        }
+
+        assert patterns.scan(text) == expected
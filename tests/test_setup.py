@@ -2,8 +2,8 @@
 
 import pytest
 
+from claude_mpm_agents.instruction_extractor import InstructionExtractor
 from tests.fixtures.agent_loader import AgentLoader
-from tests.fixtures.instruction_extractor import InstructionExtractor
 from tests.fixtures.mock_responses import ComplianceLevel, MockResponseGenerator
 
 
@@ -0,0 +1,112 @@
+"""Tests for progressive-disclosure skill summaries."""
+
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents.skill_bundle import SkillBodyLoader, bundle_skills, entry_point_block
+from claude_mpm_agents.skills import SkillLoader, read_skill
+from claude_mpm_agents.tokens import estimate_tokens
+
+SKILL = """---
+name: {name}
+description: {name} description
+version: 1.0.0
+category: toolchain
+progressive_disclosure:
+  entry_point:
+    summary: "Summary of {name} with several words"
+    when_to_use: "When {name} applies"
+    quick_start: "Start with {name}"
+context_limit: {limit}
+tags:
+  - python
+---
+
+# {name}
+
+Full body of {name}.
+"""
+
+
+@pytest.fixture
+def skills_dir(tmp_path: Path) -> Path:
+    """Create a skills directory with two skills."""
+    for name, limit in (("async-patterns", 700), ("tiny-skill", 40)):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "SKILL.md").write_text(SKILL.format(name=name, limit=limit))
+    return tmp_path
+
+
+class TestEntryPointBlock:
+    """Tests for formatting a single skill entry point."""
+
+    def test_full_entry_point_within_limit(self, skills_dir):
+        skill = read_skill(skills_dir / "async-patterns" / "SKILL.md")
+
+        assert entry_point_block(skill, estimate_tokens) == (
+            "### async-patterns\n"
+            "- Summary: Summary of async-patterns with several words\n"
+            "- When to use: When async-patterns applies\n"
+            "- Quick start: Start with async-patterns\n"
+            "- Full skill: skills/async-patterns/SKILL.md"
+        )
+
+    def test_fields_are_dropped_to_fit_context_limit(self, skills_dir):
+        skill = read_skill(skills_dir / "tiny-skill" / "SKILL.md")
+
+        block = entry_point_block(skill, estimate_tokens)
+
+        assert estimate_tokens(block) <= 40
+        assert "Quick start" not in block
+        assert block.startswith("### tiny-skill\n")
+        assert block.endswith("- Full skill: skills/tiny-skill/SKILL.md")
+
+    def test_summary_is_shortened_last(self, skills_dir):
+        skill = read_skill(skills_dir / "async-patterns" / "SKILL.md")
+
+        block = entry_point_block(skill, estimate_tokens, limit=32)
+
+        assert "When to use" not in block
+        assert "- Summary: Summary of" in block and block.count("…") == 1
+        assert estimate_tokens(block) <= 32
+
+
+class TestBundleSkills:
+    """Tests for building an agent's skill section and loading bodies."""
+
+    def test_bundle_includes_local_skills_only(self, skills_dir):
+        bundle = bundle_skills(
+            ["async-patterns", "external-skill", "async-patterns"],
+            SkillLoader(skills_dir).index(),
+            estimate_tokens,
+        )
+
+        assert bundle.included == ["async-patterns"]
+        assert bundle.missing == ["external-skill"]
+        assert bundle.text.startswith("## Available Skills\n\n")
+        assert "Full body" not in bundle.text
+
+    def test_no_local_skills_gives_empty_text(self, skills_dir):
+        index = SkillLoader(skills_dir).index()
+
+        assert bundle_skills(["external-skill"], index, estimate_tokens).text == ""
+
+    def test_body_loader_reads_full_body_once(self, skills_dir):
+        loader = SkillBodyLoader(skills_dir)
+
+        assert loader.load("tiny-skill") == "# tiny-skill\n\nFull body of tiny-skill."
+        (skills_dir / "tiny-skill" / "SKILL.md").unlink()
+        assert loader.load("tiny-skill").startswith("# tiny-skill")
+        with pytest.raises(KeyError):
+            loader.load("external-skill")
+
+
+def test_repository_skills_fit_their_context_limit(project_root):
+    """Every entry point in skills/ fits its declared context_limit untrimmed."""
+    for path in sorted((project_root / "skills").glob("*/SKILL.md")):
+        skill = read_skill(path)
+        block = entry_point_block(skill, estimate_tokens)
+
+        assert skill.entry_point.summary, path
+        assert f"- Quick start: {skill.entry_point.quick_start}" in block, path
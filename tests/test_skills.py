@@ -0,0 +1,97 @@
+"""Tests for the local skills loader and index."""
+
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents.skills import SkillIndex, SkillLoader
+
+SKILL = """---
+name: {name}
+version: 1.0.0
+category: {category}
+tags:
+{tags}
+---
+
+# {name}
+
+Body of {name}.
+"""
+
+
+@pytest.fixture
+def skills_dir(tmp_path: Path) -> Path:
+    """Create a skills directory with three skills and one broken file."""
+    skills = {
+        "python-async": ("toolchain", ["python", "async"]),
+        "python-testing": ("toolchain", ["Python", "testing"]),
+        "code-review": ("universal", ["review"]),
+    }
+    for name, (category, tags) in skills.items():
+        (tmp_path / name).mkdir()
+        text = SKILL.format(name=name, category=category, tags="\n".join(f"  - {t}" for t in tags))
+        (tmp_path / name / "SKILL.md").write_text(text)
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "SKILL.md").write_text("No frontmatter\n")
+    return tmp_path
+
+
+class TestSkillLoader:
+    """Tests for SkillLoader."""
+
+    def test_loads_frontmatter_and_records_errors(self, skills_dir):
+        loader = SkillLoader(skills_dir)
+        index = loader.index()
+
+        assert sorted(index.names()) == ["code-review", "python-async", "python-testing"]
+        assert list(loader.errors) == [skills_dir / "broken" / "SKILL.md"]
+        assert loader.index() is index
+
+    def test_bodies_load_lazily_once(self, skills_dir):
+        skill = SkillLoader(skills_dir).index().get("python-async")
+
+        assert not skill.body_loaded
+        assert skill.load_body() == "# python-async\n\nBody of python-async."
+        (skills_dir / "python-async" / "SKILL.md").unlink()
+        assert skill.load_body().startswith("# python-async")
+
+    def test_missing_directory_gives_empty_index(self, tmp_path):
+        assert len(SkillLoader(tmp_path / "missing").index()) == 0
+
+
+class TestSkillIndex:
+    """Tests for SkillIndex lookups."""
+
+    @pytest.fixture
+    def index(self, skills_dir) -> SkillIndex:
+        return SkillLoader(skills_dir).index()
+
+    def test_tag_and_category_lookups(self, index):
+        assert [s.name for s in index.with_tag("PYTHON")] == ["python-async", "python-testing"]
+        assert [s.name for s in index.in_category("universal")] == ["code-review"]
+        assert [s.name for s in index.find(tags=["python", "testing"])] == ["python-testing"]
+        assert [s.name for s in index.find(category="toolchain", tags=["async"])] == [
+            "python-async"
+        ]
+        assert index.find(tags=["rust"]) == []
+
+    def test_body_and_invalid_names(self, index):
+        assert index.body("code-review").endswith("Body of code-review.")
+        with pytest.raises(KeyError):
+            index.body("missing")
+        assert index.describe_invalid("python-asyncio") == (
+            "python-asyncio (closest: python-async in toolchain)"
+        )
+        assert index.describe_invalid("zzz") == "zzz"
+
+
+def test_repository_skills_load(project_root):
+    """Every skill in skills/ loads with a name, category and tags."""
+    loader = SkillLoader(project_root / "skills")
+    index = loader.index()
+
+    assert not loader.errors
+    assert len(index) == len(loader.skill_files())
+    for skill in index.skills.values():
+        assert skill.name and skill.category and skill.tags
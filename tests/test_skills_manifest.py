@@ -0,0 +1,105 @@
+"""Tests for the shared skills manifest index."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents import skills_manifest
+from claude_mpm_agents.skills_manifest import build_skill_index, load_skill_manifest
+
+MANIFEST = {
+    "skills": {
+        "universal": [{"name": "git-workflow", "category": "collaboration"}],
+        "toolchains": {
+            "python": [{"name": "python-async-patterns"}, {"name": "pytest"}],
+            "rust": [{"name": "rust-error-handling"}],
+        },
+        "examples": [{"name": "example-skill"}],
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_loaded_indexes():
+    """Isolate tests from the in-process index cache."""
+    skills_manifest._loaded.clear()
+    yield
+    skills_manifest._loaded.clear()
+
+
+@pytest.fixture
+def manifest_path(tmp_path: Path) -> Path:
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(MANIFEST))
+    return path
+
+
+class TestBuildSkillIndex:
+    """Tests for flattening manifest layouts."""
+
+    def test_indexes_every_section_with_toolchain(self):
+        index = build_skill_index(MANIFEST)
+
+        assert index.names() == {
+            "git-workflow",
+            "python-async-patterns",
+            "pytest",
+            "rust-error-handling",
+            "example-skill",
+        }
+        assert index.toolchain_of("pytest") == "python"
+        assert index.toolchain_of("git-workflow") == "universal"
+        assert index.get("git-workflow").metadata["category"] == "collaboration"
+
+    def test_flat_layout_and_string_entries(self):
+        index = build_skill_index({"universal": ["tdd"], "toolchains": {"go": ["go-testing"]}})
+
+        assert "tdd" in index
+        assert index.toolchain_of("go-testing") == "go"
+
+    def test_closest_reports_toolchain(self):
+        index = build_skill_index(MANIFEST)
+
+        assert index.closest("python-async-pattern").name == "python-async-patterns"
+        assert index.closest("rust-unsafe").name == "rust-error-handling"
+        assert index.closest("zzz") is None
+        # A toolchain name alone is not enough; the skill names must be similar
+        assert index.closest("python-qqqqqqqqq") is None
+        assert index.describe_invalid("pytests") == "pytests (closest: pytest in python)"
+
+
+class TestLoadSkillManifest:
+    """Tests for the in-process and on-disk index caches."""
+
+    def test_reuses_index_while_manifest_unchanged(self, manifest_path, tmp_path):
+        first = load_skill_manifest(manifest_path, cache_dir=tmp_path / "cache")
+        assert load_skill_manifest(manifest_path, cache_dir=tmp_path / "cache") is first
+
+    def test_reads_disk_cache_in_new_process(self, manifest_path, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        load_skill_manifest(manifest_path, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("skills-index-*.json"))) == 1
+
+        skills_manifest._loaded.clear()
+        monkeypatch.setattr(skills_manifest, "build_skill_index", pytest.fail, raising=True)
+        index = load_skill_manifest(manifest_path, cache_dir=cache_dir)
+
+        assert index.toolchain_of("rust-error-handling") == "rust"
+
+    def test_manifest_change_invalidates_caches(self, manifest_path, tmp_path):
+        cache_dir = tmp_path / "cache"
+        load_skill_manifest(manifest_path, cache_dir=cache_dir)
+
+        manifest = json.loads(manifest_path.read_text())
+        manifest["skills"]["universal"].append({"name": "code-review"})
+        manifest_path.write_text(json.dumps(manifest))
+        stat = manifest_path.stat()
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert "code-review" in load_skill_manifest(manifest_path, cache_dir=cache_dir)
+
+    def test_missing_manifest_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_skill_manifest(tmp_path / "missing.json", cache_dir=tmp_path)
@@ -0,0 +1,112 @@
+"""Tests for streaming compliance checks."""
+
+import pytest
+
+from claude_mpm_agents.instruction_extractor import ExtractedRule
+from claude_mpm_agents.metrics.instruction_compliance import InstructionComplianceMetric
+from claude_mpm_agents.metrics.patterns import PatternSet, PatternStream, prefix_stable
+from claude_mpm_agents.metrics.role_boundary import RoleBoundaryMetric
+from claude_mpm_agents.metrics.streaming import (
+    InstructionComplianceStream,
+    RoleBoundaryStream,
+    Violation,
+)
+
+QA_OUTPUT = "Verified the fix with pytest. Next I will merge pull request #12 and tag it."
+
+
+def chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_forbidden_phrase_fires_before_response_ends():
+    """Test that a qa agent merging a pull request is caught mid-stream."""
+    metric = RoleBoundaryMetric(agent_type="qa")
+    checker = RoleBoundaryStream(metric)
+    start = QA_OUTPUT.index("merge")
+
+    fired_at = None
+    for n, chunk in enumerate(chunks(QA_OUTPUT, 5)):
+        if checker.feed(chunk):
+            fired_at = n
+            break
+
+    assert fired_at is not None
+    assert (fired_at + 1) * 5 < len(QA_OUTPUT)
+    assert checker.violations == [
+        Violation(
+            "crossed_role_boundary:(merge pull request|git push|release)",
+            "Crossed role boundary: (merge pull request|git push|release)",
+            start,
+            start + len("merge pull request"),
+        )
+    ]
+
+
+def test_finish_matches_full_output_score():
+    """Test that finish scores the whole output like the metric does."""
+    metric = RoleBoundaryMetric(agent_type="qa")
+    checker = RoleBoundaryStream(metric)
+    for chunk in chunks(QA_OUTPUT, 7):
+        checker.feed(chunk)
+
+    assert checker.finish() == metric.evaluate(QA_OUTPUT)
+    assert checker.violated
+
+
+def test_in_role_output_fires_nothing():
+    """Test that allowed activities never fire a violation."""
+    checker = RoleBoundaryStream(RoleBoundaryMetric(agent_type="qa"))
+
+    for chunk in chunks("Reproduce the bug, then write a test case.", 4):
+        assert checker.feed(chunk) == []
+    assert checker.finish().success
+
+
+def test_negative_rule_patterns_fire_early():
+    """Test that instruction rules fail as soon as a negative pattern matches."""
+    rules = [
+        ExtractedRule(
+            rule_id="qa_ci_safe_tests",
+            category="qa",
+            description="Test commands must be CI-safe",
+            positive_patterns=[r"(pytest|npm test|cargo test)"],
+            negative_patterns=[r"(git rebase -i|git add -i)"],
+        ),
+        ExtractedRule(
+            rule_id="no_wip_commits",
+            category="git_workflow",
+            description="No WIP commits",
+            negative_patterns=[r"^(wip|tmp)"],
+        ),
+    ]
+    metric = InstructionComplianceMetric(rules=rules)
+    checker = InstructionComplianceStream(metric, regex_interval=1)
+    output = "Ran pytest.\nWIP: cleanup\nthen git add -i to stage hunks"
+
+    fired = [v.code for chunk in chunks(output, 3) for v in checker.feed(chunk)]
+
+    assert fired == ["no_wip_commits", "qa_ci_safe_tests"]
+    assert checker.finish() == metric.evaluate(output)
+
+
+def test_pattern_stream_settles_end_anchored_patterns_at_finish():
+    """Test that patterns that depend on the end of input wait for finish."""
+    patterns = PatternSet([r"done$", r"(merge|push)"])
+    stream = PatternStream(patterns, regex_interval=1)
+
+    assert stream.feed("mer") == {}
+    assert stream.feed("ge done") == {1: (0, 5)}
+    assert stream.finish() == {0: (6, 10)}
+    assert set(stream.matched) == set(patterns.scan(stream.text))
+    with pytest.raises(ValueError):
+        stream.feed("more")
+
+
+def test_prefix_stable():
+    """Test which regex patterns may fire on a partial output."""
+    assert prefix_stable(r"^(update|wip)")
+    assert prefix_stable(r"expected.*:")
+    assert not prefix_stable(r"\bany\b.*type")
+    assert not prefix_stable(r"done$")
+    assert not prefix_stable(r"foo(?!bar)")
@@ -0,0 +1,139 @@
+"""Tests for manifest-driven agent sync."""
+
+import tarfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from claude_mpm_agents.build_manifest import MANIFEST_FILENAME, write_manifest
+from claude_mpm_agents.sync import (
+    DirectorySource,
+    HttpSource,
+    SyncError,
+    TarballSource,
+    hash_tree,
+    load_sync_state,
+    open_source,
+    plan_sync,
+    sync,
+)
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    """Create a source tree with a MANIFEST.json."""
+    root = tmp_path / "source"
+    (root / "engineer").mkdir(parents=True)
+    (root / "engineer" / "python-engineer.md").write_text("# Python\n")
+    (root / "engineer" / "rust-engineer.md").write_text("# Rust\n")
+    (root / "qa.md").write_text("# QA\n")
+    write_manifest(root / MANIFEST_FILENAME, hash_tree(root), "1.3.0")
+    return root
+
+
+class TestSync:
+    """Tests for planning and running syncs from local sources."""
+
+    def test_first_sync_fetches_everything(self, source_dir, tmp_path):
+        dest = tmp_path / "dest"
+        result = sync(DirectorySource(source_dir), dest)
+
+        assert result.ok
+        assert result.fetched == [
+            "engineer/python-engineer.md",
+            "engineer/rust-engineer.md",
+            "qa.md",
+        ]
+        assert (dest / "qa.md").read_text() == "# QA\n"
+        assert set(load_sync_state(dest)) == set(result.fetched)
+
+    def test_second_sync_fetches_only_changes(self, source_dir, tmp_path):
+        dest = tmp_path / "dest"
+        sync(DirectorySource(source_dir), dest)
+        untouched = (dest / "qa.md").stat().st_mtime_ns
+
+        (source_dir / "engineer" / "rust-engineer.md").write_text("# Rust v2\n")
+        write_manifest(source_dir / MANIFEST_FILENAME, hash_tree(source_dir), "1.3.0")
+        result = sync(DirectorySource(source_dir), dest)
+
+        assert result.fetched == ["engineer/rust-engineer.md"]
+        assert (dest / "engineer" / "rust-engineer.md").read_text() == "# Rust v2\n"
+        assert (dest / "qa.md").stat().st_mtime_ns == untouched
+
+    def test_existing_identical_files_are_not_fetched(self, source_dir, tmp_path):
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "qa.md").write_text("# QA\n")
+
+        plan = plan_sync(DirectorySource(source_dir).manifest(), dest)
+
+        assert plan.unchanged == ["qa.md"]
+        assert len(plan.fetch) == 2
+
+    def test_delete_removes_only_previously_synced_files(self, source_dir, tmp_path):
+        dest = tmp_path / "dest"
+        sync(DirectorySource(source_dir), dest)
+        (dest / "local-notes.md").write_text("mine")
+
+        (source_dir / "qa.md").unlink()
+        write_manifest(source_dir / MANIFEST_FILENAME, hash_tree(source_dir), "1.3.0")
+        result = sync(DirectorySource(source_dir), dest, delete=True)
+
+        assert result.deleted == ["qa.md"]
+        assert not (dest / "qa.md").exists()
+        assert (dest / "local-notes.md").exists()
+
+    def test_digest_mismatch_is_reported_and_not_recorded(self, source_dir, tmp_path):
+        dest = tmp_path / "dest"
+        (source_dir / "qa.md").write_text("# Tampered\n")
+
+        result = sync(DirectorySource(source_dir), dest)
+
+        assert result.errors == {"qa.md": "Digest mismatch for qa.md"}
+        assert not (dest / "qa.md").exists()
+        assert "qa.md" not in load_sync_state(dest)
+
+    def test_paths_outside_destination_are_rejected(self, tmp_path):
+        with pytest.raises(SyncError):
+            plan_sync({"../escape.md": {"sha256": "0", "size": 1}}, tmp_path / "dest")
+
+    def test_tarball_without_manifest(self, source_dir, tmp_path):
+        archive = tmp_path / "agents.tar.gz"
+        (source_dir / MANIFEST_FILENAME).unlink()
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(source_dir, arcname="agents")
+
+        result = sync(TarballSource(archive, prefix="agents"), tmp_path / "dest")
+
+        assert result.fetched == [
+            "engineer/python-engineer.md",
+            "engineer/rust-engineer.md",
+            "qa.md",
+        ]
+        assert isinstance(open_source(archive), TarballSource)
+
+
+class TestHttpSource:
+    """Tests for syncing from a base URL."""
+
+    def test_sync_over_http(self, source_dir, tmp_path):
+        handler = partial(SimpleHTTPRequestHandler, directory=str(source_dir))
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            source = open_source(f"http://127.0.0.1:{server.server_port}/")
+            assert isinstance(source, HttpSource)
+
+            dest = tmp_path / "dest"
+            first = sync(source, dest, max_workers=4)
+            second = sync(source, dest, max_workers=4)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(first.fetched) == 3
+        assert second.fetched == []
+        assert (dest / "engineer" / "python-engineer.md").read_text() == "# Python\n"
@@ -0,0 +1,67 @@
+"""Tests for token estimation and prompt budgets."""
+
+import pytest
+
+from claude_mpm_agents.tokens import (
+    DEFAULT_TOKEN_BUDGET,
+    AgentTokenUsage,
+    agent_budget,
+    build_token_report,
+    estimate_tokens,
+    format_token_report,
+    get_token_counter,
+)
+
+
+class TestEstimateTokens:
+    """Tests for the offline heuristic counter."""
+
+    def test_counts_words_numbers_and_punctuation(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("run the tests") == 3
+        assert estimate_tokens("internationalization") == 4
+        assert estimate_tokens("1234567") == 3
+        assert estimate_tokens("**Bold**\n\n---") == 6
+
+    def test_grows_roughly_with_text_size(self):
+        text = "Always verify changes with tests before committing.\n"
+        assert estimate_tokens(text * 100) == 100 * estimate_tokens(text)
+
+    def test_non_ascii_costs_tokens(self):
+        assert estimate_tokens("✅") >= 1
+
+    def test_unknown_tokenizer_rejected(self):
+        with pytest.raises(ValueError):
+            get_token_counter("nope")
+
+
+class TestBudgets:
+    """Tests for per-agent budgets and the report."""
+
+    def test_budget_sources(self):
+        assert agent_budget({"context_limit": 5000, "max_tokens": 4096}) == (5000, "context_limit")
+        assert agent_budget({"max_tokens": 4096}, budget_ratio=2) == (8192, "max_tokens")
+        assert agent_budget({}) == (DEFAULT_TOKEN_BUDGET, "default")
+
+    def test_report_sorts_agents_and_aggregates_sections(self):
+        base = {"label": "BASE-AGENT.md", "tokens": 300}
+        usages = [
+            AgentTokenUsage(
+                "a.md", "a", 500, 1000, "max_tokens", [base, {"label": "a.md", "tokens": 200}]
+            ),
+            AgentTokenUsage(
+                "b.md", "b", 900, 800, "context_limit", [base, {"label": "b.md", "tokens": 600}]
+            ),
+        ]
+
+        report = build_token_report(usages, "heuristic")
+
+        assert [agent["path"] for agent in report["agents"]] == ["b.md", "a.md"]
+        assert report["over_budget"] == ["b.md"]
+        assert report["sections"][0] == {
+            "label": "BASE-AGENT.md",
+            "tokens": 300,
+            "agents": 2,
+            "total_tokens": 600,
+        }
+        assert "❌" in format_token_report(report)
@@ -0,0 +1,96 @@
+"""Tests for offline transcript scoring."""
+
+import io
+import json
+from pathlib import Path
+
+from claude_mpm_agents.metrics.transcripts import (
+    ScoreReport,
+    Transcript,
+    TranscriptScorer,
+    read_transcripts,
+    score_file,
+    score_transcripts,
+)
+
+OUT_OF_ROLE = "## Release\n\nDeployed with kubectl apply after the tests passed."
+IN_ROLE = "## Plan\n\nImplement the service class and add a unit test."
+
+
+def make_log(lines: list) -> io.StringIO:
+    return io.StringIO(
+        "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines)
+    )
+
+
+def test_read_transcripts_skips_malformed_lines():
+    """Test that bad lines are counted and valid ones streamed."""
+    report = ScoreReport()
+    log = make_log(
+        [
+            {"agent_type": "qa", "task": "t", "output": "x"},
+            "not json",
+            "",
+            {"task": "no agent type"},
+            {"agent_type": "ops"},
+        ]
+    )
+
+    transcripts = list(read_transcripts(log, report))
+
+    assert transcripts == [Transcript("qa", "x"), Transcript("ops", "")]
+    assert report.malformed == 2
+    assert report.malformed_lines == [2, 4]
+
+
+def test_scorer_uses_category_rules(project_root: Path):
+    """Test that each agent type gets root plus category rules."""
+    scorer = TranscriptScorer(project_root)
+
+    rule_ids = {rule.rule_id for rule in scorer.metrics("qa")["instruction_compliance"].rules}
+
+    assert "git_conventional_commits" in rule_ids
+    assert "qa_ci_safe_tests" in rule_ids
+    assert scorer.metrics("qa") is scorer.metrics("qa")
+
+
+def test_report_aggregates_per_agent(project_root: Path):
+    """Test per-agent pass rates and violation counts."""
+    transcripts = [
+        Transcript("engineer", OUT_OF_ROLE),
+        Transcript("engineer", IN_ROLE),
+        Transcript("qa", ""),
+        Transcript("designer", IN_ROLE),
+        Transcript("designer", OUT_OF_ROLE),
+    ]
+
+    report = score_transcripts(transcripts, project_root, chunk_size=2)
+
+    assert report.cases == 3
+    assert "designer" not in report.agents
+    assert report.skipped == {"designer": 2}
+    role = report.agents["engineer"].metrics["role_boundary"]
+    assert role.cases == 2
+    assert role.passed == 1
+    assert role.violations == {
+        "crossed_role_boundary:(deploy to production|kubectl apply|docker push)": 1
+    }
+    assert report.agents["qa"].metrics["handoff_compliance"].violations == {"empty_output": 1}
+    assert report.failing(0.9)[0][:2] == ("engineer", "instruction_compliance")
+
+
+def test_parallel_scoring_matches_serial(project_root: Path):
+    """Test that worker processes produce the same report."""
+    lines = [
+        {"agent_type": agent, "task": "t", "output": output}
+        for agent in ("engineer", "ops", "qa")
+        for output in (IN_ROLE, OUT_OF_ROLE)
+    ] * 4
+    lines.append({"agent_type": "designer", "output": IN_ROLE})
+
+    serial = score_file(make_log(lines + ["{"]), project_root, jobs=1)
+    parallel = score_file(make_log(lines + ["{"]), project_root, jobs=2, chunk_size=3)
+
+    assert parallel.to_dict() == serial.to_dict()
+    assert serial.to_dict()["malformed"] == 1
+    assert serial.to_dict()["skipped"] == {"designer": 1}
@@ -0,0 +1,60 @@
+"""Tests for the shared frontmatter YAML parsing entry point."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from claude_mpm_agents import yaml_loader
+from claude_mpm_agents.frontmatter import read_frontmatter
+from claude_mpm_agents.yaml_loader import (
+    clear_frontmatter_cache,
+    frontmatter_cache_info,
+    load_yaml,
+    parse_frontmatter,
+)
+
+
+@pytest.mark.registry
+class TestFrontmatterParsing:
+    """Test LibYAML parsing and the frontmatter LRU cache."""
+
+    def test_matches_pure_python_loader(self, agents_dir: Path):
+        """The fast loader parses every agent exactly like yaml.safe_load."""
+        for path in agents_dir.rglob("*.md"):
+            block = read_frontmatter(path)
+            if block is not None:
+                assert load_yaml(block.text) == yaml.safe_load(block.text), path
+
+    def test_repeated_text_hits_cache(self):
+        """Parsing identical frontmatter twice is served from the cache."""
+        clear_frontmatter_cache()
+        parse_frontmatter("name: cached\ntags: [a, b]\n")
+        parse_frontmatter("name: cached\ntags: [a, b]\n")
+
+        info = frontmatter_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_results_are_independent_copies(self):
+        """Mutating a parsed result does not affect later cache hits."""
+        clear_frontmatter_cache()
+        first = parse_frontmatter("tags: [a]\n")
+        first["tags"].append("mutated")
+
+        assert parse_frontmatter("tags: [a]\n") == {"tags": ["a"]}
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """The least recently used entry is evicted beyond maxsize."""
+        monkeypatch.setattr(yaml_loader._cache, "maxsize", 2)
+        clear_frontmatter_cache()
+        for name in ("a", "b", "c"):
+            parse_frontmatter(f"name: {name}\n")
+
+        assert frontmatter_cache_info().currsize == 2
+        parse_frontmatter("name: a\n")
+        assert frontmatter_cache_info().misses == 4
+
+    def test_invalid_yaml_raises(self):
+        """Invalid YAML raises yaml.YAMLError like yaml.safe_load."""
+        with pytest.raises(yaml.YAMLError):
+            parse_frontmatter("name: [unclosed\n")
@@ -108,7 +108,7 @@ def main():
         check_directory_exists(project_root / "tests/fixtures", "Fixtures directory")
     )
     checks_passed.append(
-        check_directory_exists(project_root / "tests/metrics", "Metrics directory")
+        check_directory_exists(project_root / "claude_mpm_agents/metrics", "Metrics directory")
     )
     checks_passed.append(
         check_directory_exists(project_root / "tests/examples", "Examples directory")
@@ -134,13 +134,17 @@ def main():
     print("-" * 70)
     fixture_files = [
         ("agent_loader.py", "Agent loader"),
-        ("instruction_extractor.py", "Instruction extractor"),
         ("mock_responses.py", "Mock response generator"),
     ]
     for filename, description in fixture_files:
         checks_passed.append(
             check_file_exists(project_root / "tests/fixtures" / filename, description)
         )
+    checks_passed.append(
+        check_file_exists(
+            project_root / "claude_mpm_agents/instruction_extractor.py", "Instruction extractor"
+        )
+    )
     print()
 
     # Check metric files
@@ -152,7 +156,7 @@ def main():
     ]
     for filename, description in metric_files:
         checks_passed.append(
-            check_file_exists(project_root / "tests/metrics" / filename, description)
+            check_file_exists(project_root / "claude_mpm_agents/metrics" / filename, description)
         )
     print()
 